@@ -1,18 +1,125 @@
 #!/usr/bin/env python3
 # PYTHON_ARGCOMPLETE_OK
 
-import difflib
 import sys
 import os
 import subprocess
 import argparse
+import hashlib
+import heapq
+import io
+import json
+import marshal
+import math
+import re
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 try:
     import argcomplete
 except ImportError:
     argcomplete = None
 
+# -----------------------------------------------------------------------------
+# Tracing (--trace, --trace-summary). Stdlib only, usable before bootstrap.
+# -----------------------------------------------------------------------------
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.events.append((self.name, self.start, time.perf_counter() - self.start, threading.get_ident(), self.args))
+        return False
+
+
+class Tracer:
+    """Collects nested timing spans from any thread.
+
+    Disabled (the default), span() returns one shared no-op context manager,
+    so instrumented code only pays for a call and an attribute check.
+    Spans nest by time on each thread, which is what the Chrome trace viewer
+    (chrome://tracing, ui.perfetto.dev) expects from complete ('X') events.
+    """
+
+    _NO_SPAN = nullcontext()
+
+    def __init__(self):
+        self.enabled = False
+        self.events: List[Tuple[str, float, float, int, dict]] = []  # (name, start, duration, thread, args)
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._origin = time.perf_counter()
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return self._NO_SPAN
+        return _Span(self, name, args)
+
+    def write_chrome_trace(self, path: Path) -> None:
+        pid = os.getpid()
+        main = threading.main_thread().ident
+        threads = {}
+        events = []
+        for name, start, duration, tid, args in self.events:
+            threads.setdefault(tid, "main" if tid == main else f"worker-{len(threads)}")
+            event = {"name": name, "ph": "X", "pid": pid, "tid": tid,
+                     "ts": round((start - self._origin) * 1e6, 1), "dur": round(duration * 1e6, 1)}
+            if args:
+                event["args"] = {k: v if isinstance(v, (int, float, bool)) else str(v) for k, v in args.items()}
+            events.append(event)
+        for tid, label in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": label}})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+    def self_times(self) -> List[float]:
+        """Duration of each event minus the time spent in spans nested directly inside it."""
+        own = [duration for _, _, duration, _, _ in self.events]
+        by_thread: Dict[int, List[int]] = {}
+        for i, (_, _, _, tid, _) in enumerate(self.events):
+            by_thread.setdefault(tid, []).append(i)
+        for indices in by_thread.values():
+            indices.sort(key=lambda i: (self.events[i][1], -self.events[i][2]))
+            stack: List[int] = []
+            for i in indices:
+                start = self.events[i][1]
+                while stack and self.events[stack[-1]][1] + self.events[stack[-1]][2] <= start:
+                    stack.pop()
+                if stack:
+                    own[stack[-1]] -= self.events[i][2]
+                stack.append(i)
+        return own
+
+    def print_summary(self, top: int = 15, out=None) -> None:
+        out = out or sys.stderr
+        own = self.self_times()
+        ranked = sorted(range(len(self.events)), key=lambda i: self.events[i][2], reverse=True)[:top]
+        print(f"\n🔎 Slowest spans (top {len(ranked)} of {len(self.events)}, self time in brackets):", file=out)
+        for i in ranked:
+            name, _, duration, _, args = self.events[i]
+            detail = f"  {args}" if args else ""
+            print(f"  {duration * 1000:9.2f} ms  [{own[i] * 1000:8.2f} ms]  {name}{detail}", file=out)
+
+
+TRACER = Tracer()
+
+
 # -----------------------------------------------------------------------------
 # Self-Bootstrapping Logic. Self-contained
 # -----------------------------------------------------------------------------
@@ -35,31 +142,421 @@ BOOTSTRAP_MODULES = {
     "cores/instruction_core": "https://github.com/AI-Driven-Highspeed-Development/instruction_core.git",
 }
 
-def _clone_and_install(path: Path, repo_url: str) -> None:
-    """Helper to clone a repo and install its requirements."""
-    print(f"  - Cloning {path}...")
+# Number of concurrent clones during bootstrap (override with ADHD_BOOTSTRAP_JOBS)
+BOOTSTRAP_JOBS = 8
+
+# Framework-owned state and caches (conventional project/data/<name> location)
+FRAMEWORK_DATA_DIR = Path("project") / "data" / "adhd_framework"
+REQUIREMENTS_FINGERPRINT_FILE = FRAMEWORK_DATA_DIR / "requirements.fingerprint"
+
+
+# How modules are cloned (override with --clone-strategy or ADHD_CLONE_STRATEGY):
+#   full      - plain `git clone`, complete history
+#   shallow   - `--depth 1`, latest commit only
+#   blobless  - `--filter=blob:none`, full history, file contents fetched on demand
+#   reference - borrow objects from a shared mirror cache (see CLONE_CACHE_DIR)
+CLONE_STRATEGIES = ("full", "shallow", "blobless", "reference")
+DEFAULT_CLONE_STRATEGY = "full"
+
+# Per-user caches shared by every project on the machine (override with ADHD_CACHE_DIR)
+CACHE_DIR = Path(os.environ.get("ADHD_CACHE_DIR") or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "adhd_framework")
+
+# Shared bare mirrors for the 'reference' strategy, one per repo URL
+CLONE_CACHE_DIR = CACHE_DIR / "git"
+
+
+class CloneResult(NamedTuple):
+    """Outcome of bootstrapping a single module."""
+    path: Path
+    repo_url: str
+    ok: bool
+    error: str = ""
+    seconds: float = 0.0
+    bytes: int = 0
+    strategy: str = DEFAULT_CLONE_STRATEGY
+
+
+def _staging_path(path: Path) -> Path:
+    """Return the hidden sibling directory a module is cloned into before being moved into place."""
+    return path.parent / f".{path.name}.partial"
+
+
+def _dir_size(path: Path) -> int:
+    """Total size in bytes of the regular files under path."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def format_bytes(n: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def _transport_url(repo_url: str) -> str:
+    """Use file:// for local repos so they are fetched like remote ones.
+
+    Plain paths take git's hardlinking local-clone shortcut, which ignores
+    --depth, --filter and --reference.
+    """
+    if "://" not in repo_url and os.path.isdir(repo_url):
+        return Path(repo_url).resolve().as_uri()
+    return repo_url
+
+
+def _clone_cache_path(repo_url: str) -> Path:
+    """Location of the shared bare mirror for a repo URL."""
+    return CLONE_CACHE_DIR / _mirror_repo_name(repo_url)
+
+
+_mirror_locks: Dict[Path, threading.Lock] = {}
+
+
+def _update_mirror(repo_url: str) -> Tuple[Path, int]:
+    """Create or fetch the shared mirror for repo_url. Returns (mirror path, bytes it grew by)."""
+    mirror = _clone_cache_path(repo_url)
+    lock = _mirror_locks.setdefault(mirror, threading.Lock())
+    with lock, TRACER.span(f"update mirror {mirror.name}"):
+        before = _dir_size(mirror) if mirror.exists() else 0
+        if mirror.exists():
+            # No --prune: clones may still borrow objects only the old refs reach
+            cmd = ["git", "-C", str(mirror), "fetch", "--quiet", "origin", "+refs/*:refs/*"]
+        else:
+            mirror.parent.mkdir(parents=True, exist_ok=True)
+            cmd = ["git", "clone", "--quiet", "--mirror", _transport_url(repo_url), str(mirror)]
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True, text=True)
+        return mirror, _dir_size(mirror) - before
+
+
+def _clone_module(path: Path, repo_url: str, strategy: str = DEFAULT_CLONE_STRATEGY) -> CloneResult:
+    """Clone a repo into its staging directory. Never raises; failures are returned.
+
+    bytes is what the clone stored in its own .git plus, for 'reference',
+    what the shared mirror had to fetch first.
+    """
+    staging = _staging_path(path)
+    start = time.perf_counter()
+    fetched = 0
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        subprocess.check_call(
-            ["git", "clone", repo_url, str(path)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        print(f"    ✅ Cloned {path}")
+        if staging.exists():
+            shutil.rmtree(staging)
+        cmd = ["git", "clone"]
+        if strategy == "shallow":
+            cmd += ["--depth", "1"]
+        elif strategy == "blobless":
+            cmd += ["--filter=blob:none"]
+        elif strategy == "reference":
+            mirror, fetched = _update_mirror(repo_url)
+            cmd += ["--reference", str(mirror)]
+        with TRACER.span(f"git clone {path}", strategy=strategy):
+            subprocess.run(
+                cmd + [_transport_url(repo_url), str(staging)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+                text=True,
+            )
+        size = _dir_size(staging / ".git") + max(fetched, 0)
+        return CloneResult(path, repo_url, True, seconds=time.perf_counter() - start, bytes=size, strategy=strategy)
+    except subprocess.CalledProcessError as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        fatal = [line for line in (e.stderr or "").splitlines() if line.startswith("fatal:")]
+        error = fatal[0] if fatal else f"git clone exited with {e.returncode}"
+        return CloneResult(path, repo_url, False, error, time.perf_counter() - start, strategy=strategy)
+    except Exception as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        return CloneResult(path, repo_url, False, str(e), time.perf_counter() - start, strategy=strategy)
 
-        # Install requirements immediately
-        req_file = path / "requirements.txt"
-        if req_file.exists():
+
+def resolve_clone_strategy(strategy: Optional[str] = None) -> str:
+    """Pick the clone strategy: explicit value, then ADHD_CLONE_STRATEGY, then the default."""
+    strategy = strategy or os.environ.get("ADHD_CLONE_STRATEGY") or DEFAULT_CLONE_STRATEGY
+    if strategy not in CLONE_STRATEGIES:
+        raise ValueError(f"Unknown clone strategy '{strategy}' (choose from: {', '.join(CLONE_STRATEGIES)})")
+    return strategy
+
+
+def clone_missing_modules(modules: Dict[str, str], jobs: Optional[int] = None,
+                          strategy: Optional[str] = None) -> List[CloneResult]:
+    """Clone the given {path: repo_url} modules using a bounded worker pool.
+
+    Clones run concurrently into hidden staging directories. They are moved
+    into place as a batch only once every clone succeeded; if any failed, all
+    staging directories are removed, so a failure never leaves a partial
+    module or a half-populated tree behind. Requirements are not installed
+    here; see install_requirement_files(). Results are returned in the order
+    of ``modules``.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    strategy = resolve_clone_strategy(strategy)
+    if jobs is None:
+        jobs = int(os.environ.get("ADHD_BOOTSTRAP_JOBS", BOOTSTRAP_JOBS))
+    jobs = max(1, min(jobs, len(modules) or 1))
+
+    start = time.perf_counter()
+    results: Dict[Path, CloneResult] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_clone_module, Path(p), url, strategy) for p, url in modules.items()]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.path] = result
+            if result.ok:
+                print(f"  - Cloned {result.path} ({result.seconds:.1f}s, {format_bytes(result.bytes)})")
+
+    ordered = [results[Path(p)] for p in modules]
+    if not all(r.ok for r in ordered):
+        for result in ordered:
+            shutil.rmtree(_staging_path(result.path), ignore_errors=True)
+        return ordered
+    for result in ordered:
+        _staging_path(result.path).rename(result.path)
+    if ordered:
+        total = sum(r.bytes for r in ordered)
+        print(f"  {len(ordered)} module(s) cloned ({strategy}): {format_bytes(total)} in {time.perf_counter() - start:.1f}s")
+    return ordered
+
+
+def _report_clone_failures(results: List[CloneResult]) -> bool:
+    """Print a summary of failed bootstraps. Returns True if everything succeeded."""
+    failures = [r for r in results if not r.ok]
+    if not failures:
+        return True
+    print(f"\n❌ Failed to bootstrap {len(failures)} of {len(results)} modules:")
+    for r in failures:
+        print(f"    - {r.path} ({r.repo_url}): {r.error}")
+    return False
+
+# -----------------------------------------------------------------------------
+# Requirements merging. Stdlib only, usable before anything is installed.
+# -----------------------------------------------------------------------------
+
+_REQ_LINE = re.compile(
+    r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[(?P<extras>[^\]]*)\])?\s*(?P<spec>[^;@]*?)\s*(?:;\s*(?P<marker>.+))?$"
+)
+
+
+def canonical_name(name: str) -> str:
+    """Normalize a distribution name (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# Options whose value may be a path relative to the requirements file
+_PATH_OPTIONS = ("-c", "--constraint", "-e", "--editable", "-f", "--find-links")
+_VCS_PREFIXES = ("git+", "hg+", "svn+", "bzr+")
+_RELATIVE_FILE_URL = re.compile(r"\bfile:(?!//)(\S+)")
+
+
+def _absolute_path(value: str, base: Path) -> str:
+    if "://" in value or value.startswith(_VCS_PREFIXES) or os.path.isabs(value):
+        return value
+    return str((base / value).resolve())
+
+
+def absolutize_requirement_line(line: str, base: Path) -> str:
+    """Rewrite relative paths in a requirements line against the directory of the file it came from.
+
+    The merged file is written elsewhere, so '-c', '-e ./pkg', '-f dir',
+    bare './pkg' lines and relative 'file:' URLs would otherwise resolve
+    against the wrong directory.
+    """
+    line = _RELATIVE_FILE_URL.sub(lambda m: (base / m.group(1)).resolve().as_uri(), line)
+    for option in _PATH_OPTIONS:
+        if line.startswith(option + "="):
+            return f"{option}={_absolute_path(line[len(option) + 1:].strip(), base)}"
+        if line.startswith(option + " "):
+            return f"{option} {_absolute_path(line[len(option):].strip(), base)}"
+    if line.startswith(("./", "../")):
+        return _absolute_path(line, base)
+    return line
+
+
+class _ReqEntry:
+    """A single distribution requirement merged from one or more sources."""
+
+    def __init__(self, name: str, marker: str):
+        self.name = name
+        self.marker = marker
+        self.extras: List[str] = []
+        self.specifiers: List[str] = []
+        self.sources: Dict[str, List[str]] = {}
+
+    def add(self, extras: List[str], specifiers: List[str], source: str) -> None:
+        for extra in extras:
+            if extra not in self.extras:
+                self.extras.append(extra)
+        for spec in specifiers:
+            if spec not in self.specifiers:
+                self.specifiers.append(spec)
+        self.sources.setdefault(source, []).extend(specifiers)
+
+    def line(self) -> str:
+        extras = f"[{','.join(self.extras)}]" if self.extras else ""
+        marker = f"; {self.marker}" if self.marker else ""
+        return f"{self.name}{extras}{','.join(self.specifiers)}{marker}"
+
+
+class MergedRequirements:
+    """Merge several requirements files into one deduplicated set.
+
+    Plain ``name[extras]<specifiers>; marker`` lines are merged per canonical
+    name (and marker), combining their specifiers. Anything else (pip options,
+    editable installs, direct URL references) is passed through verbatim, once.
+    The originating file of every requirement is kept for conflict reports.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], _ReqEntry] = {}
+        self._passthrough: Dict[str, List[str]] = {}
+
+    def add_file(self, path: Path, source: Optional[str] = None) -> None:
+        source = source or str(path)
+        for raw in path.read_text(encoding="utf-8").splitlines():
+            line = raw.split(" #", 1)[0].strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith(("-r ", "--requirement ")):
+                nested = line.split(None, 1)[1].strip()
+                self.add_file(path.parent / nested, source)
+                continue
+            self.add_line(absolutize_requirement_line(line, path.parent), source)
+
+    def add_line(self, line: str, source: str) -> None:
+        match = _REQ_LINE.match(line)
+        if line.startswith("-") or "://" in line or not match:
+            self._passthrough.setdefault(line, []).append(source)
+            return
+        name = match.group("name")
+        marker = (match.group("marker") or "").strip()
+        extras = [e.strip() for e in (match.group("extras") or "").split(",") if e.strip()]
+        specifiers = [sp.replace(" ", "") for sp in (match.group("spec") or "").split(",") if sp.strip()]
+        key = (canonical_name(name), marker)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _ReqEntry(name, marker)
+        entry.add(extras, specifiers, source)
+
+    def entries(self) -> List[_ReqEntry]:
+        return list(self._entries.values())
+
+    def conflicts(self) -> List[str]:
+        """Return human readable descriptions of requirements that cannot all be satisfied.
+
+        Different ``==`` pins are always a conflict. When ``packaging`` is
+        importable, each pin is also checked against the other specifiers.
+        """
+        try:
+            from packaging.specifiers import InvalidSpecifier, SpecifierSet
+        except ImportError:
+            SpecifierSet = None
+
+        problems = []
+        for entry in self._entries.values():
+            pins = {sp[2:] for sp in entry.specifiers if sp.startswith("==") and not sp.startswith("===")}
+            clash = len(pins) > 1
+            if not clash and pins and SpecifierSet is not None:
+                try:
+                    clash = not SpecifierSet(",".join(entry.specifiers)).contains(next(iter(pins)), prereleases=True)
+                except InvalidSpecifier:
+                    clash = False
+            if clash:
+                detail = "; ".join(f"{src} wants {','.join(specs) or 'any'}" for src, specs in entry.sources.items())
+                problems.append(f"{entry.name}: {detail}")
+        return problems
+
+    def lines(self) -> List[str]:
+        return list(self._passthrough) + [entry.line() for entry in self._entries.values()]
+
+    def index_lines(self) -> List[str]:
+        """Pip options and named requirements, i.e. everything an index (or wheelhouse) can satisfy."""
+        options = [line for line in self._passthrough if line.startswith("-") and not line.startswith(("-e", "--editable"))]
+        return options + [entry.line() for entry in self._entries.values()]
+
+    def direct_references(self) -> Dict[str, List[str]]:
+        """URL and editable requirements, with the sources that asked for them."""
+        return {line: sources for line, sources in self._passthrough.items()
+                if not line.startswith("-") or line.startswith(("-e", "--editable"))}
+
+    def __len__(self) -> int:
+        return len(self._passthrough) + len(self._entries)
+
+
+def install_requirement_files(req_files: List[Path]) -> None:
+    """Install several requirements files with a single pip resolver run.
+
+    Raises RuntimeError on conflicting requirements (before pip is started)
+    and subprocess.CalledProcessError if pip fails.
+    """
+    merged = MergedRequirements()
+    for req_file in req_files:
+        merged.add_file(req_file)
+
+    conflicts = merged.conflicts()
+    if conflicts:
+        raise RuntimeError("conflicting requirements:\n" + "\n".join(f"      - {c}" for c in conflicts))
+    if not len(merged):
+        return
+
+    fd, merged_path = tempfile.mkstemp(prefix="adhd_requirements_", suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(merged.lines()) + "\n")
+        with TRACER.span("pip install", requirements=len(merged)):
             subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", "-r", str(req_file)],
+                [sys.executable, "-m", "pip", "install", "-r", merged_path],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
-            print(f"    ✅ Installed requirements for {path}")
+    finally:
+        os.unlink(merged_path)
+
+
+def _bootstrap_requirement_files() -> List[Path]:
+    """Root requirements.txt followed by the requirements of every present bootstrap module."""
+    candidates = [Path("requirements.txt")] + [Path(p) / "requirements.txt" for p in BOOTSTRAP_MODULES]
+    return [f for f in candidates if f.exists()]
+
+
+def requirements_fingerprint(req_files: List[Path]) -> str:
+    """Hash the interpreter, its venv and the contents of every requirements file."""
+    digest = hashlib.sha256()
+    digest.update(sys.executable.encode())
+    venv_cfg = Path(sys.prefix) / "pyvenv.cfg"
+    if venv_cfg.exists():
+        digest.update(str(venv_cfg.stat().st_mtime_ns).encode())
+    for req_file in req_files:
+        digest.update(b"\0" + str(req_file).encode() + b"\0")
+        digest.update(req_file.read_bytes())
+    return digest.hexdigest()
+
+
+def _ensure_requirements(force: bool = False) -> None:
+    """Install bootstrap requirements unless their fingerprint matches the last successful install."""
+    req_files = _bootstrap_requirement_files()
+    fingerprint = requirements_fingerprint(req_files)
+    if not force:
+        try:
+            if REQUIREMENTS_FINGERPRINT_FILE.read_text().strip() == fingerprint:
+                return
+        except OSError:
+            pass
+
+    install_requirement_files(req_files)
+    try:
+        REQUIREMENTS_FINGERPRINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        REQUIREMENTS_FINGERPRINT_FILE.write_text(fingerprint + "\n")
+    except OSError as e:
+        print(f"⚠️  Could not record requirements fingerprint: {e}")
 
-    except Exception as e:
-        print(f"    ❌ Error bootstrapping {path}: {e}")
-        sys.exit(1)
 
 def ensure_req_file():
     """Ensure the root requirements.txt file exists."""
@@ -68,7 +565,8 @@ def ensure_req_file():
         "PyYAML",
         "requests",
         "questionary",
-        "argcomplete"
+        "argcomplete",
+        "wcwidth"
     ]
     req_path = Path("requirements.txt")
     if not req_path.exists():
@@ -76,17 +574,25 @@ def ensure_req_file():
             f.write("\n".join(reqs) + "\n")
 
 
-def bootstrap():
+def bootstrap(force_reinstall_reqs: bool = False, read_only: bool = False,
+              clone_strategy: Optional[str] = None):
     """
     Ensures that essential modules are present.
     If not, it clones them from the repositories.
+    Requirements are only reinstalled when they changed, unless forced.
+    For read_only commands nothing else happens once the modules are present,
+    unless requirements are forced.
     """
     # Check for venv
-    if not (hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)):
+    with TRACER.span("venv check"):
+        in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+        missing_modules = {p: url for p, url in BOOTSTRAP_MODULES.items() if not Path(p).exists()}
+    if not in_venv:
         print("❌ Error: Not running in a virtual environment. Please activate a venv before bootstrapping.")
         sys.exit(1)
 
-    missing_modules = [(Path(p), url) for p, url in BOOTSTRAP_MODULES.items() if not Path(p).exists()]
+    if read_only and not missing_modules and not force_reinstall_reqs:
+        return
 
     ensure_req_file()
     
@@ -94,22 +600,32 @@ def bootstrap():
         print("🚀 Bootstrapping ADHD Framework...")
         print(f"Found {len(missing_modules)} missing essential modules.")
 
-        for path, repo_url in missing_modules:
-            _clone_and_install(path, repo_url)
-
-    # Install root requirements
-    if Path("requirements.txt").exists():
-        # Check if we need to install (simple check: just do it, pip is fast if satisfied)
-        # Or we could check if modules are missing. For now, let's keep it simple but quiet.
         try:
-            subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        except Exception as e:
-            print(f"❌ Error installing requirements: {e}")
+            with TRACER.span("clone missing modules", count=len(missing_modules)):
+                results = clone_missing_modules(missing_modules, strategy=clone_strategy)
+        except ValueError as e:
+            print(f"❌ {e}")
             sys.exit(1)
+        if not _report_clone_failures(results):
+            print("   No module was installed; rerun to retry.")
+            sys.exit(1)
+
+        try:
+            lock = active_lock()
+        except ValueError as e:
+            print(f"⚠️  Ignoring lockfile: {e}")
+            lock = None
+        if lock:
+            for error in pin_modules_to_lock((r.path for r in results), lock):
+                print(f"⚠️  {error}")
+
+    # Install root and module requirements in one resolver run, skipped when unchanged
+    try:
+        with TRACER.span("requirements check"):
+            _ensure_requirements(force=force_reinstall_reqs)
+    except Exception as e:
+        print(f"❌ Error installing requirements: {e}")
+        sys.exit(1)
             
     if missing_modules:
         print("✅ Bootstrap complete. Starting Framework...\n")
@@ -126,7 +642,8 @@ def bootstrap():
                 print(f"⚠️  Could not make script executable: {e}")
 
     # Suggest/Configure Tab Completion
-    configure_venv_tab_completion()
+    with TRACER.span("configure_venv_tab_completion"):
+        configure_venv_tab_completion()
 
 
 def configure_venv_tab_completion():
@@ -180,279 +697,3381 @@ def configure_venv_tab_completion():
     print()
 
 
-class ADHDFramework:
-    """Main ADHD Framework CLI class"""
-
-    def __init__(self):
-        from managers.config_manager import ConfigManager
-        from utils.logger_util.logger import Logger
-        from cores.github_api_core.api import GithubApi
-        from cores.questionary_core.questionary_core import QuestionaryCore
-
-        self.logger = Logger(__class__.__name__)
-        self.prompter = QuestionaryCore()
+# -----------------------------------------------------------------------------
+# Tab completion index. Must stay import-light: it runs on every TAB press.
+# -----------------------------------------------------------------------------
 
-        try:
-            self._gh_path = GithubApi.require_gh()
-        except RuntimeError as e:
-            self.logger.error(f"GitHub CLI setup not complete: {e}")
-            sys.exit(1)
+# Module type folders, in discovery order
+MODULE_TYPE_DIRS = ("cores", "managers", "utils", "plugins", "mcps")
+COMPLETION_INDEX_FILE = FRAMEWORK_DATA_DIR / "completion_index.txt"
 
-    def run(self, args):
-        command_map = {
-            'create-project': self.create_project_proc,
-            'cp': self.create_project_proc,
-            'create-module': self.create_module_proc,
-            'cm': self.create_module_proc,
-            'init': self.init_project,
-            'i': self.init_project,
-            'refresh': self.refresh_project,
-            'r': self.refresh_project,
-            'list': self.list_modules,
-            'ls': self.list_modules,
-            'info': self.show_module_info,
-            'in': self.show_module_info,
-            'req': self.install_requirements,
-            'rq': self.install_requirements,
-            'workspace': self.update_workspace,
-            'ws': self.update_workspace,
-            'update-framework': self.update_framework,
-            'uf': self.update_framework,
-        }
 
-        handler = command_map.get(args.command)
-        if handler:
-            handler(args)
+def _is_module_dir_name(name: str) -> bool:
+    """Whether a folder under a module type folder can hold a module (hidden and __pycache__-style ones cannot)."""
+    return not name.startswith((".", "__"))
 
-    def create_project_proc(self, args) -> None:
-        from cores.project_creator_core.project_creation_wizard import run_project_creation_wizard
-        run_project_creation_wizard(
-            prompter=self.prompter,
-            logger=self.logger,
-        )
 
-    def create_module_proc(self, args) -> None:
-        """Enter the interactive module creation flow with templates."""
-        from cores.module_creator_core.module_creation_wizard import run_module_creation_wizard
-        run_module_creation_wizard(
-            prompter=self.prompter,
-            logger=self.logger,
-        )
+def _module_dirs() -> Iterator[str]:
+    """Yield 'type/name' for every folder under the module type folders that can hold a module.
 
-    def init_project(self, args) -> None:
-        """Initialize project modules."""
-        self.logger.info("Initializing project...")
+    Discovery, its cache, the watcher and the completion index all list
+    module folders through here.
+    """
+    for type_dir in MODULE_TYPE_DIRS:
         try:
-            from cores.project_init_core.project_init import ProjectInit
-            initializer = ProjectInit()
-            initializer.init_project()
-            self.logger.info("✅ Project initialization completed successfully!")
-        except Exception as e:
-            self.logger.error(f"❌ Project initialization failed: {e}")
-            sys.exit(1)
+            with os.scandir(type_dir) as it:
+                names = sorted(e.name for e in it if e.is_dir() and _is_module_dir_name(e.name))
+        except OSError:
+            continue
+        for name in names:
+            yield f"{type_dir}/{name}"
 
-    def refresh_project(self, args) -> None:
-        """Refresh project modules."""
-        from cores.modules_controller_core.modules_controller import ModulesController
-        controller = ModulesController()
-        if args.module:
-            self.logger.info(f"Refreshing module: {args.module}")
-            module = controller.get_module_by_name(args.module)
-            if module:
-                controller.run_module_refresh_script(module)
-                self.logger.info(f"✅ Module {args.module} refreshed!")
-            else:
-                # Suggest similar module names
-                report = controller.list_all_modules()
-                all_names = [m.name for m in report.modules]
-                suggestions = difflib.get_close_matches(args.module, all_names, n=3, cutoff=0.4)
-                if suggestions:
-                    self.logger.error(f"❌ Module '{args.module}' not found. Did you mean: {', '.join(suggestions)}?")
-                else:
-                    self.logger.error(f"❌ Module '{args.module}' not found. Use 'adhd list' to see available modules.")
-                sys.exit(1)
-        else:
-            self.logger.info("Refreshing all modules...")
-            report = controller.list_all_modules()
-            for module in report.modules:
-                if module.has_refresh_script():
-                    controller.run_module_refresh_script(module)
-            self.logger.info("✅ Project refresh completed!")
 
-    def list_modules(self, args) -> None:
-        """List all modules."""
-        from cores.modules_controller_core.modules_controller import ModulesController
-        controller = ModulesController()
-        report = controller.list_all_modules()
-        
-        print(f"\n📦 Found {len(report.modules)} modules:")
-        for module in report.modules:
-            status = "⚠️ " if module.issues else "✅"
-            print(f"  {status} {module.name} ({module.module_type.name}) - v{module.version}")
-            if module.issues:
-                for issue in module.issues:
-                    print(f"     - {issue.message}")
+def _module_dir_keys() -> Dict[str, list]:
+    """Map every module folder to a cheap change detector (init.yaml mtime/size, optional files)."""
+    return {module_dir: _module_dir_key(module_dir) for module_dir in _module_dirs()}
 
-    def show_module_info(self, args) -> None:
-        """Show module info."""
-        from cores.modules_controller_core.modules_controller import ModulesController
-        controller = ModulesController()
-        module = controller.get_module_by_name(args.module)
-        
-        if not module:
-            # Suggest similar module names
-            report = controller.list_all_modules()
-            all_names = [m.name for m in report.modules]
-            suggestions = difflib.get_close_matches(args.module, all_names, n=3, cutoff=0.4)
-            if suggestions:
-                self.logger.error(f"❌ Module '{args.module}' not found. Did you mean: {', '.join(suggestions)}?")
-            else:
-                self.logger.error(f"❌ Module '{args.module}' not found. Use 'adhd list' to see available modules.")
-            sys.exit(1)
 
-        print(f"\n📦 MODULE INFORMATION: {module.name}")
-        print(f"  📁 Path: {module.path}")
-        print(f"  📂 Type: {module.module_type.name}")
-        print(f"  🏷️  Version: {module.version}")
-        print(f"  🔗 Repo URL: {module.repo_url or 'N/A'}")
-        
-        reqs = ", ".join(module.requirements) if module.requirements else "None"
-        print(f"  🧱 Requirements: {reqs}")
-        
-        print(f"  🔄 Has Refresh Script: {'Yes' if module.has_refresh_script() else 'No'}")
-        print(f"  🚀 Has Initializer: {'Yes' if module.has_initializer() else 'No'}")
-        
-        if module.issues:
-            print("  ⚠️  Issues:")
-            for issue in module.issues:
-                print(f"    - {issue.message}")
+def _module_dir_key(module_dir: str) -> list:
+    """Change detector for one module folder, as stored by _module_dir_keys()."""
+    try:
+        st = os.stat(os.path.join(module_dir, "init.yaml"))
+        init_key = [st.st_mtime_ns, st.st_size]
+    except OSError:
+        init_key = None
+    return [
+        init_key,
+        os.path.exists(os.path.join(module_dir, "refresh.py")),
+        os.path.exists(os.path.join(module_dir, "__init__.py")),
+    ]
 
-    def install_requirements(self, args) -> None:
-        """Install requirements."""
-        from cores.project_init_core.requirements_installer import RequirementsInstaller
-        installer = RequirementsInstaller()
-        installer.install_all()
 
-    def update_workspace(self, args) -> None:
-        """Update VS Code workspace file."""
-        from cores.modules_controller_core.modules_controller import ModulesController, WorkspaceGenerationMode
-        
-        controller = ModulesController()
-        overrides = {}
-        
-        mode = WorkspaceGenerationMode.DEFAULT
-        if args.all:
-            mode = WorkspaceGenerationMode.INCLUDE_ALL
-        elif args.ignore_overrides:
-            mode = WorkspaceGenerationMode.IGNORE_OVERRIDES
+def _scan_module_entries() -> List[str]:
+    """List 'type/name' for every folder with an init.yaml, without parsing anything."""
+    return [module_dir for module_dir, key in _module_dir_keys().items() if key[0] is not None]
 
-        if args.module:
-            module = controller.get_module_by_name(args.module)
-            if not module:
-                # Suggest similar module names
-                report = controller.list_all_modules()
-                all_names = [m.name for m in report.modules]
-                suggestions = difflib.get_close_matches(args.module, all_names, n=3, cutoff=0.4)
-                if suggestions:
-                    self.logger.error(f"❌ Module '{args.module}' not found. Did you mean: {', '.join(suggestions)}?")
-                else:
-                    self.logger.error(f"❌ Module '{args.module}' not found. Use 'adhd list' to see available modules.")
-                sys.exit(1)
-            
-            # Determine current visibility based on mode to toggle it
-            current_visibility = False
-            if mode == WorkspaceGenerationMode.INCLUDE_ALL:
-                current_visibility = True
-            elif mode == WorkspaceGenerationMode.IGNORE_OVERRIDES:
-                current_visibility = module.module_type.shows_in_workspace
-            else:
-                current_visibility = module.shows_in_workspace
-                if current_visibility is None:
-                    current_visibility = module.module_type.shows_in_workspace
-            
-            new_visibility = not current_visibility
-            overrides[module.name] = new_visibility
-            self.logger.info(f"Temporarily toggling workspace visibility for {module.name} to {new_visibility}")
 
-        path = controller.generate_workspace_file(mode=mode, overrides=overrides)
-        self.logger.info(f"✅ Workspace file updated at: {path}")
+def load_completion_index() -> List[str]:
+    """Return the cached 'type/name' module list, rebuilding it if any module folder changed.
 
-    def update_framework(self, args) -> None:
-        """Update adhd_framework.py from the source repository."""
-        from cores.project_init_core.framework_updater import FrameworkUpdater
-        
-        try:
-            updater = FrameworkUpdater()
-            dry_run = getattr(args, 'dry_run', False)
-            
-            if args.all:
-                updater.update_all(dry_run=dry_run)
-            else:
-                updater.update_framework_file(dry_run=dry_run)
-        except Exception as e:
-            self.logger.error(f"❌ Failed to update framework: {e}")
-            sys.exit(1)
+    The index is validated with the same per-folder keys as the discovery
+    cache, so a folder that gains or loses its init.yaml is noticed as well
+    as one that is added or removed.
+    """
+    keys = _module_dir_keys()
+    signature = json.dumps(keys, separators=(",", ":"))
+    try:
+        with open(COMPLETION_INDEX_FILE, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        if lines and lines[0] == f"# {signature}":
+            return lines[1:]
+    except OSError:
+        pass
+
+    entries = [module_dir for module_dir, key in keys.items() if key[0] is not None]
+    try:
+        COMPLETION_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = COMPLETION_INDEX_FILE.with_suffix(f".tmp{os.getpid()}")
+        tmp_path.write_text("\n".join([f"# {signature}"] + entries) + "\n", encoding="utf-8")
+        os.replace(tmp_path, COMPLETION_INDEX_FILE)
+    except OSError:
+        pass
+    return entries
 
 
 def module_completer(prefix, parsed_args, **kwargs):
-    """Autocomplete module names with type grouping."""
-    # Suppress logging to prevent corrupting shell completion output
-    os.environ["ADHD_LOG_LEVEL"] = "CRITICAL"
+    """Autocomplete module names with type grouping.
+
+    Returns modules in 'type/name' format for better organization,
+    e.g. 'managers/config_manager', 'cores/project_init_core'.
+    """
     try:
-        from cores.modules_controller_core.modules_controller import ModulesController
-        controller = ModulesController()
-        report = controller.list_all_modules()
-        
-        # Return modules in 'type/name' format for better organization
-        # e.g. 'managers/config_manager', 'cores/project_init_core'
-        options = []
-        for m in report.modules:
-            # Use plural name for grouping (e.g. 'managers', 'cores')
-            type_name = m.module_type.plural_name.lower()
-            option = f"{type_name}/{m.name}"
-            options.append(option)
-            
-        return [o for o in options if o.startswith(prefix)]
+        return [o for o in load_completion_index() if o.startswith(prefix)]
     except Exception:
         return []
 
 
-def setup_parser() -> argparse.ArgumentParser:
-    """Configure and return the argument parser."""
-    parser = argparse.ArgumentParser(
-        description="ADHD Framework CLI - AI-Driven High-speed Development Framework",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+# -----------------------------------------------------------------------------
+# Module discovery, memoized per process and cached on disk between runs
+# -----------------------------------------------------------------------------
 
-    subparsers.add_parser('create-project', aliases=['cp'], help='Create a new ADHD project')
-    subparsers.add_parser('create-module', aliases=['cm'], help='Create a new module')
-    subparsers.add_parser('init', aliases=['i'], help='Initialize project modules')
-    
-    refresh_parser = subparsers.add_parser('refresh', aliases=['r'], help='Refresh project modules')
-    refresh_arg = refresh_parser.add_argument('--module', '-m', help='Refresh specific module by name')
-    if argcomplete:
-        refresh_arg.completer = module_completer
+DISCOVERY_CACHE_FILE = FRAMEWORK_DATA_DIR / "discovery_cache.json"
+DISCOVERY_CACHE_VERSION = 1
 
-    subparsers.add_parser('list', aliases=['ls'], help='List all discovered modules')
-    
-    info_parser = subparsers.add_parser('info', aliases=['in'], help='Show detailed module information')
-    info_arg = info_parser.add_argument('--module', '-m', required=True, help='Module name to show information for')
-    if argcomplete:
-        info_arg.completer = module_completer
 
-    subparsers.add_parser('req', aliases=['rq'], help='Install requirements from all requirements.txt files')
-    
-    workspace_parser = subparsers.add_parser('workspace', aliases=['ws'], help='Update VS Code workspace file')
-    workspace_parser.add_argument('--all', action='store_true', help='Include all modules regardless of settings')
-    workspace_parser.add_argument('--ignore-overrides', action='store_true', help='Ignore module-level overrides')
-    workspace_arg = workspace_parser.add_argument('--module', '-m', help='Toggle workspace visibility for a specific module')
-    if argcomplete:
-        workspace_arg.completer = module_completer
+class ModuleRecord(NamedTuple):
+    """Plain, serializable summary of a discovered module."""
+    name: str
+    path: str
+    type_name: str
+    type_plural: str
+    version: str
+    repo_url: Optional[str]
+    description: str
+    requirements: Tuple[str, ...]
+    shows_in_workspace: Optional[bool]
+    type_shows_in_workspace: bool
+    has_refresh_script: bool
+    has_initializer: bool
+    issues: Tuple[str, ...]
+
+    @classmethod
+    def from_module(cls, module) -> "ModuleRecord":
+        path = Path(module.path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(Path.cwd())
+            except ValueError:
+                pass
+        return cls(
+            name=module.name,
+            path=path.as_posix(),
+            type_name=module.module_type.name,
+            type_plural=module.module_type.plural_name.lower(),
+            version=str(module.version),
+            repo_url=module.repo_url,
+            description=getattr(module, "description", "") or "",
+            requirements=tuple(module.requirements or ()),
+            shows_in_workspace=module.shows_in_workspace,
+            type_shows_in_workspace=bool(module.module_type.shows_in_workspace),
+            has_refresh_script=bool(module.has_refresh_script()),
+            has_initializer=bool(module.has_initializer()),
+            issues=tuple(issue.message for issue in module.issues),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ModuleRecord":
+        data = dict(data)
+        data["requirements"] = tuple(data["requirements"])
+        data["issues"] = tuple(data["issues"])
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        data = self._asdict()
+        data["requirements"] = list(self.requirements)
+        data["issues"] = list(self.issues)
+        return data
+
+    @property
+    def qualified_name(self) -> str:
+        """'type/name', as offered by tab completion."""
+        return f"{self.type_plural}/{self.name}"
+
+
+OUTPUT_FORMATS = ("text", "json", "jsonl")
+
+
+def write_records(records: Iterable[ModuleRecord], fmt: str, out=None) -> None:
+    """Write module records as a JSON array ('json') or one object per line ('jsonl').
+
+    jsonl output is flushed after every record so consumers can process
+    modules as they arrive.
+    """
+    out = out or sys.stdout
+    if fmt == "jsonl":
+        for record in records:
+            out.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+            out.flush()
+    else:
+        json.dump([r.to_dict() for r in records], out, indent=2, ensure_ascii=False)
+        out.write("\n")
+
+
+class ModuleDiscovery:
+    """One module discovery per invocation, shared by every command handler.
+
+    records() answers from an on-disk cache when no module folder was added,
+    removed, had its init.yaml touched or gained or lost its refresh.py or
+    __init__.py since the cache was written, so a warm lookup only stats
+    files. The check uses the same per-folder keys as the completion index
+    (_module_dir_keys). Anything else falls back to a single
+    ModulesController scan, which is memoized in report().
+    """
+
+    def __init__(self, cache_file: Path = DISCOVERY_CACHE_FILE):
+        self.cache_file = cache_file
+        self._controller = None
+        self._report = None
+        self._records: Optional[List[ModuleRecord]] = None
+        self._graph: Optional["ModuleGraph"] = None
+        self._search: Optional["ModuleSearchIndex"] = None
+
+    @property
+    def controller(self):
+        if self._controller is None:
+            with TRACER.span("import ModulesController"):
+                from cores.modules_controller_core.modules_controller import ModulesController
+                self._controller = ModulesController()
+        return self._controller
+
+    def report(self):
+        """The ModulesController report (live module objects), scanned at most once."""
+        if self._report is None:
+            controller = self.controller
+            with TRACER.span("ModulesController.list_all_modules"):
+                self._report = controller.list_all_modules()
+        return self._report
+
+    def records(self) -> List[ModuleRecord]:
+        if self._records is None:
+            with TRACER.span("module discovery"):
+                self._records = self._load_cached() or self._scan_and_cache()
+        return self._records
+
+    def iter_records(self) -> Iterator[ModuleRecord]:
+        """Yield the same records as records(), each one as soon as it is available.
+
+        A warm cache yields straight from disk. On a cold scan the
+        ModulesController reports all modules in one call, so the first
+        record follows that call, and each record is yielded as it is
+        converted rather than after the whole list is built and cached.
+        """
+        if self._records is None:
+            self._records = self._load_cached()
+        if self._records is not None:
+            yield from self._records
+            return
+        dirs = _module_dir_keys()
+        records = []
+        with TRACER.span("module discovery"):
+            for module in self.report().modules:
+                record = ModuleRecord.from_module(module)
+                records.append(record)
+                yield record
+        self._records = records
+        self._write_cache(records, dirs)
+
+    def invalidate(self) -> None:
+        """Forget everything discovered so far (the disk cache revalidates itself)."""
+        self._report = None
+        self._records = None
+        self._graph = None
+        self._search = None
+
+    def graph(self) -> "ModuleGraph":
+        """The dependency graph of records(), built once per discovery."""
+        if self._graph is None:
+            records = self.records()
+            with TRACER.span("build module graph", modules=len(records)):
+                self._graph = ModuleGraph(records)
+        return self._graph
+
+    def search_index(self) -> "ModuleSearchIndex":
+        """The search index, brought up to date with records() on every call.
+
+        The update only stats each module's instructions files, so a warm
+        daemon also picks up instructions edits that leave the module folder
+        signature unchanged.
+        """
+        if self._search is None:
+            self._search = ModuleSearchIndex()
+        records = self.records()
+        with TRACER.span("update search index", modules=len(records)):
+            self._search.update(records)
+        return self._search
+
+    def find(self, name: str) -> Optional[ModuleRecord]:
+        """Look up a module record by name or 'type/name'."""
+        for record in self.records():
+            if name in (record.name, record.qualified_name):
+                return record
+        return None
+
+    def module(self, name: str):
+        """Look up a live module object by name or 'type/name'."""
+        for module in self.report().modules:
+            if name in (module.name, f"{module.module_type.plural_name.lower()}/{module.name}"):
+                return module
+        return None
+
+    def names(self) -> List[str]:
+        return [record.name for record in self.records()]
+
+    def _load_cached(self) -> Optional[List[ModuleRecord]]:
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cache.get("version") != DISCOVERY_CACHE_VERSION or cache.get("dirs") != _module_dir_keys():
+            return None
+        try:
+            return [ModuleRecord.from_dict(r) for r in cache["records"]]
+        except (TypeError, KeyError):
+            return None
+
+    def _scan_and_cache(self) -> List[ModuleRecord]:
+        dirs = _module_dir_keys()
+        records = [ModuleRecord.from_module(m) for m in self.report().modules]
+        self._write_cache(records, dirs)
+        return records
+
+    def _write_cache(self, records: List[ModuleRecord], dirs: Dict[str, list]) -> None:
+        cache = {
+            "version": DISCOVERY_CACHE_VERSION,
+            "dirs": dirs,
+            "records": [r.to_dict() for r in records],
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(tmp_path, self.cache_file)
+        except OSError:
+            pass
+
+
+# -----------------------------------------------------------------------------
+# Module dependency graph
+# -----------------------------------------------------------------------------
+
+def normalize_repo_url(url: str) -> str:
+    """Reduce a repo URL to a comparable form (no scheme, user, '.git' suffix or trailing slash)."""
+    url = url.strip().lower()
+    url = re.sub(r"^[a-z][a-z0-9+.-]*://", "", url)  # scheme
+    url = re.sub(r"^[^@/]+@", "", url)  # user@
+    url = re.sub(r"^([^/:]+):(?!\d)", r"\1/", url)  # scp-like host:path
+    url = url.rstrip("/")
+    return url[:-4] if url.endswith(".git") else url
+
+
+class ModuleGraph:
+    """Dependency graph of the discovered modules, built from init.yaml requirements.
+
+    Modules are numbered in discovery order and edges are kept as integer
+    adjacency lists in both directions, so every query below is a single
+    linear pass. An edge i -> j means module i requires module j.
+    Requirement URLs that do not belong to a discovered module are kept
+    per module in ``unresolved``.
+    """
+
+    def __init__(self, records: List[ModuleRecord]):
+        self.records = list(records)
+        self.names = [r.name for r in self.records]
+        self._ids: Dict[str, int] = {}
+        for i, record in enumerate(self.records):
+            self._ids.setdefault(record.name, i)
+            self._ids.setdefault(record.qualified_name, i)
+
+        normalized: Dict[str, str] = {}
+
+        def normalize(url: str) -> str:
+            if url not in normalized:
+                normalized[url] = normalize_repo_url(url)
+            return normalized[url]
+
+        by_url = {}
+        for i, record in enumerate(self.records):
+            if record.repo_url:
+                by_url.setdefault(normalize(record.repo_url), i)
+
+        self.deps: List[List[int]] = [[] for _ in self.records]
+        self.rdeps: List[List[int]] = [[] for _ in self.records]
+        self.unresolved: Dict[str, List[str]] = {}
+        for i, record in enumerate(self.records):
+            for url in record.requirements:
+                j = by_url.get(normalize(url))
+                if j is None:
+                    self.unresolved.setdefault(record.name, []).append(url)
+                elif j != i and j not in self.deps[i]:
+                    self.deps[i].append(j)
+                    self.rdeps[j].append(i)
+        self._components: Optional[List[int]] = None
+        self._order: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def id(self, name: str) -> Optional[int]:
+        """Index of a module given its name or 'type/name'."""
+        return self._ids.get(name)
+
+    def _reach(self, starts: Iterable[int], edges: List[List[int]]) -> List[bool]:
+        seen = [False] * len(self.records)
+        stack = list(starts)
+        for i in stack:
+            seen[i] = True
+        while stack:
+            for j in edges[stack.pop()]:
+                if not seen[j]:
+                    seen[j] = True
+                    stack.append(j)
+        return seen
+
+    def dependencies(self, name: str, transitive: bool = False) -> List[str]:
+        """Modules that name requires (directly, or all the way down)."""
+        i = self._ids[name]
+        if not transitive:
+            return [self.names[j] for j in self.deps[i]]
+        seen = self._reach([i], self.deps)
+        seen[i] = False
+        return [self.names[j] for j in self.topological_order_ids() if seen[j]]
+
+    def dependents(self, name: str, transitive: bool = False) -> List[str]:
+        """Modules that require name (directly, or through other modules)."""
+        i = self._ids[name]
+        if not transitive:
+            return [self.names[j] for j in self.rdeps[i]]
+        seen = self._reach([i], self.rdeps)
+        seen[i] = False
+        return [self.names[j] for j in self.topological_order_ids() if seen[j]]
+
+    def affected(self, names: Iterable[str]) -> List[str]:
+        """The modules changed plus everything that depends on them, dependencies first."""
+        seen = self._reach([self._ids[n] for n in names], self.rdeps)
+        return [self.names[j] for j in self.topological_order_ids() if seen[j]]
+
+    def components(self) -> List[int]:
+        """Strongly connected component id of every module (iterative Tarjan)."""
+        if self._components is not None:
+            return self._components
+        n = len(self.records)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        component = [-1] * n
+        stack: List[int] = []
+        counter = 0
+        count = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                v, edge = work[-1]
+                if edge == 0:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = True
+                if edge < len(self.deps[v]):
+                    work[-1] = (v, edge + 1)
+                    w = self.deps[v][edge]
+                    if index[w] == -1:
+                        work.append((w, 0))
+                    elif on_stack[w]:
+                        low[v] = min(low[v], index[w])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+        self._components = component
+        return component
+
+    def cycles(self) -> List[List[str]]:
+        """Groups of modules that require each other, each in discovery order."""
+        groups: Dict[int, List[int]] = {}
+        for i, c in enumerate(self.components()):
+            groups.setdefault(c, []).append(i)
+        return [[self.names[i] for i in members] for members in groups.values() if len(members) > 1]
+
+    def ordering_deps(self) -> List[List[int]]:
+        """Edges to schedule by, with every cycle broken deterministically.
+
+        The members of a cycle are chained in discovery order, so they run
+        one after another, and a requirement on any member becomes one on
+        the last member: whatever requires a cycle waits for all of it.
+        """
+        component = self.components()
+        last: Dict[int, int] = {}
+        previous = [-1] * len(self.records)
+        for i, c in enumerate(component):
+            if c in last:
+                previous[i] = last[c]
+            last[c] = i
+        ordering = []
+        for i, deps in enumerate(self.deps):
+            edges = [previous[i]] if previous[i] != -1 else []
+            for j in deps:
+                k = last[component[j]]
+                if component[j] != component[i] and k not in edges:
+                    edges.append(k)
+            ordering.append(edges)
+        return ordering
+
+    def topological_order_ids(self) -> List[int]:
+        """Dependencies before dependents, otherwise as close to discovery order as possible."""
+        if self._order is not None:
+            return self._order
+
+        deps = self.ordering_deps()
+        remaining = [len(d) for d in deps]
+        dependents: List[List[int]] = [[] for _ in self.records]
+        for i, ds in enumerate(deps):
+            for j in ds:
+                dependents[j].append(i)
+        ready = [i for i, r in enumerate(remaining) if r == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for k in dependents[i]:
+                remaining[k] -= 1
+                if remaining[k] == 0:
+                    heapq.heappush(ready, k)
+        self._order = order
+        return order
+
+    def topological_order(self) -> List[str]:
+        return [self.names[i] for i in self.topological_order_ids()]
+
+    def subgraph(self, names: Iterable[str]) -> "ModuleGraph":
+        """The given modules with everything they require and everything that requires them."""
+        starts = [self._ids[n] for n in names]
+        down = self._reach(starts, self.deps)
+        up = self._reach(starts, self.rdeps)
+        return ModuleGraph([r for i, r in enumerate(self.records) if down[i] or up[i]])
+
+    def to_dict(self) -> dict:
+        return {
+            "order": self.topological_order(),
+            "modules": {
+                self.names[i]: {
+                    "path": self.records[i].path,
+                    "requires": [self.names[j] for j in self.deps[i]],
+                    "required_by": [self.names[j] for j in self.rdeps[i]],
+                }
+                for i in range(len(self.records))
+            },
+            "cycles": self.cycles(),
+            "unresolved": self.unresolved,
+        }
+
+    def to_dot(self, highlight: Iterable[str] = ()) -> str:
+        cyclic = {name for group in self.cycles() for name in group}
+        highlight = set(highlight)
+        lines = ["digraph modules {", "  rankdir=LR;", "  node [shape=box];"]
+        for i, record in enumerate(self.records):
+            attrs = [f'label="{record.name}\\n{record.type_name}"']
+            if record.name in cyclic:
+                attrs.append('color="red"')
+            if record.name in highlight:
+                attrs.append('style="bold"')
+            lines.append(f'  "{record.name}" [{", ".join(attrs)}];')
+        for i, deps in enumerate(self.deps):
+            for j in deps:
+                lines.append(f'  "{self.names[i]}" -> "{self.names[j]}";')
+        lines.append("}")
+        return "\n".join(lines)
+
+
+# -----------------------------------------------------------------------------
+# Module search (search, "did you mean" suggestions)
+# -----------------------------------------------------------------------------
+
+SEARCH_INDEX_FILE = FRAMEWORK_DATA_DIR / "search_index.marshal"
+SEARCH_INDEX_VERSION = 1
+
+# A hit in the module name counts more than one deep in its instructions
+SEARCH_FIELD_WEIGHTS = {"name": 3.0, "description": 2.0, "instructions": 1.0}
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def search_tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(term: str) -> set:
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _trigram_similarity(a: set, b: set) -> float:
+    common = len(a & b)
+    return common / (len(a) + len(b) - common) if common else 0.0
+
+
+class SearchHit(NamedTuple):
+    """One ranked search result."""
+    name: str
+    score: float
+    matched: Tuple[str, ...]
+
+
+class ModuleSearchIndex:
+    """Persistent BM25 index over module names, descriptions and instruction files.
+
+    Each module is one document. update() reindexes only the modules whose
+    description or *.instructions.md files (by mtime and size) changed, and
+    the postings are kept on disk as a marshal snapshot, so a query costs a
+    few stats per module plus the postings of its terms. Query terms that
+    are not in the vocabulary are expanded to similar ones by trigram
+    overlap, which also drives the "did you mean" module name suggestions.
+    """
+
+    def __init__(self, path: Path = SEARCH_INDEX_FILE):
+        self.path = path
+        self.docs: Dict[str, dict] = {}
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self._loaded = False
+        self._vocab_trigrams: Optional[Dict[str, List[str]]] = None
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            # marshal.loads on the whole file is far faster than marshal.load reading from it
+            data = marshal.loads(self.path.read_bytes())
+            if data["version"] == SEARCH_INDEX_VERSION:
+                self.docs, self.postings = data["docs"], data["postings"]
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            pass
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, "wb") as f:
+                marshal.dump({"version": SEARCH_INDEX_VERSION, "docs": self.docs, "postings": self.postings}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _instruction_files(module_dir: str) -> Tuple[tuple, ...]:
+        files = []
+        try:
+            with os.scandir(module_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".instructions.md") and entry.is_file():
+                        st = entry.stat()
+                        files.append((entry.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+        return tuple(sorted(files))
+
+    def update(self, records: List[ModuleRecord]) -> int:
+        """Bring the index in line with the given modules; returns how many were (re)indexed or dropped."""
+        if not self._loaded:
+            self._load()
+        changed = 0
+        for record in records:
+            key = (record.path, record.description, self._instruction_files(record.path))
+            doc = self.docs.get(record.name)
+            if doc is not None and doc["key"] == key:
+                continue
+            self._remove(record.name)
+            self._add(record, key)
+            changed += 1
+        stale = set(self.docs) - {record.name for record in records}
+        for name in stale:
+            self._remove(name)
+        changed += len(stale)
+        if changed:
+            self._vocab_trigrams = None
+            self._save()
+        return changed
+
+    def _add(self, record: ModuleRecord, key: tuple) -> None:
+        instructions = []
+        for file_name, _, _ in key[2]:
+            try:
+                instructions.append(Path(record.path, file_name).read_text(encoding="utf-8", errors="replace"))
+            except OSError:
+                pass
+        fields = {
+            "name": search_tokens(record.name) + [record.name.lower()],
+            "description": search_tokens(record.description),
+            "instructions": search_tokens("\n".join(instructions)),
+        }
+        tf: Dict[str, float] = {}
+        length = 0.0
+        for field, tokens in fields.items():
+            weight = SEARCH_FIELD_WEIGHTS[field]
+            length += weight * len(tokens)
+            for token in tokens:
+                tf[token] = tf.get(token, 0.0) + weight
+        for term, freq in tf.items():
+            self.postings.setdefault(term, {})[record.name] = freq
+        self.docs[record.name] = {"key": key, "length": length, "terms": list(tf)}
+
+    def _remove(self, name: str) -> None:
+        doc = self.docs.pop(name, None)
+        if doc is None:
+            return
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(name, None)
+                if not posting:
+                    del self.postings[term]
+
+    def similar_terms(self, term: str, limit: int = 3, cutoff: float = 0.4) -> List[Tuple[str, float]]:
+        """Vocabulary terms that share most of their trigrams with term."""
+        if self._vocab_trigrams is None:
+            index: Dict[str, List[str]] = {}
+            for vocab_term in self.postings:
+                for gram in trigrams(vocab_term):
+                    index.setdefault(gram, []).append(vocab_term)
+            self._vocab_trigrams = index
+        grams = trigrams(term)
+        counts: Dict[str, int] = {}
+        for gram in grams:
+            for vocab_term in self._vocab_trigrams.get(gram, ()):
+                counts[vocab_term] = counts.get(vocab_term, 0) + 1
+        scored = []
+        for vocab_term, common in counts.items():
+            # A term of length n has (at most) n + 1 padded trigrams
+            similarity = common / (len(grams) + len(vocab_term) + 1 - common)
+            if similarity >= cutoff:
+                scored.append((vocab_term, similarity))
+        return heapq.nlargest(limit, scored, key=lambda item: (item[1], -len(item[0])))
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Rank modules for a free-text query (BM25, typo-tolerant)."""
+        if not self.docs:
+            return []
+        n_docs = len(self.docs)
+        avg_length = sum(doc["length"] for doc in self.docs.values()) / n_docs or 1.0
+        scores: Dict[str, float] = {}
+        matched: Dict[str, set] = {}
+        for token in dict.fromkeys(search_tokens(query)):
+            expansions = [(token, 1.0)] if token in self.postings else self.similar_terms(token)
+            for term, weight in expansions:
+                posting = self.postings[term]
+                idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                for name, freq in posting.items():
+                    norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * self.docs[name]["length"] / avg_length)
+                    scores[name] = scores.get(name, 0.0) + weight * idf * freq * (_BM25_K1 + 1) / (freq + norm)
+                    matched.setdefault(name, set()).add(term)
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [SearchHit(name, score, tuple(sorted(matched[name]))) for name, score in best]
+
+    def suggest(self, name: str, limit: int = 3, cutoff: float = 0.3) -> List[str]:
+        """Module names close to a mistyped one: by trigram overlap, then by search rank."""
+        wanted = trigrams(name.rsplit("/", 1)[-1].lower())
+        scored = [(_trigram_similarity(wanted, trigrams(candidate.lower())), candidate) for candidate in self.docs]
+        close = [candidate for score, candidate in sorted(scored, key=lambda item: (-item[0], item[1]))
+                 if score >= cutoff][:limit]
+        for hit in self.search(name, limit):
+            if len(close) >= limit:
+                break
+            if hit.name not in close:
+                close.append(hit.name)
+        return close
+
+
+# -----------------------------------------------------------------------------
+# VS Code workspace file (workspace / ws)
+# -----------------------------------------------------------------------------
+
+WORKSPACE_MODES = ("default", "all", "ignore_overrides")
+
+
+class WorkspaceUpdate(NamedTuple):
+    """What a workspace sync changed on disk."""
+    path: Optional[Path]
+    added: List[str]
+    removed: List[str]
+    written: bool
+
+
+def module_visible(record: ModuleRecord, mode: str = "default") -> bool:
+    """Whether a module shows in the workspace under a generation mode, before any toggles."""
+    if mode == "all":
+        return True
+    if mode == "ignore_overrides" or record.shows_in_workspace is None:
+        return record.type_shows_in_workspace
+    return bool(record.shows_in_workspace)
+
+
+def _workspace_folder_path(path: str, root: Path) -> str:
+    """A workspace folder path relative to the workspace file's folder, so absolute and relative entries compare equal."""
+    if not path:
+        return ""
+    if os.path.isabs(path):
+        # Also through symlinks: root is resolved, the controller's paths may not be
+        for candidate in (Path(os.path.normpath(path)), Path(path).resolve()):
+            try:
+                return candidate.relative_to(root).as_posix() or "."
+            except ValueError:
+                pass
+    return Path(os.path.normpath(path)).as_posix()
+
+
+def find_workspace_file(root: Path = Path(".")) -> Optional[Path]:
+    """The project's single *.code-workspace file, or None when there is none or it is ambiguous."""
+    candidates = list(root.glob("*.code-workspace"))
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def _json_indent(text: str):
+    """Indentation used by an existing JSON file, so rewrites keep its layout."""
+    for line in text.splitlines()[1:]:
+        stripped = line.lstrip()
+        if stripped and len(stripped) < len(line):
+            return line[:len(line) - len(stripped)]
+    return 4
+
+
+def _comparable_workspace(text: Optional[str], root: Path):
+    """Parsed workspace JSON with folder paths normalized (None if missing or not plain JSON)."""
+    if text is None:
+        return None
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(data, dict) and isinstance(data.get("folders"), list):
+        data["folders"] = [
+            dict(entry, path=_workspace_folder_path(str(entry.get("path", "")), root)) if isinstance(entry, dict) else entry
+            for entry in data["folders"]
+        ]
+    return data
+
+
+def _workspace_folders(data) -> List[str]:
+    if not isinstance(data, dict) or not isinstance(data.get("folders"), list):
+        return []
+    return [entry["path"] for entry in data["folders"] if isinstance(entry, dict) and entry.get("path")]
+
+
+def planned_workspace_folders(records: Iterable[ModuleRecord], mode: str = "default",
+                              overrides: Optional[Dict[str, bool]] = None) -> Dict[str, bool]:
+    """Every module folder mapped to whether the controller will list it in the workspace."""
+    overrides = overrides or {}
+    return {record.path: overrides.get(record.name, module_visible(record, mode)) for record in records}
+
+
+def _workspace_is_current(existing: Path, planned: Dict[str, bool]) -> bool:
+    """Whether the module folders listed in the existing workspace file are exactly the visible ones."""
+    root = existing.resolve().parent
+    try:
+        data = _comparable_workspace(existing.read_text(encoding="utf-8"), root)
+    except OSError:
+        return False
+    if data is None:
+        return False
+    module_paths = {_workspace_folder_path(str(Path(path).resolve()), root): visible for path, visible in planned.items()}
+    listed = {folder for folder in _workspace_folders(data) if folder in module_paths}
+    return listed == {path for path, visible in module_paths.items() if visible}
+
+
+def sync_workspace_file(generate, existing: Optional[Path] = None,
+                        planned: Optional[Dict[str, bool]] = None) -> WorkspaceUpdate:
+    """Regenerate the workspace file through generate() only when its module folders would change.
+
+    generate is the modules controller's generate_workspace_file bound to a
+    mode and overrides; it writes the file in place and returns its path.
+    planned (see planned_workspace_folders) is checked against the folders
+    in the existing file first, with paths compared relative to it: when
+    they match, generate() is not called and the file keeps its bytes,
+    inode and mtime, so VS Code and watchers see nothing. Folders that are
+    not module folders (the project root, hand-added ones) are left to the
+    controller and do not count.
+    """
+    if existing is not None and planned is not None and _workspace_is_current(existing, planned):
+        return WorkspaceUpdate(existing, [], [], False)
+
+    old_text = None
+    if existing is not None:
+        try:
+            old_text = existing.read_text(encoding="utf-8")
+        except OSError:
+            pass
+    path = Path(generate())
+    new_text = path.read_text(encoding="utf-8")
+    root = path.resolve().parent
+    if existing is not None and path.resolve() != existing.resolve():
+        # Generated under another name: the old file is not the one replaced
+        old_text = None
+    old, new = _comparable_workspace(old_text, root), _comparable_workspace(new_text, root)
+    old_folders, new_folders = _workspace_folders(old), _workspace_folders(new)
+    added = [folder for folder in new_folders if folder not in old_folders]
+    removed = [folder for folder in old_folders if folder not in new_folders]
+    return WorkspaceUpdate(path, added, removed, True)
+
+
+def update_workspace_file(discovery: "ModuleDiscovery", mode: str = "default",
+                          overrides: Optional[Dict[str, bool]] = None) -> WorkspaceUpdate:
+    """Regenerate the workspace file with the modules controller, only if its module folders change."""
+    from cores.modules_controller_core.modules_controller import WorkspaceGenerationMode
+    generation_mode = {
+        "default": WorkspaceGenerationMode.DEFAULT,
+        "all": WorkspaceGenerationMode.INCLUDE_ALL,
+        "ignore_overrides": WorkspaceGenerationMode.IGNORE_OVERRIDES,
+    }[mode]
+    controller = discovery.controller
+    with TRACER.span("workspace generate"):
+        return sync_workspace_file(
+            lambda: controller.generate_workspace_file(mode=generation_mode, overrides=overrides or {}),
+            find_workspace_file(),
+            planned_workspace_folders(discovery.records(), mode, overrides),
+        )
+
+
+# -----------------------------------------------------------------------------
+# Parallel refresh (refresh --jobs N)
+# -----------------------------------------------------------------------------
+
+class RefreshResult(NamedTuple):
+    """Outcome of one module's refresh script."""
+    name: str
+    ok: bool
+    output: str = ""
+    seconds: float = 0.0
+    note: str = ""
+    skipped: bool = False
+
+
+def run_refresh_subprocess(record: ModuleRecord) -> RefreshResult:
+    """Run a module's refresh.py in its own interpreter from the project root, capturing its output.
+
+    Used by `refresh --jobs N` (N > 1), where several scripts run at once
+    and their output has to be kept apart: as __main__, with the project
+    root as cwd and on PYTHONPATH. One script at a time goes through the
+    modules controller instead (controller_refresh_runner).
+    """
+    env = dict(os.environ)
+    root = str(Path.cwd())
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    with TRACER.span(f"refresh {record.name}"):
+        proc = subprocess.run(
+            [sys.executable, str(Path(record.path) / "refresh.py")],
+            cwd=root,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+        )
+    note = "" if proc.returncode == 0 else f"exit code {proc.returncode}"
+    return RefreshResult(record.name, proc.returncode == 0, proc.stdout, time.perf_counter() - start, note)
+
+
+def controller_refresh_runner(discovery: "ModuleDiscovery") -> Callable[[ModuleRecord], RefreshResult]:
+    """A RefreshScheduler runner that calls ModulesController.run_module_refresh_script.
+
+    This is how `refresh`, `refresh -m` and `watch` run scripts one at a
+    time. The script's output goes straight to the terminal, so results
+    carry none. The controller's module objects are looked up on the first
+    call, so nothing is scanned when no script needs to run.
+    """
+    modules: Dict[str, object] = {}
+
+    def run(record: ModuleRecord) -> RefreshResult:
+        if not modules:
+            modules.update((module.name, module) for module in discovery.report().modules)
+        start = time.perf_counter()
+        with TRACER.span(f"refresh {record.name}"):
+            try:
+                outcome = discovery.controller.run_module_refresh_script(modules[record.name])
+            except Exception as e:
+                return RefreshResult(record.name, False, "", time.perf_counter() - start, str(e) or type(e).__name__)
+        ok = outcome is not False
+        return RefreshResult(record.name, ok, "", time.perf_counter() - start, "" if ok else "refresh script failed")
+
+    return run
+
+
+def _refresh_status_line(result: RefreshResult) -> str:
+    status = "⏭️" if result.skipped else "✅" if result.ok else "❌"
+    detail = f" ({result.note})" if result.note else ""
+    return f"{status} {result.name} [{result.seconds:.2f}s]{detail}"
+
+
+REFRESH_STATE_FILE = FRAMEWORK_DATA_DIR / "refresh_state.json"
+ROOT_CONFIG_FILE = Path(".config")
+
+# Folders that never influence what a refresh script does
+_FINGERPRINT_SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache", "node_modules", ".venv"}
+
+
+def _git_head(module_dir: Path) -> str:
+    """Resolve a module checkout's HEAD commit by reading .git directly (no subprocess)."""
+    git_dir = module_dir / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[5:]
+        ref_file = git_dir / ref
+        if ref_file.exists():
+            return ref_file.read_text().strip()
+        for line in (git_dir / "packed-refs").read_text().splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return ""
+
+
+CONFIG_SNAPSHOT_FILE = FRAMEWORK_DATA_DIR / "config_snapshot.marshal"
+CONFIG_SNAPSHOT_VERSION = 1
+CONFIG_TEMPLATE_NAME = ".config_template"
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_config_snapshot() -> dict:
+    try:
+        snapshot = marshal.loads(CONFIG_SNAPSHOT_FILE.read_bytes())
+        if snapshot["version"] == CONFIG_SNAPSHOT_VERSION:
+            return snapshot
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        pass
+    return {"version": CONFIG_SNAPSHOT_VERSION, "key": None, "config": {}, "templates": {}}
+
+
+def _write_config_snapshot(snapshot: dict) -> None:
+    try:
+        CONFIG_SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CONFIG_SNAPSHOT_FILE.with_suffix(f".tmp{os.getpid()}")
+        tmp_path.write_bytes(marshal.dumps(snapshot))
+        os.replace(tmp_path, CONFIG_SNAPSHOT_FILE)
+    except (OSError, ValueError):
+        pass
+
+
+def _current_config_snapshot() -> Optional[dict]:
+    """The config snapshot, re-parsed from .config if that changed; None when .config is invalid."""
+    snapshot = _read_config_snapshot()
+    key = _stat_key(ROOT_CONFIG_FILE)
+    if key is None:
+        snapshot.update(key=None, config={})
+    elif snapshot["key"] != key:
+        try:
+            config = json.loads(ROOT_CONFIG_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(config, dict):
+            return None
+        snapshot.update(key=key, config=config)
+        _write_config_snapshot(snapshot)
+    return snapshot
+
+
+def load_root_config() -> dict:
+    """Parse the root .config, returning {} when it is missing or invalid.
+
+    A pre-parsed marshal snapshot is used while the file's mtime and size
+    still match it, and refreshed whenever they don't.
+    """
+    snapshot = _current_config_snapshot()
+    return snapshot["config"] if snapshot is not None else {}
+
+
+def _merge_defaults(target: dict, defaults: dict) -> bool:
+    """Add keys from defaults that target lacks, recursing into nested sections. Existing values win."""
+    changed = False
+    for name, value in defaults.items():
+        if name not in target:
+            target[name] = value
+            changed = True
+        elif isinstance(value, dict) and isinstance(target[name], dict):
+            changed |= _merge_defaults(target[name], value)
+    return changed
+
+
+def merge_config_templates(records: List[ModuleRecord], force: bool = False) -> Tuple[List[str], List[str]]:
+    """Merge module .config_template defaults into their sections of the root .config.
+
+    Only templates whose mtime/size changed since the last merge (or whose
+    section is missing) are read. The .config is rewritten atomically, and
+    only when a section gained keys. Returns the merged and the unreadable
+    template module names.
+    """
+    snapshot = _current_config_snapshot()
+    if snapshot is None:
+        # Never overwrite a .config that exists but could not be parsed
+        return [], [str(ROOT_CONFIG_FILE)]
+    config, templates = snapshot["config"], snapshot["templates"]
+    merged, invalid, seen = [], [], 0
+    for record in records:
+        template_path = Path(record.path) / CONFIG_TEMPLATE_NAME
+        key = _stat_key(template_path)
+        if key is None:
+            continue
+        if not force and templates.get(record.name) == key and record.name in config:
+            continue
+        try:
+            defaults = json.loads(template_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            invalid.append(record.name)
+            continue
+        templates[record.name] = key
+        seen += 1
+        section = config.get(record.name)
+        if section is None:
+            config[record.name] = defaults
+            merged.append(record.name)
+        elif isinstance(section, dict) and isinstance(defaults, dict) and _merge_defaults(section, defaults):
+            merged.append(record.name)
+
+    if merged:
+        try:
+            indent = _json_indent(ROOT_CONFIG_FILE.read_text(encoding="utf-8"))
+        except OSError:
+            indent = 4
+        tmp_path = ROOT_CONFIG_FILE.with_name(f"{ROOT_CONFIG_FILE.name}.tmp{os.getpid()}")
+        tmp_path.write_text(json.dumps(config, indent=indent, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, ROOT_CONFIG_FILE)
+        snapshot["key"] = _stat_key(ROOT_CONFIG_FILE)
+    if seen:
+        _write_config_snapshot(snapshot)
+    return merged, invalid
+
+
+# Refresh scripts that read one kind of file from every module, by module name
+# (instruction_core syncs every instructions file into .github/, config_manager
+# merges every template into .config). Only these modules see those files as
+# inputs; every other module is fingerprinted on its own folder alone.
+PROJECT_INPUT_CONSUMERS: Dict[str, Tuple[str, ...]] = {
+    "instruction_core": (".instructions.md",),
+    "config_manager": (CONFIG_TEMPLATE_NAME,),
+}
+
+
+def project_inputs_signature(records: Iterable[ModuleRecord], suffixes: Tuple[str, ...]) -> str:
+    """Hash the module set plus the mtime/size of every module file ending in one of suffixes."""
+    digest = hashlib.sha256()
+    for record in sorted(records, key=lambda r: r.path):
+        digest.update(f"{record.name}\0{record.path}\0".encode())
+        try:
+            with os.scandir(record.path) as it:
+                entries = sorted((e.name, e.stat()) for e in it if e.name.endswith(suffixes))
+        except OSError:
+            continue
+        for name, st in entries:
+            digest.update(f"{name}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+    return digest.hexdigest()
+
+
+class RefreshState:
+    """Remembers the inputs each module's refresh script last ran against.
+
+    A module's fingerprint covers its git HEAD, the path/mtime/size of every
+    file in its folder, the contents of refresh.py and its section of the
+    root .config. The modules in PROJECT_INPUT_CONSUMERS also cover the
+    cross-module inputs given to set_project(): which modules exist and the
+    files of the kind they collect from every module. Fingerprints are
+    taken after a successful run, so whatever a refresh script writes into
+    its own folder does not make it stale.
+    """
+
+    def __init__(self, path: Path = REFRESH_STATE_FILE):
+        self.path = path
+        self.project_keys: Dict[str, str] = {}
+        try:
+            self._state: Dict[str, str] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._state = {}
+
+    def set_project(self, records: Iterable[ModuleRecord]) -> List[str]:
+        """Take the cross-module inputs from these modules. Returns the consumers whose inputs changed."""
+        records = list(records)
+        keys = {
+            record.name: project_inputs_signature(records, PROJECT_INPUT_CONSUMERS[record.name])
+            for record in records if record.name in PROJECT_INPUT_CONSUMERS
+        }
+        changed = [name for name, key in keys.items() if self.project_keys.get(name) != key]
+        self.project_keys = keys
+        return changed
+
+    def fingerprint(self, record: ModuleRecord, config: dict) -> str:
+        module_dir = Path(record.path)
+        digest = hashlib.sha256()
+        digest.update(self.project_keys.get(record.name, "").encode())
+        digest.update(_git_head(module_dir).encode())
+        for dirpath, dirnames, filenames in os.walk(module_dir):
+            dirnames[:] = sorted(d for d in dirnames if d not in _FINGERPRINT_SKIP_DIRS)
+            for filename in sorted(filenames):
+                file_path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                digest.update(f"{file_path}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+        try:
+            digest.update((module_dir / "refresh.py").read_bytes())
+        except OSError:
+            pass
+        digest.update(json.dumps(config.get(record.name), sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def is_current(self, record: ModuleRecord, config: dict) -> bool:
+        return self._state.get(record.name) == self.fingerprint(record, config)
+
+    def mark(self, record: ModuleRecord, config: dict) -> None:
+        self._state[record.name] = self.fingerprint(record, config)
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_text(json.dumps(self._state, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+class RefreshScheduler:
+    """Run refresh scripts on a worker pool, dependencies first.
+
+    run() reports results only for modules whose refresh script ran, or
+    would have run but was skipped because a requirement failed (those
+    have skipped=True). Modules without a refresh script and those listed
+    in skip are satisfied ordering points and are never reported.
+
+    A module starts once every module it requires (transitively, through
+    modules without a refresh script too) has finished. Dependents of a
+    failed module are skipped, naming the module that actually failed.
+    Modules caught in a requirement cycle run one after another in
+    discovery order (see ModuleGraph.ordering_deps), so a failure skips the
+    rest of its cycle and everything that requires any member of it.
+    """
+
+    def __init__(self, records: List[ModuleRecord], jobs: int, runner=run_refresh_subprocess, skip=(),
+                 graph: Optional[ModuleGraph] = None):
+        self.skip = set(skip)
+        self.graph = graph or ModuleGraph(records)
+        self.jobs = max(1, jobs)
+        self.runner = runner
+
+    def run(self, on_result=None) -> List[RefreshResult]:
+        from collections import deque
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        graph = self.graph
+        deps = graph.ordering_deps()
+        waiting = [len(d) for d in deps]
+        dependents: List[List[int]] = [[] for _ in deps]
+        for i, ds in enumerate(deps):
+            for j in ds:
+                dependents[j].append(i)
+
+        ready = deque(i for i, n in enumerate(waiting) if n == 0)
+        # Failed modules, and the modules each one's failure is blamed on
+        failed: Dict[int, set] = {}
+        results: List[RefreshResult] = []
+        running = {}
+
+        def finish(i: int, result: RefreshResult, report: bool = True, blame: Optional[set] = None) -> None:
+            if report:
+                results.append(result)
+                if on_result:
+                    on_result(result)
+            if not result.ok:
+                failed[i] = blame or {graph.names[i]}
+            for k in dependents[i]:
+                waiting[k] -= 1
+                if waiting[k] == 0:
+                    ready.append(k)
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while ready or running:
+                while ready and len(running) < self.jobs:
+                    i = ready.popleft()
+                    record = graph.records[i]
+                    runs = record.has_refresh_script and record.name not in self.skip
+                    blocked = set().union(*(failed[d] for d in deps[i] if d in failed))
+                    if blocked:
+                        # Only a script that would have run is reported; either way the blame propagates
+                        note = f"skipped, requires failed {', '.join(sorted(blocked))}"
+                        finish(i, RefreshResult(record.name, False, note=note, skipped=True), report=runs, blame=blocked)
+                    elif not runs:
+                        finish(i, RefreshResult(record.name, True), report=False)
+                    else:
+                        running[pool.submit(self.runner, record)] = i
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    try:
+                        finish(i, future.result())
+                    except Exception as e:
+                        finish(i, RefreshResult(graph.names[i], False, note=str(e)))
+
+        return results
+
+
+# -----------------------------------------------------------------------------
+# Startup profiling (--profile-startup)
+# -----------------------------------------------------------------------------
+
+class StartupProfiler:
+    """Records phase timings and first-time imports for the --profile-startup report.
+
+    When disabled every method is a no-op, so it can be used unconditionally.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.phases: List[Tuple[str, float]] = []
+        self.imports: List[Tuple[str, float, float]] = []  # (module, cumulative, self)
+        self._child_time: List[float] = []
+        self._original_import = None
+
+    def install(self) -> None:
+        if not self.enabled or self._original_import is not None:
+            return
+        import builtins
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        if self._original_import is not None:
+            import builtins
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        start = time.perf_counter()
+        self._child_time.append(0.0)
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._child_time.pop()
+            if self._child_time:
+                self._child_time[-1] += elapsed
+            label = name
+            if level and globals and globals.get('__package__'):
+                base = globals['__package__'].rsplit('.', level - 1)[0]
+                label = f"{base}.{name}" if name else base
+            self.imports.append((label, elapsed, elapsed - children))
+
+    @contextmanager
+    def phase(self, name: str):
+        with TRACER.span(name):
+            if not self.enabled:
+                yield
+                return
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.phases.append((name, time.perf_counter() - start))
+
+    def report(self, top: int = 15) -> None:
+        if not self.enabled:
+            return
+        out = sys.stderr
+        print("\n⏱️  Startup profile", file=out)
+        for name, seconds in self.phases:
+            print(f"  {seconds * 1000:9.2f} ms  {name}", file=out)
+        print(f"  {sum(s for _, s in self.phases) * 1000:9.2f} ms  total", file=out)
+        if self.imports:
+            print(f"\n  Slowest imports (top {top} by self time, cumulative in brackets):", file=out)
+            for label, cumulative, own in sorted(self.imports, key=lambda r: r[2], reverse=True)[:top]:
+                print(f"  {own * 1000:9.2f} ms  [{cumulative * 1000:8.2f} ms]  {label}", file=out)
+
+
+# -----------------------------------------------------------------------------
+# Command table. Each handler declares what it needs so startup can stay lazy.
+# -----------------------------------------------------------------------------
+
+class CommandSpec(NamedTuple):
+    """How a command is dispatched and what it needs before its handler runs.
+
+    read_only commands skip the bootstrap side effects (pip, chmod, tab
+    completion setup) as long as the essential modules are present.
+    needs lists the lazily created resources the handler uses:
+    'prompter' (QuestionaryCore) and 'gh' (a verified GitHub CLI).
+    daemon commands are forwarded to a running `serve` process if there is one.
+    """
+    handler: str
+    read_only: bool = False
+    needs: Tuple[str, ...] = ()
+    daemon: bool = False
+
+
+COMMANDS: Dict[str, CommandSpec] = {
+    'create-project': CommandSpec('create_project_proc', needs=('prompter', 'gh')),
+    'cp': CommandSpec('create_project_proc', needs=('prompter', 'gh')),
+    'create-module': CommandSpec('create_module_proc', needs=('prompter', 'gh')),
+    'cm': CommandSpec('create_module_proc', needs=('prompter', 'gh')),
+    'init': CommandSpec('init_project'),
+    'i': CommandSpec('init_project'),
+    'refresh': CommandSpec('refresh_project', daemon=True),
+    'r': CommandSpec('refresh_project', daemon=True),
+    'list': CommandSpec('list_modules', read_only=True, daemon=True),
+    'ls': CommandSpec('list_modules', read_only=True, daemon=True),
+    'info': CommandSpec('show_module_info', read_only=True, daemon=True),
+    'in': CommandSpec('show_module_info', read_only=True, daemon=True),
+    'req': CommandSpec('install_requirements'),
+    'rq': CommandSpec('install_requirements'),
+    'workspace': CommandSpec('update_workspace', daemon=True),
+    'ws': CommandSpec('update_workspace', daemon=True),
+    'update-framework': CommandSpec('update_framework'),
+    'uf': CommandSpec('update_framework'),
+    'serve': CommandSpec('serve'),
+    'watch': CommandSpec('watch_modules'),
+    'graph': CommandSpec('show_graph', read_only=True, daemon=True),
+    'search': CommandSpec('search_modules', read_only=True, daemon=True),
+    'lock': CommandSpec('lock_modules'),
+    'mirror': CommandSpec('mirror_modules'),
+}
+
+
+# Global options that take a value, so peeking can skip over it
+_GLOBAL_VALUE_OPTIONS = ('--clone-strategy', '--mirror', '--trace', '--trace-top')
+
+
+def peek_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand in argv without building the parser (first non-option argument)."""
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+
+def peek_option(argv: List[str], option: str) -> Optional[str]:
+    """Return the value of a global --option (either '--option value' or '--option=value')."""
+    for i, arg in enumerate(argv):
+        if arg == option and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(option + '='):
+            return arg.split('=', 1)[1]
+    return None
+
+
+class ADHDFramework:
+    """Main ADHD Framework CLI class"""
+
+    def __init__(self):
+        self._logger = None
+        self._prompter = None
+        self._gh_path = None
+        self._discovery: Optional[ModuleDiscovery] = None
+
+    @property
+    def logger(self):
+        if self._logger is None:
+            with TRACER.span("import Logger"):
+                from utils.logger_util.logger import Logger
+                self._logger = Logger(__class__.__name__)
+        return self._logger
+
+    @property
+    def prompter(self):
+        if self._prompter is None:
+            with TRACER.span("import QuestionaryCore"):
+                from cores.questionary_core.questionary_core import QuestionaryCore
+                self._prompter = QuestionaryCore()
+        return self._prompter
+
+    def require_gh(self) -> str:
+        """Verify the GitHub CLI once per process, exiting if it is not usable."""
+        if self._gh_path is None:
+            try:
+                with TRACER.span("GithubApi.require_gh"):
+                    from cores.github_api_core.api import GithubApi
+                    self._gh_path = GithubApi.require_gh()
+            except RuntimeError as e:
+                self.logger.error(f"GitHub CLI setup not complete: {e}")
+                sys.exit(1)
+        return self._gh_path
+
+    @property
+    def discovery(self) -> ModuleDiscovery:
+        if self._discovery is None:
+            self._discovery = ModuleDiscovery()
+        return self._discovery
+
+    def _exit_module_not_found(self, name: str) -> None:
+        """Report an unknown module name with close matches, then exit."""
+        suggestions = self.discovery.search_index().suggest(name)
+        if suggestions:
+            self.logger.error(f"❌ Module '{name}' not found. Did you mean: {', '.join(suggestions)}?")
+        else:
+            self.logger.error(f"❌ Module '{name}' not found. Use 'adhd list' to see available modules.")
+        sys.exit(1)
+
+    def prepare(self, spec: CommandSpec) -> None:
+        """Create everything a command declared in its needs."""
+        for need in spec.needs:
+            if need == 'prompter':
+                self.prompter
+            elif need == 'gh':
+                self.require_gh()
+
+    def serve(self, args) -> None:
+        """Run the warm daemon in the foreground, or stop a running one."""
+        if args.stop:
+            if stop_daemon():
+                self.logger.info("✅ Daemon stopped.")
+            else:
+                self.logger.info("No daemon is running.")
+            return
+        FrameworkDaemon(self).serve_forever()
+
+    def watch_modules(self, args) -> None:
+        """Watch module folders and refresh/regenerate only what an edit affects."""
+        ModuleWatcher(self, debounce=args.debounce, poll=args.poll, interval=args.interval).run()
+
+    def lock_modules(self, args) -> None:
+        """Record module commits and pinned Python packages in adhd.lock."""
+        lock, warnings = build_lock(self.discovery.records())
+        for warning in warnings:
+            self.logger.warning(f"⚠️  {warning}")
+        write_lock(lock)
+        self.logger.info(f"🔒 Locked {len(lock['modules'])} modules and {len(lock['requirements'])} Python packages in {LOCK_FILE}")
+
+    def mirror_modules(self, args) -> None:
+        """Pack locked module repos and wheels into a directory (or tar bundle) for offline use."""
+        try:
+            lock = read_lock(LOCK_FILE)
+        except ValueError as e:
+            self.logger.error(f"❌ {e}")
+            sys.exit(1)
+        if lock is None:
+            self.logger.info(f"No {LOCK_FILE} yet, locking the current checkout first.")
+            self.lock_modules(args)
+            lock = read_lock(LOCK_FILE)
+
+        dest = Path(args.directory)
+        start = time.perf_counter()
+        errors = build_mirror(lock, dest)
+        if errors:
+            self.logger.error(f"❌ Mirror is incomplete ({len(errors)} problem(s)):")
+            for error in errors:
+                self.logger.error(f"   - {error}")
+            sys.exit(1)
+        if args.archive:
+            bundle = shutil.make_archive(str(dest), "tar", root_dir=dest)
+            self.logger.info(f"📦 Bundle written to {bundle} ({format_bytes(os.path.getsize(bundle))})")
+        self.logger.info(f"✅ Mirror ready in {dest} ({format_bytes(_dir_size(dest))}, {time.perf_counter() - start:.1f}s). "
+                         f"Provision with --mirror {dest} or ADHD_MIRROR={dest}")
+
+    def run(self, args):
+        spec = COMMANDS.get(args.command)
+        if spec:
+            self.prepare(spec)
+            getattr(self, spec.handler)(args)
+
+    def create_project_proc(self, args) -> None:
+        from cores.project_creator_core.project_creation_wizard import run_project_creation_wizard
+        run_project_creation_wizard(
+            prompter=self.prompter,
+            logger=self.logger,
+        )
+
+    def create_module_proc(self, args) -> None:
+        """Enter the interactive module creation flow with templates."""
+        from cores.module_creator_core.module_creation_wizard import run_module_creation_wizard
+        run_module_creation_wizard(
+            prompter=self.prompter,
+            logger=self.logger,
+        )
+
+    def init_project(self, args) -> None:
+        """Initialize project modules."""
+        if args.jobs:
+            self._init_project_parallel(args.jobs, args.clone_strategy)
+            return
+        self.require_gh()
+        self.logger.info("Initializing project...")
+        try:
+            from cores.project_init_core.project_init import ProjectInit
+            initializer = ProjectInit()
+            initializer.init_project()
+            self.logger.info("✅ Project initialization completed successfully!")
+        except Exception as e:
+            self.logger.error(f"❌ Project initialization failed: {e}")
+            sys.exit(1)
+
+    def _init_project_parallel(self, jobs: int, clone_strategy: Optional[str]) -> None:
+        """Clone the init.yaml modules and everything they require level by level, then install requirements once."""
+        from project.tui_graphic import TableColumn, TableFormatter, TableRow
+
+        try:
+            roots = _url_list(read_init_yaml(Path(".")).get("modules"))
+        except (OSError, ValueError) as e:
+            self.logger.error(f"❌ Project initialization failed: cannot read init.yaml ({e})")
+            sys.exit(1)
+        self.logger.info(f"Initializing project: {len(roots)} module(s) and their requirements, {jobs} workers...")
+
+        def show(entry: InitModule) -> None:
+            if entry.cloned:
+                print(f"  - Cloned {entry.path} ({entry.seconds:.1f}s, {format_bytes(entry.bytes)})")
+            elif not entry.ok:
+                print(f"  - Failed {entry.repo_url}: {entry.error}")
+
+        start = time.perf_counter()
+        results = resolve_init_modules(roots, jobs, clone_strategy, on_result=show)
+        clone_seconds = time.perf_counter() - start
+        failures = [r for r in results if not r.ok]
+
+        try:
+            lock = active_lock()
+        except ValueError as e:
+            self.logger.warning(f"⚠️  Ignoring lockfile: {e}")
+            lock = None
+        if lock:
+            for error in pin_modules_to_lock((Path(r.path) for r in results if r.cloned), lock):
+                self.logger.warning(f"⚠️  {error}")
+
+        installer = WheelhouseInstaller(project_requirement_files(list(_present_modules().values())), jobs=jobs)
+        try:
+            packages = installer.resolve()
+            installer.build(installer.download(packages))
+            installer.install(packages)
+        except RuntimeError as e:
+            failures.append(InitModule("requirements", -1, "requirements", ok=False, error=str(e)))
+        finally:
+            installer.close()
+
+        levels = max((r.level for r in results), default=-1) + 1
+        table = TableFormatter(table_width=shutil.get_terminal_size().columns, fit_mode="wrap")
+        table.set_title(f"📦 {len(results)} module(s) in {levels} level(s), cloned in {clone_seconds:.1f}s")
+        table.set_columns([
+            TableColumn("", min_width=2, max_width=2),
+            TableColumn("Module", min_width=12),
+            TableColumn("Level", max_width=5),
+            TableColumn("Clone", max_width=8),
+            TableColumn("Size", max_width=10),
+        ])
+        for r in results:
+            if r.cloned:
+                table.add_row(TableRow(cells=["✅", r.path, str(r.level), f"{r.seconds:.2f}s", format_bytes(r.bytes)]))
+            elif r.ok:
+                table.add_row(TableRow(cells=["➖", r.path, str(r.level), "present", "-"]))
+            else:
+                table.add_row(TableRow(cells=["❌", r.repo_url, str(r.level), f"{r.seconds:.2f}s", "-"]))
+                table.add_row(TableRow(f"      - {r.error}"))
+        print()
+        print(table.render())
+
+        timings = " · ".join(f"{phase} {installer.timings[phase]:.1f}s" for phase in REQUIREMENT_PHASES)
+        print(f"🧱 Requirements ({len(installer.merged.entries())} merged): {timings}")
+        if failures:
+            self.logger.error(f"❌ Project initialization failed for {len(failures)} module(s) or step(s):")
+            for r in failures:
+                self.logger.error(f"   - {r.name or r.repo_url}: {r.error}")
+            sys.exit(1)
+        self.logger.info(f"✅ Project initialization completed in {time.perf_counter() - start:.1f}s! "
+                         "Run './adhd_framework.py refresh' to set the new modules up.")
+
+    def refresh_project(self, args) -> None:
+        """Refresh project modules."""
+        discovery = self.discovery
+        state = RefreshState()
+        if args.module:
+            self.logger.info(f"Refreshing module: {args.module}")
+            record = discovery.find(args.module)
+            if not record:
+                self._exit_module_not_found(args.module)
+            if not record.has_refresh_script:
+                self.logger.warning(f"⚠️  Module {record.name} has no refresh script.")
+                return
+            self._merge_config_templates([record], args.force)
+            state.set_project(discovery.records())
+            result = controller_refresh_runner(discovery)(record)
+            if result.output:
+                print(result.output.rstrip())
+            if not result.ok:
+                self.logger.error(f"❌ Module {record.name} failed to refresh ({result.note})")
+                sys.exit(1)
+            state.mark(record, load_root_config())
+            state.save()
+            self.logger.info(f"✅ Module {args.module} refreshed!")
+            return
+
+        self._merge_config_templates(discovery.records(), args.force)
+        state.set_project(discovery.records())
+        config = load_root_config()
+        records = [r for r in discovery.records() if r.has_refresh_script]
+        with TRACER.span("refresh state check", modules=len(records)):
+            stale = {r.name for r in records if args.force or not state.is_current(r, config)}
+        if not stale:
+            self.logger.info(f"✅ All {len(records)} refresh scripts are up to date (use --force to rerun them).")
+            return
+        if len(stale) < len(records):
+            self.logger.info(f"Skipping {len(records) - len(stale)} unchanged module(s).")
+
+        # Without --jobs the same scheduler runs one script at a time, in dependency order,
+        # through the modules controller
+        self._refresh_all_parallel(args.jobs or 1, stale, state)
+
+    def _merge_config_templates(self, records: List[ModuleRecord], force: bool = False) -> None:
+        """Merge changed .config_template defaults into .config before any refresh script runs."""
+        with TRACER.span("merge config templates", modules=len(records)):
+            merged, invalid = merge_config_templates(records, force)
+        if merged:
+            self.logger.info(f"⚙️  Merged config template defaults for: {', '.join(merged)}")
+        for name in invalid:
+            self.logger.warning(f"⚠️  Skipped config merge for {name}: not valid JSON")
+
+    def _refresh_all_parallel(self, jobs: int, stale: set, state: RefreshState) -> None:
+        """Refresh the stale modules on a worker pool (of one without --jobs), respecting init.yaml requirements.
+
+        With one worker each script runs through the modules controller; with
+        more, each runs in its own captured subprocess (run_refresh_subprocess).
+        """
+        from project.tui_graphic import TableFormatter, TableRow
+
+        records = self.discovery.records()
+        skip = [r.name for r in records if r.name not in stale]
+        graph = self.discovery.graph()
+        start = time.perf_counter()
+        if jobs > 1:
+            table = TableFormatter(table_width=shutil.get_terminal_size().columns, fit_mode="wrap")
+            table.set_title(f"Refreshing {len(stale)} module(s) with {jobs} workers")
+            with table.stream() as out:
+                def show(result: RefreshResult) -> None:
+                    out.add_row(TableRow(_refresh_status_line(result)))
+                    for line in result.output.rstrip().splitlines():
+                        out.add_row(TableRow(f"     {line}"))
+
+                results = RefreshScheduler(records, jobs, skip=skip, graph=graph).run(on_result=show)
+        else:
+            # The controller prints each script's output as it runs, so no table around it
+            self.logger.info(f"Refreshing {len(stale)} module(s)")
+            results = RefreshScheduler(records, 1, runner=controller_refresh_runner(self.discovery), skip=skip,
+                                       graph=graph).run(on_result=lambda result: print(_refresh_status_line(result)))
+        elapsed = time.perf_counter() - start
+
+        config = load_root_config()
+        by_name = {r.name: r for r in records}
+        for result in results:
+            if result.ok:
+                state.mark(by_name[result.name], config)
+        state.save()
+
+        ran = [r for r in results if not r.skipped]
+        skipped = [r for r in results if r.skipped]
+        failures = [r for r in ran if not r.ok]
+        busy = sum(r.seconds for r in ran)
+        print(f"\n🔄 {len(ran)} refresh scripts finished in {elapsed:.2f}s ({busy:.2f}s of script time)"
+              + (f", {len(skipped)} skipped" if skipped else ""))
+        if failures or skipped:
+            if failures:
+                self.logger.error(f"❌ {len(failures)} module(s) failed to refresh:")
+                for r in failures:
+                    self.logger.error(f"   - {r.name}: {r.note}")
+            if skipped:
+                self.logger.error(f"⏭️  {len(skipped)} module(s) not refreshed because a requirement failed:")
+                for r in skipped:
+                    self.logger.error(f"   - {r.name}: {r.note}")
+            sys.exit(1)
+        self.logger.info("✅ Project refresh completed!")
+
+    def list_modules(self, args) -> None:
+        """List all modules."""
+        if args.format == "jsonl":
+            write_records(self.discovery.iter_records(), args.format)
+            return
+        records = self.discovery.records()
+        if args.format != "text":
+            write_records(records, args.format)
+            return
+
+        from project.tui_graphic import TableColumn, TableFormatter, TableRow
+        table = TableFormatter(table_width=shutil.get_terminal_size().columns)
+        table.set_title(f"📦 Found {len(records)} modules")
+        table.set_columns([
+            TableColumn("", min_width=2, max_width=2),
+            TableColumn("Module", min_width=12),
+            TableColumn("Type", max_width=8),
+            TableColumn("Version", max_width=16),
+        ])
+        for module in records:
+            status = "⚠️" if module.issues else "✅"
+            table.add_row(TableRow(cells=[status, module.name, module.type_name, f"v{module.version}"]))
+            for issue in module.issues:
+                table.add_row(TableRow(f"      - {issue}"))
+        print()
+        print(table.render())
+
+    def search_modules(self, args) -> None:
+        """Search module names, descriptions and instruction files."""
+        start = time.perf_counter()
+        discovery = self.discovery
+        hits = discovery.search_index().search(" ".join(args.query), args.limit)
+        elapsed = time.perf_counter() - start
+        by_name = {record.name: record for record in discovery.records()}
+        if args.format != "text":
+            results = [dict(by_name[hit.name].to_dict(), score=round(hit.score, 4), matched=list(hit.matched))
+                       for hit in hits]
+            if args.format == "json":
+                print(json.dumps(results, indent=2, ensure_ascii=False))
+            else:
+                for result in results:
+                    print(json.dumps(result, ensure_ascii=False))
+            return
+
+        if not hits:
+            print(f"🔍 No modules match '{' '.join(args.query)}'.")
+            return
+        print(f"🔍 {len(hits)} result(s) in {elapsed * 1000:.1f}ms:")
+        for hit in hits:
+            record = by_name[hit.name]
+            print(f"   {hit.score:6.2f}  {record.qualified_name}")
+            if record.description:
+                print(f"           {record.description}")
+            print(f"           matched: {', '.join(hit.matched)}")
+
+    def show_graph(self, args) -> None:
+        """Show module dependencies: order, cycles and what depends on what."""
+        graph = self.discovery.graph()
+        for name in args.module:
+            if graph.id(name) is None:
+                self._exit_module_not_found(name)
+        focus = [graph.names[graph.id(name)] for name in args.module]
+        if focus:
+            graph = graph.subgraph(focus)
+
+        if args.format == "json":
+            print(json.dumps(graph.to_dict(), indent=2, ensure_ascii=False))
+            return
+        if args.format == "dot":
+            print(graph.to_dot(highlight=focus))
+            return
+
+        if focus:
+            for name in focus:
+                print(f"📦 {name}")
+                print(f"   requires:     {', '.join(graph.dependencies(name)) or '-'}")
+                print(f"   required by:  {', '.join(graph.dependents(name)) or '-'}")
+                print(f"   a change affects: {', '.join(graph.dependents(name, transitive=True)) or 'only itself'}")
+        else:
+            print(f"📦 {len(graph)} modules, dependencies first:")
+            for name in graph.topological_order():
+                deps = graph.dependencies(name)
+                print(f"   {name}" + (f"  ->  {', '.join(deps)}" if deps else ""))
+        cycles = graph.cycles()
+        if cycles:
+            print(f"\n⚠️  {len(cycles)} requirement cycle(s):")
+            for group in cycles:
+                print(f"   - {' <-> '.join(group)}")
+        unresolved = sum(len(urls) for urls in graph.unresolved.values())
+        if unresolved:
+            print(f"\n🔗 {unresolved} requirement(s) point at modules that are not in this project (see --format json).")
+
+    def show_module_info(self, args) -> None:
+        """Show module info for one or more modules (or all of them)."""
+        if args.all:
+            modules = self.discovery.iter_records() if args.format == "jsonl" else self.discovery.records()
+        elif args.module:
+            modules = []
+            for name in args.module:
+                module = self.discovery.find(name)
+                if not module:
+                    self._exit_module_not_found(name)
+                modules.append(module)
+        else:
+            self.logger.error("❌ Specify at least one module with -m, or use --all.")
+            sys.exit(2)
+
+        if args.format != "text":
+            write_records(modules, args.format)
+            return
+        for module in modules:
+            self._print_module_info(module)
+
+    def _print_module_info(self, module: ModuleRecord) -> None:
+        from project.tui_graphic import TableColumn, TableFormatter, TableRow
+
+        table = TableFormatter(table_width=shutil.get_terminal_size().columns, fit_mode="wrap")
+        table.set_title(f"📦 MODULE INFORMATION: {module.name}")
+        table.set_columns([TableColumn(min_width=12, max_width=26), TableColumn(min_width=20)])
+        reqs = ", ".join(module.requirements) if module.requirements else "None"
+        for label, value in (
+            ("📁 Path", module.path),
+            ("📂 Type", module.type_name),
+            ("🏷️ Version", module.version),
+            ("🔗 Repo URL", module.repo_url or "N/A"),
+            ("🧱 Requirements", reqs),
+            ("🔄 Has Refresh Script", "Yes" if module.has_refresh_script else "No"),
+            ("🚀 Has Initializer", "Yes" if module.has_initializer else "No"),
+        ):
+            table.add_row(TableRow(cells=[label, value]))
+        if module.issues:
+            table.add_row(TableRow("⚠️  Issues:"))
+            for issue in module.issues:
+                table.add_row(TableRow(f"    - {issue}"))
+        print()
+        print(table.render())
+
+    def install_requirements(self, args) -> None:
+        """Install the merged requirements of the project and all modules through the wheelhouse."""
+        from project.tui_graphic import TableColumn, TableFormatter, TableRow
+
+        installer = WheelhouseInstaller(project_requirement_files(self.discovery.records()), jobs=args.jobs)
+        try:
+            packages = installer.resolve()
+            source = "wheelhouse, no index" if installer.warm else "package index"
+            table = TableFormatter(table_width=shutil.get_terminal_size().columns, fit_mode="wrap")
+            table.set_title(f"🧱 {len(packages)} packages resolved from {source}")
+            table.set_columns([TableColumn("Requirement", min_width=12), TableColumn("Version", max_width=16),
+                               TableColumn("Required by", min_width=12)])
+            versions = {canonical_name(p.name): p.version for p in packages}
+            for entry in installer.merged.entries():
+                table.add_row(TableRow(cells=[entry.line(), versions.get(canonical_name(entry.name), "-"),
+                                              ", ".join(entry.sources)]))
+            for line, sources in installer.merged.direct_references().items():
+                table.add_row(TableRow(cells=[line, "direct", ", ".join(sources)]))
+            print()
+            print(table.render())
+            transitive = sum(1 for p in packages if not p.requested)
+            if transitive:
+                print(f"   + {transitive} transitive dependencies")
+
+            installer.build(installer.download(packages))
+            installer.install(packages)
+        except RuntimeError as e:
+            self.logger.error(f"❌ {e}")
+            sys.exit(1)
+        finally:
+            installer.close()
+
+        timings = " · ".join(f"{phase} {installer.timings[phase]:.1f}s" for phase in REQUIREMENT_PHASES)
+        self.logger.info(f"✅ Requirements installed ({timings})")
+
+    def update_workspace(self, args) -> None:
+        """Update VS Code workspace file."""
+        discovery = self.discovery
+        overrides = {}
+
+        mode = "default"
+        if args.all:
+            mode = "all"
+        elif args.ignore_overrides:
+            mode = "ignore_overrides"
+
+        for name in args.module:
+            module = discovery.find(name)
+            if not module:
+                self._exit_module_not_found(name)
+
+            # Toggle against the module's visibility under the chosen mode
+            new_visibility = not module_visible(module, mode)
+            overrides[module.name] = new_visibility
+            self.logger.info(f"Temporarily toggling workspace visibility for {module.name} to {new_visibility}")
+
+        update = update_workspace_file(discovery, mode, overrides)
+        if not update.written:
+            self.logger.info(f"✅ Workspace file already up to date: {update.path}")
+            return
+        for folder in update.added:
+            print(f"  + {folder}")
+        for folder in update.removed:
+            print(f"  - {folder}")
+        self.logger.info(f"✅ Workspace file updated at: {update.path} "
+                         f"({len(update.added)} added, {len(update.removed)} removed)")
+
+    def update_framework(self, args) -> None:
+        """Update adhd_framework.py (and requirements.txt with --all) from the source repository."""
+        names = ["adhd_framework.py"] + (["requirements.txt"] if args.all else [])
+        updater = FrameworkFileUpdater(repo_url=args.repo_url, ref=args.ref)
+
+        start = time.perf_counter()
+        results = updater.fetch_all(names)
+        elapsed = time.perf_counter() - start
+
+        failed = False
+        for fetched in results:
+            if fetched.status == "failed":
+                self.logger.error(f"❌ {fetched.name}: {fetched.error}")
+                failed = True
+            elif fetched.status == "unchanged":
+                self.logger.info(f"✅ {fetched.name} is up to date.")
+                updater.remember(fetched)
+            elif args.dry_run:
+                local = Path(fetched.name).read_bytes() if Path(fetched.name).exists() else None
+                self.logger.info(f"⬆️  {fetched.name} has an update (dry run, not applied):")
+                print(unified_file_diff(fetched.name, local, fetched.content), end="")
+            else:
+                updater.apply(fetched)
+                updater.remember(fetched)
+                self.logger.info(f"⬆️  Updated {fetched.name}.")
+        updater.save()
+        self.logger.info(f"Checked {len(results)} file(s) in {elapsed:.2f}s.")
+        if failed:
+            self.logger.error("❌ Failed to update framework.")
+            sys.exit(1)
+
+
+# -----------------------------------------------------------------------------
+# Daemon mode (`serve`): keep discovery and imported cores warm between calls
+# -----------------------------------------------------------------------------
+
+DAEMON_SOCKET_FILE = FRAMEWORK_DATA_DIR / "daemon.sock"
+# Seconds a client may stall on the socket before the daemon drops it; requests
+# are served one at a time, so an idle client would otherwise block everyone
+DAEMON_CLIENT_TIMEOUT = 5.0
+
+# Global options that only make sense in the calling process
+_LOCAL_ONLY_OPTIONS = ("--profile-startup", "--force-reinstall-reqs", "--clone-strategy", "--mirror",
+                       "--trace", "--trace-summary", "--trace-top")
+
+
+class _RoutedStream(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr inside the daemon.
+
+    While a request is being served, writes are forwarded to the client as
+    {"stream": name, "data": text} lines; otherwise they go to the daemon's
+    own terminal. Installed before anything creates log handlers, so logger
+    output bound to sys.stderr follows the request too.
+    """
+
+    def __init__(self, name: str, fallback):
+        self.name = name
+        self.fallback = fallback
+        self.send = None
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if self.send is not None:
+            self.send({"stream": self.name, "data": text})
+        else:
+            self.fallback.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if self.send is None:
+            self.fallback.flush()
+
+
+class FrameworkDaemon:
+    """Serve forwarded CLI calls over a Unix socket from one warm process.
+
+    Requests are handled one at a time with the same ADHDFramework, so the
+    module discovery and every imported core stay loaded; a client that does
+    not send its request (or stops reading output) within
+    DAEMON_CLIENT_TIMEOUT seconds is dropped. Before each request the module
+    folders and root .config are stat-ed; any change drops the memoized
+    discovery. If adhd_framework.py itself changes, the daemon exits
+    after answering so the next call runs the new code in-process.
+    """
+
+    def __init__(self, framework: "ADHDFramework", socket_path: Path = DAEMON_SOCKET_FILE):
+        self.framework = framework
+        self.socket_path = socket_path
+        self._parser = setup_parser()
+        self._script_mtime = self._own_mtime()
+        self._signature = self._fs_signature()
+        self._running = True
+
+    @staticmethod
+    def _own_mtime() -> int:
+        try:
+            return os.stat(__file__).st_mtime_ns
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _fs_signature():
+        try:
+            config_mtime = ROOT_CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            config_mtime = None
+        return _module_dir_keys(), config_mtime
+
+    def serve_forever(self) -> None:
+        import socket
+
+        if not hasattr(socket, "AF_UNIX"):
+            self.framework.logger.error("❌ Daemon mode needs Unix domain sockets, which this platform lacks.")
+            sys.exit(1)
+        if ping_daemon():
+            self.framework.logger.error(f"❌ A daemon is already serving this project ({self.socket_path}).")
+            sys.exit(1)
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        stdout = sys.stdout = _RoutedStream("stdout", sys.stdout)
+        stderr = sys.stderr = _RoutedStream("stderr", sys.stderr)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(self.socket_path))
+            server.listen(16)
+            self.framework.logger.info(f"🛰️  ADHD daemon serving {Path.cwd()} on {self.socket_path} (Ctrl+C to stop)")
+            while self._running:
+                conn, _ = server.accept()
+                with conn:
+                    self._handle(conn, stdout, stderr)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            sys.stdout, sys.stderr = stdout.fallback, stderr.fallback
+
+    def _handle(self, conn, stdout: _RoutedStream, stderr: _RoutedStream) -> None:
+        connected = [True]
+
+        def send(message: dict) -> None:
+            # A client that went away (e.g. `adhd list | head`) must not take the daemon down
+            if not connected[0]:
+                return
+            try:
+                conn.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            except OSError:
+                connected[0] = False
+
+        conn.settimeout(DAEMON_CLIENT_TIMEOUT)
+        try:
+            request = json.loads(conn.makefile("r", encoding="utf-8").readline() or "{}")
+        except (OSError, ValueError):
+            # Timed out, reset, or not a JSON request line
+            return
+        if request.get("control") == "ping":
+            send({"exit": 0})
+            return
+        if request.get("control") == "stop":
+            self._running = False
+            send({"exit": 0})
+            return
+
+        signature = self._fs_signature()
+        if signature != self._signature:
+            self._signature = signature
+            self.framework.discovery.invalidate()
+
+        os.environ["COLUMNS"] = str(request.get("columns", 80))
+        stdout.send = stderr.send = send
+        code = 0
+        try:
+            args = self._parser.parse_args(request.get("argv", []))
+            spec = COMMANDS.get(args.command)
+            if spec is None or not spec.daemon:
+                print(f"Command '{args.command}' is not served by the daemon.", file=sys.stderr)
+                code = 2
+            else:
+                self.framework.run(args)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            stdout.send = stderr.send = None
+
+        send({"exit": code})
+        if self._own_mtime() != self._script_mtime:
+            self._running = False
+
+
+def _daemon_call(request: dict, on_message=None) -> Optional[int]:
+    """Send one request to the project's daemon; None if no daemon answered."""
+    if not DAEMON_SOCKET_FILE.exists():
+        return None
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(str(DAEMON_SOCKET_FILE))
+            client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        except OSError:
+            # Stale socket file or daemon gone: run in-process instead
+            return None
+        for line in client.makefile("r", encoding="utf-8"):
+            message = json.loads(line)
+            if "exit" in message:
+                return message["exit"]
+            if on_message:
+                on_message(message)
+    finally:
+        client.close()
+    # Connection dropped mid-request
+    print("❌ Lost connection to the ADHD daemon.", file=sys.stderr)
+    return 1
+
+
+def ping_daemon() -> bool:
+    return _daemon_call({"control": "ping"}) == 0
+
+
+def stop_daemon() -> bool:
+    return _daemon_call({"control": "stop"}) == 0
+
+
+def forward_to_daemon(argv: List[str]) -> Optional[int]:
+    """Run a CLI call in the daemon if one is serving this project.
+
+    Returns the exit code, or None when the call should run in-process
+    (no daemon, ADHD_NO_DAEMON set, or options that only apply locally).
+    """
+    if os.environ.get("ADHD_NO_DAEMON") or any(arg.split("=", 1)[0] in _LOCAL_ONLY_OPTIONS for arg in argv):
+        return None
+
+    def relay(message: dict) -> None:
+        stream = sys.stderr if message.get("stream") == "stderr" else sys.stdout
+        stream.write(message.get("data", ""))
+        stream.flush()
+
+    columns = shutil.get_terminal_size().columns
+    return _daemon_call({"argv": argv, "columns": columns}, on_message=relay)
+
+
+# -----------------------------------------------------------------------------
+# Watch mode (`watch`): refresh only what an edit touched
+# -----------------------------------------------------------------------------
+
+def _is_watched_path(rel_path: str) -> bool:
+    """True for paths inside a module folder that can affect refresh or discovery."""
+    parts = rel_path.split("/")
+    if parts[0] not in MODULE_TYPE_DIRS:
+        return False
+    if len(parts) > 1 and not _is_module_dir_name(parts[1]):
+        return False
+    if any(part in _FINGERPRINT_SKIP_DIRS or part.endswith(".partial") for part in parts[1:]):
+        return False
+    return not parts[-1].endswith((".pyc", ".swp", ".swx", "~"))
 
-    update_framework_parser = subparsers.add_parser('update-framework', aliases=['uf'], help='Update adhd_framework.py from source repository')
-    update_framework_parser.add_argument('--all', '-a', action='store_true', help='Also update requirements.txt')
-    update_framework_parser.add_argument('--dry-run', '-n', action='store_true', help='Check for updates without applying')
+
+class _InotifyWatcher:
+    """Recursive inotify watch over the module type folders (Linux, via ctypes).
+
+    Folders created after start are picked up as their IN_CREATE arrives. A
+    queue overflow is reported as a change to every type folder.
+    """
+
+    _IN_ATTRIB = 0x00000004
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_DELETE_SELF = 0x00000400
+    _IN_Q_OVERFLOW = 0x00004000
+    _IN_IGNORED = 0x00008000
+    _IN_ISDIR = 0x40000000
+    _IN_NONBLOCK = 0x00000800
+    _IN_CLOEXEC = 0x00080000
+    _MASK = (_IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+             | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF)
+
+    def __init__(self):
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self._ctypes = ctypes
+        self._fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        try:
+            self._add(".", recursive=False)
+            for type_dir in MODULE_TYPE_DIRS:
+                if os.path.isdir(type_dir):
+                    self._add(type_dir)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, rel_dir: str, recursive: bool = True) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(rel_dir), self._MASK)
+        if wd < 0:
+            errno = self._ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {rel_dir}: {os.strerror(errno)}")
+        self._dirs[wd] = rel_dir
+        if not recursive:
+            return
+        try:
+            with os.scandir(rel_dir) as it:
+                subdirs = [e.name for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        for name in subdirs:
+            child = f"{rel_dir}/{name}"
+            if _is_watched_path(child):
+                self._add(child)
+
+    def wait(self, timeout: Optional[float] = None) -> set:
+        """Block until something changes (or timeout passes); return the changed relative paths."""
+        import select
+        import struct
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = struct.unpack_from("iIII", data, offset)
+            offset += 16
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+            offset += length
+
+            if mask & self._IN_Q_OVERFLOW:
+                changed.update(MODULE_TYPE_DIRS)
+                continue
+            parent = self._dirs.get(wd)
+            if mask & self._IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if parent is None:
+                continue
+            if parent == ".":
+                # Only the type folders themselves matter at the project root
+                if name in MODULE_TYPE_DIRS and mask & self._IN_ISDIR and mask & (self._IN_CREATE | self._IN_MOVED_TO):
+                    self._add_quietly(name)
+                    changed.add(name)
+                continue
+            rel_path = f"{parent}/{name}" if name else parent
+            if not _is_watched_path(rel_path):
+                continue
+            changed.add(rel_path)
+            if mask & self._IN_ISDIR and mask & (self._IN_CREATE | self._IN_MOVED_TO):
+                self._add_quietly(rel_path)
+        return changed
+
+    def _add_quietly(self, rel_dir: str) -> None:
+        try:
+            self._add(rel_dir)
+        except OSError:
+            pass  # Deleted again before we got to it, or out of watches
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingWatcher:
+    """Fallback watcher that stats every file under the module type folders each interval."""
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    @staticmethod
+    def _scan() -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for type_dir in MODULE_TYPE_DIRS:
+            for dirpath, dirnames, filenames in os.walk(type_dir):
+                rel_dir = dirpath.replace(os.sep, "/")
+                dirnames[:] = [d for d in dirnames if _is_watched_path(f"{rel_dir}/{d}")]
+                for filename in filenames:
+                    rel_path = f"{rel_dir}/{filename}"
+                    if not _is_watched_path(rel_path):
+                        continue
+                    try:
+                        st = os.stat(rel_path)
+                    except OSError:
+                        continue
+                    snapshot[rel_path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> set:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+            snapshot = self._scan()
+            changed = {p for p in snapshot.keys() | self._snapshot.keys() if snapshot.get(p) != self._snapshot.get(p)}
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+class ModuleWatcher:
+    """React to edits in module folders the way `refresh` and `workspace` would.
+
+    Events are debounced into batches. Each batch touches only the module
+    folders it names: a changed folder whose refresh inputs differ from the
+    last run (RefreshState) gets its refresh script rerun, dependencies
+    first. When a module is added or removed, or an instructions file or
+    config template is edited, the modules that collect those files from
+    every module (PROJECT_INPUT_CONSUMERS) are checked too, and an edited
+    template is merged into .config first. Module discovery is redone only
+    when an init.yaml, refresh.py or __init__.py appeared, disappeared or
+    changed, and the workspace file is regenerated only when that changed
+    which modules are visible in it.
+    """
+
+    def __init__(self, framework: "ADHDFramework", debounce: float = 0.3, poll: bool = False, interval: float = 1.0):
+        self.framework = framework
+        self.logger = framework.logger
+        self.discovery = framework.discovery
+        self.debounce = debounce
+        self.state = RefreshState()
+        self.watcher = None
+        if not poll:
+            try:
+                self.watcher = _InotifyWatcher()
+            except OSError as e:
+                self.logger.warning(f"⚠️  inotify unavailable ({e}); polling every {interval}s instead.")
+        if self.watcher is None:
+            self.watcher = _PollingWatcher(interval)
+        self._keys = _module_dir_keys()
+        records = self.discovery.records()
+        self._index(records)
+        self.state.set_project(records)
+
+    def _index(self, records: List[ModuleRecord]) -> None:
+        root = Path.cwd()
+        self._by_dir = {}
+        for record in records:
+            path = Path(record.path)
+            try:
+                rel = (path if path.is_absolute() else root / path).relative_to(root).as_posix()
+            except ValueError:
+                continue
+            self._by_dir[rel] = record
+        self._visibility = self._visible(records)
+
+    @staticmethod
+    def _visible(records: List[ModuleRecord]) -> Dict[str, tuple]:
+        return {r.path: (r.shows_in_workspace, r.type_shows_in_workspace) for r in records}
+
+    def run(self) -> None:
+        kind = "inotify" if isinstance(self.watcher, _InotifyWatcher) else "polling"
+        self.logger.info(f"👀 Watching {len(self._by_dir)} modules ({kind}, Ctrl+C to stop)")
+        try:
+            while True:
+                changed = self.watcher.wait()
+                # Debounce: keep collecting until the tree has been quiet for a moment
+                while changed:
+                    more = self.watcher.wait(self.debounce)
+                    if not more:
+                        break
+                    changed |= more
+                if changed:
+                    self.handle(changed)
+        except KeyboardInterrupt:
+            self.logger.info("👋 Stopped watching.")
+        finally:
+            self.watcher.close()
+
+    def handle(self, changed: set) -> None:
+        """Process one debounced batch of changed paths."""
+        if any(path in MODULE_TYPE_DIRS for path in changed):
+            # A type folder itself changed (created, or an overflowed event queue)
+            module_dirs = set(self._keys) | set(_module_dir_keys())
+        else:
+            module_dirs = {"/".join(path.split("/")[:2]) for path in changed if "/" in path}
+
+        structural = False
+        for module_dir in module_dirs:
+            key = _module_dir_key(module_dir) if os.path.isdir(module_dir) else None
+            if key != self._keys.get(module_dir):
+                structural = True
+                if key is None:
+                    self._keys.pop(module_dir, None)
+                else:
+                    self._keys[module_dir] = key
+
+        if structural:
+            self.discovery.invalidate()
+            records = self.discovery.records()
+            visibility = self._visible(records)
+            workspace_changed = visibility != self._visibility
+            self._index(records)
+            if workspace_changed:
+                self._regenerate_workspace()
+
+        records = self.discovery.records()
+        if any(path.endswith("/" + CONFIG_TEMPLATE_NAME) for path in changed):
+            self.framework._merge_config_templates(records)
+        # Modules came or went, or an instructions file or config template
+        # changed: the scripts that collect those files are candidates too
+        consumers = set(self.state.set_project(records))
+        module_dirs |= {d for d, record in self._by_dir.items() if record.name in consumers}
+
+        config = load_root_config()
+        stale = set()
+        for module_dir in module_dirs:
+            record = self._by_dir.get(module_dir)
+            if record is not None and record.has_refresh_script and not self.state.is_current(record, config):
+                stale.add(record.name)
+        if not stale:
+            return
+
+        skip = [r.name for r in records if r.name not in stale]
+        results = RefreshScheduler(records, 1, runner=controller_refresh_runner(self.discovery), skip=skip,
+                                   graph=self.discovery.graph()).run(on_result=lambda result: print(_refresh_status_line(result)))
+        # Fingerprint after the run, so the scripts' own writes (to their
+        # folders or to instructions files) don't retrigger them
+        self.state.set_project(records)
+        config = load_root_config()
+        by_name = {r.name: r for r in records}
+        for result in results:
+            if result.ok:
+                self.state.mark(by_name[result.name], config)
+        self.state.save()
+
+    def _regenerate_workspace(self) -> None:
+        try:
+            update = update_workspace_file(self.discovery)
+        except Exception as e:
+            self.logger.error(f"❌ Failed to regenerate workspace file: {e}")
+            return
+        if update.written:
+            changes = [f"+{folder}" for folder in update.added] + [f"-{folder}" for folder in update.removed]
+            self.logger.info(f"🗂️  Module visibility changed; workspace file updated at: {update.path} ({', '.join(changes)})")
+
+
+# -----------------------------------------------------------------------------
+# Requirements installer (`req`): one resolve, shared wheelhouse
+# -----------------------------------------------------------------------------
+
+# Wheels built or downloaded for any project on this machine
+WHEELHOUSE_DIR = CACHE_DIR / "wheelhouse"
+
+REQUIREMENT_PHASES = ("resolve", "download", "build", "install")
+_SDIST_SUFFIXES = (".tar.gz", ".zip", ".tar.bz2", ".tgz")
+
+
+class ResolvedPackage(NamedTuple):
+    """One distribution in the resolved install set."""
+    name: str
+    version: str
+    requested: bool
+
+
+def _pip(args: List[str]) -> subprocess.CompletedProcess:
+    with TRACER.span(f"pip {args[0]}"):
+        return subprocess.run(
+            [sys.executable, "-m", "pip", *args, "--disable-pip-version-check"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL, text=True,
+        )
+
+
+def _pip_error(proc: subprocess.CompletedProcess) -> str:
+    lines = (proc.stderr or proc.stdout or "").strip().splitlines()
+    errors = [line for line in lines if line.startswith("ERROR:")]
+    return (errors or lines or [f"pip exited with {proc.returncode}"])[-1]
+
+
+class WheelhouseInstaller:
+    """Install the merged requirements of a whole project through a shared wheelhouse.
+
+    1. resolve:  one pip dry run over all requirements (try the wheelhouse
+                 alone first; when that is enough, nothing else goes online)
+    2. download: fetch missing pinned distributions, several pip processes at once
+    3. build:    turn downloaded sdists into wheels, in parallel
+    4. install:  a single `pip install --no-index` from the wheelhouse
+
+    URL and editable requirements cannot be cached by version and are
+    installed afterwards with a normal pip call.
+    """
+
+    def __init__(self, req_files: List[Tuple[Path, str]], wheelhouse: Path = WHEELHOUSE_DIR, jobs: int = 4):
+        self.merged = MergedRequirements()
+        for path, source in req_files:
+            self.merged.add_file(path, source)
+        self.wheelhouse = wheelhouse
+        self.jobs = max(1, jobs)
+        self.timings = dict.fromkeys(REQUIREMENT_PHASES, 0.0)
+        self.warm = False
+        self._workdir = Path(tempfile.mkdtemp(prefix="adhd_req_"))
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            with TRACER.span(f"req {name}"):
+                yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+
+    def _write(self, filename: str, lines: List[str]) -> str:
+        path = self._workdir / filename
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return str(path)
+
+    def resolve(self) -> List[ResolvedPackage]:
+        """Pin the complete install set. Raises RuntimeError on conflicts or resolver errors."""
+        conflicts = self.merged.conflicts()
+        if conflicts:
+            raise RuntimeError("conflicting requirements:\n" + "\n".join(f"      - {c}" for c in conflicts))
+        with self.phase("resolve"):
+            requirements = self._write("requirements.txt", self.merged.index_lines())
+            self.wheelhouse.mkdir(parents=True, exist_ok=True)
+            base = ["install", "--dry-run", "--ignore-installed", "--quiet", "--report", "-", "-r", requirements]
+            proc = _pip(base + ["--no-index", "--find-links", str(self.wheelhouse)])
+            self.warm = proc.returncode == 0
+            if not self.warm:
+                proc = _pip(base + ["--find-links", str(self.wheelhouse)])
+                if proc.returncode != 0:
+                    raise RuntimeError(f"could not resolve requirements: {_pip_error(proc)}")
+            report = json.loads(proc.stdout)
+        return [
+            ResolvedPackage(item["metadata"]["name"], item["metadata"]["version"], bool(item.get("requested")))
+            for item in report.get("install", [])
+            if not item.get("is_direct")
+        ]
+
+    def download(self, packages: List[ResolvedPackage]) -> List[Path]:
+        """Fetch pinned distributions into the wheelhouse; returns the sdists that need building."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self.warm or not packages:
+            return []
+        chunks = [packages[i::self.jobs] for i in range(min(self.jobs, len(packages)))]
+
+        def fetch(chunk: List[ResolvedPackage]) -> subprocess.CompletedProcess:
+            pins = [f"{p.name}=={p.version}" for p in chunk]
+            return _pip(["download", "--no-deps", "--dest", str(self.wheelhouse), "--find-links", str(self.wheelhouse), *pins])
+
+        with self.phase("download"), ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            procs = list(pool.map(fetch, chunks))
+        failed = [p for p in procs if p.returncode != 0]
+        if failed:
+            raise RuntimeError(f"download failed: {_pip_error(failed[0])}")
+
+        wanted = {(canonical_name(p.name), p.version) for p in packages}
+        sdists = []
+        for path in self.wheelhouse.iterdir():
+            if path.name.endswith(_SDIST_SUFFIXES):
+                stem = next(path.name[:-len(s)] for s in _SDIST_SUFFIXES if path.name.endswith(s))
+                name, _, version = stem.rpartition("-")
+                if (canonical_name(name), version) in wanted:
+                    sdists.append(path)
+        return sdists
+
+    def build(self, sdists: List[Path]) -> None:
+        """Build wheels for downloaded sdists (in parallel) and drop the sdists."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not sdists:
+            return
+
+        def build_one(sdist: Path) -> subprocess.CompletedProcess:
+            proc = _pip(["wheel", "--no-deps", "--wheel-dir", str(self.wheelhouse), str(sdist)])
+            if proc.returncode == 0:
+                sdist.unlink()
+            return proc
+
+        with self.phase("build"), ThreadPoolExecutor(max_workers=min(self.jobs, len(sdists))) as pool:
+            procs = list(pool.map(build_one, sdists))
+        failed = [p for p in procs if p.returncode != 0]
+        if failed:
+            raise RuntimeError(f"wheel build failed: {_pip_error(failed[0])}")
+
+    def install(self, packages: List[ResolvedPackage]) -> None:
+        with self.phase("install"):
+            if packages:
+                pins = self._write("pins.txt", [f"{p.name}=={p.version}" for p in packages])
+                proc = _pip(["install", "--no-index", "--find-links", str(self.wheelhouse), "-r", pins])
+                if proc.returncode != 0:
+                    raise RuntimeError(f"install failed: {_pip_error(proc)}")
+            direct = list(self.merged.direct_references())
+            if direct:
+                proc = _pip(["install", *direct])
+                if proc.returncode != 0:
+                    raise RuntimeError(f"install of direct references failed: {_pip_error(proc)}")
+
+    def close(self) -> None:
+        shutil.rmtree(self._workdir, ignore_errors=True)
+
+
+def project_requirement_files(records: List[ModuleRecord]) -> List[Tuple[Path, str]]:
+    """The root requirements.txt and every module's, labelled with who they belong to."""
+    files = [(Path("requirements.txt"), "project")]
+    seen = {Path("requirements.txt").resolve()}
+    for record in records:
+        path = Path(record.path) / "requirements.txt"
+        if path.exists() and path.resolve() not in seen:
+            seen.add(path.resolve())
+            files.append((path, record.name))
+    return [(path, source) for path, source in files if path.exists()]
+
+
+# -----------------------------------------------------------------------------
+# Parallel project init (init --jobs N)
+# -----------------------------------------------------------------------------
+
+# Clones land here until their init.yaml says where they belong
+INIT_STAGING_DIR = FRAMEWORK_DATA_DIR / "init"
+
+
+class InitModule(NamedTuple):
+    """A module reached while resolving init.yaml: cloned now, already present, or failed."""
+    repo_url: str
+    level: int
+    name: str = ""
+    path: str = ""
+    ok: bool = True
+    cloned: bool = False
+    error: str = ""
+    seconds: float = 0.0
+    bytes: int = 0
+    requirements: Tuple[str, ...] = ()
+
+
+def read_init_yaml(module_dir: Path) -> dict:
+    """Parse a module's (or the project's) init.yaml. Raises OSError or ValueError."""
+    import yaml
+
+    text = (module_dir / "init.yaml").read_text(encoding="utf-8")
+    try:
+        data = yaml.safe_load(text) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"invalid init.yaml: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("init.yaml is not a mapping")
+    return data
+
+
+def _url_list(value) -> Tuple[str, ...]:
+    return tuple(v.strip() for v in value or () if isinstance(v, str) and v.strip())
+
+
+def _module_destination(info: dict, repo_url: str) -> Path:
+    """'<type plural>/<name>' for a module, from its init.yaml."""
+    type_name = str(info.get("type") or "").strip().lower()
+    plural = type_name if type_name in MODULE_TYPE_DIRS else f"{type_name}s"
+    if plural not in MODULE_TYPE_DIRS:
+        raise ValueError(f"unknown module type '{info.get('type')}'")
+    name = str(info.get("name") or normalize_repo_url(repo_url).rsplit("/", 1)[-1]).strip()
+    if not name or "/" in name or "\\" in name or name.startswith("."):
+        raise ValueError(f"invalid module name '{name}'")
+    return Path(plural) / name
+
+
+def _present_modules() -> Dict[str, InitModule]:
+    """Modules already in the project, keyed by normalized repo URL."""
+    present = {}
+    for entry in _scan_module_entries():
+        try:
+            info = read_init_yaml(Path(entry))
+        except (OSError, ValueError):
+            continue
+        repo_url = str(info.get("repo_url") or "")
+        if repo_url:
+            present[normalize_repo_url(repo_url)] = InitModule(
+                repo_url, 0, entry.rsplit("/", 1)[-1], entry, requirements=_url_list(info.get("requirements")),
+            )
+    return present
+
+
+def _fetch_init_module(repo_url: str, level: int, strategy: str) -> InitModule:
+    """Clone one module into staging, then move it to the folder its init.yaml asks for."""
+    placeholder = INIT_STAGING_DIR / _mirror_repo_name(repo_url)
+    result = _clone_module(placeholder, repo_url, strategy)
+    if not result.ok:
+        return InitModule(repo_url, level, ok=False, error=result.error, seconds=result.seconds)
+    staging = _staging_path(placeholder)
+    try:
+        info = read_init_yaml(staging)
+        dest = _module_destination(info, repo_url)
+        if dest.exists():
+            raise ValueError(f"{dest} already exists")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        staging.rename(dest)
+    except (OSError, ValueError) as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        return InitModule(repo_url, level, ok=False, error=str(e), seconds=result.seconds)
+    return InitModule(repo_url, level, dest.name, dest.as_posix(), True, True, "", result.seconds, result.bytes,
+                      _url_list(info.get("requirements")))
+
+
+def resolve_init_modules(root_urls: Iterable[str], jobs: int, strategy: Optional[str] = None,
+                         on_result=None) -> List[InitModule]:
+    """Resolve init.yaml modules and their requirements breadth-first, cloning what is missing.
+
+    Every repo URL is fetched at most once (compared after normalization),
+    however many modules require it. All clones of one level run
+    concurrently; their init.yaml requirements form the next level. Modules
+    already in the project are not cloned again, but their requirements are
+    still followed. Results are returned level by level.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    strategy = resolve_clone_strategy(strategy)
+    present = _present_modules()
+    seen = set()
+    results: List[InitModule] = []
+    urls = list(root_urls)
+    level = 0
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while urls:
+            fetch, next_urls, done = [], [], []
+            for url in urls:
+                key = normalize_repo_url(url)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if key in present:
+                    entry = present[key]._replace(repo_url=url, level=level)
+                    done.append(entry)
+                    if on_result:
+                        on_result(entry)
+                else:
+                    fetch.append(url)
+            with TRACER.span(f"init level {level}", modules=len(fetch)):
+                futures = [pool.submit(_fetch_init_module, url, level, strategy) for url in fetch]
+                for future in as_completed(futures):
+                    if on_result:
+                        on_result(future.result())
+            done.extend(future.result() for future in futures)
+            for entry in done:
+                next_urls.extend(entry.requirements)
+            results.extend(done)
+            urls = next_urls
+            level += 1
+    shutil.rmtree(INIT_STAGING_DIR, ignore_errors=True)
+    return results
+
+
+# -----------------------------------------------------------------------------
+# Lockfile and offline mirror (`lock`, `mirror`, --mirror)
+# -----------------------------------------------------------------------------
+
+LOCK_FILE = Path("adhd.lock")
+LOCK_VERSION = 1
+
+# Inside a mirror directory
+MIRROR_GIT_DIR = "git"
+MIRROR_WHEELS_DIR = "wheels"
+MIRROR_PINS_FILE = "requirements.lock.txt"
+
+# Where bundles given to --mirror are unpacked
+MIRROR_UNPACK_DIR = FRAMEWORK_DATA_DIR / "mirror"
+
+
+def _mirror_repo_name(repo_url: str) -> str:
+    """Stable folder name for a repo's bare mirror ('<name>-<hash>.git')."""
+    key = normalize_repo_url(repo_url)
+    slug = re.sub(r"[^a-z0-9._-]+", "_", key.rsplit("/", 1)[-1]) or "repo"
+    return f"{slug}-{hashlib.sha256(key.encode()).hexdigest()[:12]}.git"
+
+
+def _git_remote_url(module_dir: Path) -> str:
+    try:
+        return subprocess.run(
+            ["git", "-C", str(module_dir), "config", "--get", "remote.origin.url"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def installed_pins(names: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Pin the installed version of each distribution and everything it depends on.
+
+    Returns (sorted 'name==version' lines, names that are not installed).
+    Dependencies behind extras or markers that do not apply here are skipped.
+    """
+    from importlib import metadata
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        Requirement = None
+
+    versions: Dict[str, Tuple[str, str]] = {}
+    missing = []
+    queue = list(names)
+    while queue:
+        name = queue.pop()
+        key = canonical_name(name)
+        if key in versions or name in missing:
+            continue
+        try:
+            dist = metadata.distribution(name)
+        except metadata.PackageNotFoundError:
+            missing.append(name)
+            continue
+        versions[key] = (dist.metadata["Name"] or name, dist.version)
+        for requirement in dist.requires or []:
+            if Requirement is not None:
+                try:
+                    parsed = Requirement(requirement)
+                except InvalidRequirement:
+                    continue
+                if parsed.marker is None or parsed.marker.evaluate({"extra": ""}):
+                    queue.append(parsed.name)
+            elif ";" not in requirement:
+                match = _REQ_LINE.match(requirement.strip())
+                if match:
+                    queue.append(match.group("name"))
+    pins = sorted((f"{dist_name}=={version}" for dist_name, version in versions.values()), key=str.lower)
+    return pins, sorted(missing)
+
+
+def build_lock(records: List[ModuleRecord]) -> Tuple[dict, List[str]]:
+    """Collect the current commit of every module checkout and the pinned Python deps.
+
+    Returns (lock data, warnings).
+    """
+    root = Path.cwd()
+    modules: Dict[str, str] = dict(BOOTSTRAP_MODULES)
+    for record in records:
+        path = Path(record.path)
+        try:
+            rel = (path if path.is_absolute() else root / path).relative_to(root).as_posix()
+        except ValueError:
+            continue
+        modules.setdefault(rel, record.repo_url)
+
+    warnings = []
+    entries = []
+    req_files = [Path("requirements.txt")]
+    for path, repo_url in sorted(modules.items()):
+        module_dir = Path(path)
+        if not module_dir.exists():
+            continue
+        if (module_dir / "requirements.txt").exists():
+            req_files.append(module_dir / "requirements.txt")
+        commit = _git_head(module_dir)
+        repo_url = repo_url or _git_remote_url(module_dir)
+        if not commit or not repo_url:
+            warnings.append(f"{path}: not a git checkout with a known repo URL, left out of the lock")
+            continue
+        entries.append({"path": path, "repo_url": repo_url, "commit": commit})
+
+    merged = MergedRequirements()
+    for req_file in req_files:
+        if req_file.exists():
+            merged.add_file(req_file)
+    pins, missing = installed_pins(entry.name for entry in merged.entries())
+    for name in missing:
+        warnings.append(f"{name}: required but not installed, left out of the lock")
+
+    lock = {
+        "version": LOCK_VERSION,
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "modules": entries,
+        "requirements": pins,
+    }
+    return lock, warnings
+
+
+def write_lock(lock: dict, path: Path = LOCK_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp{os.getpid()}")
+    tmp_path.write_text(json.dumps(lock, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def read_lock(path: Path = LOCK_FILE) -> Optional[dict]:
+    """Load a lockfile, or None if there is none. Raises ValueError if it is unusable."""
+    try:
+        lock = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        raise ValueError(f"cannot read {path}: {e}")
+    if lock.get("version") != LOCK_VERSION:
+        raise ValueError(f"{path} has unsupported version {lock.get('version')!r}")
+    return lock
+
+
+def active_lock() -> Optional[dict]:
+    """The project's adhd.lock, or the lock shipped with the active mirror."""
+    lock = read_lock(LOCK_FILE)
+    if lock is None and os.environ.get("ADHD_MIRROR"):
+        lock = read_lock(Path(os.environ["ADHD_MIRROR"]) / LOCK_FILE.name)
+    return lock
+
+
+def pin_modules_to_lock(paths: Iterable[Path], lock: dict) -> List[str]:
+    """Move freshly cloned modules to their locked commit. Returns error messages."""
+    commits = {entry["path"]: entry["commit"] for entry in lock.get("modules", [])}
+    errors = []
+    for path in paths:
+        commit = commits.get(Path(path).as_posix())
+        if not commit:
+            continue
+        reset = ["git", "-C", str(path), "reset", "--quiet", "--hard", commit]
+        if subprocess.run(reset, capture_output=True).returncode == 0:
+            continue
+        # Not in a shallow or filtered clone yet: ask for the commit itself
+        fetch = ["git", "-C", str(path), "fetch", "--quiet", "origin", commit]
+        if subprocess.run(fetch, capture_output=True).returncode == 0 and \
+                subprocess.run(reset, capture_output=True).returncode == 0:
+            continue
+        errors.append(f"{path}: locked commit {commit[:12]} is not available")
+    return errors
+
+
+def _mirror_from(module_dir: Path, repo_url: str, target: Path) -> None:
+    """Create or update a bare mirror, preferring the local checkout over the network."""
+    if target.exists():
+        sources = [str(module_dir.resolve()), repo_url]
+        for source in sources:
+            cmd = ["git", "-C", str(target), "fetch", "--quiet", source, "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+            if subprocess.run(cmd, capture_output=True).returncode == 0:
+                return
+        raise RuntimeError(f"could not update mirror {target.name}")
+    for source in (str(module_dir.resolve()), _transport_url(repo_url)):
+        cmd = ["git", "clone", "--quiet", "--bare", source, str(target)]
+        if subprocess.run(cmd, capture_output=True).returncode == 0:
+            return
+        shutil.rmtree(target, ignore_errors=True)
+    raise RuntimeError(f"could not mirror {repo_url}")
+
+
+def build_mirror(lock: dict, dest: Path) -> List[str]:
+    """Write bare repos, wheels and the lock for offline provisioning into dest. Returns errors."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    git_dir = dest / MIRROR_GIT_DIR
+    git_dir.mkdir(parents=True, exist_ok=True)
+
+    def mirror(entry: dict) -> str:
+        try:
+            _mirror_from(Path(entry["path"]), entry["repo_url"], git_dir / _mirror_repo_name(entry["repo_url"]))
+            print(f"  - Mirrored {entry['path']}")
+            return ""
+        except RuntimeError as e:
+            return f"{entry['path']}: {e}"
+
+    with ThreadPoolExecutor(max_workers=BOOTSTRAP_JOBS) as pool:
+        errors = [e for e in pool.map(mirror, lock["modules"]) if e]
+
+    pins_file = dest / MIRROR_PINS_FILE
+    pins_file.write_text("\n".join(lock["requirements"]) + "\n", encoding="utf-8")
+    if lock["requirements"]:
+        print(f"  - Collecting wheels for {len(lock['requirements'])} packages...")
+        proc = subprocess.run(
+            [sys.executable, "-m", "pip", "wheel", "--quiet", "--wheel-dir", str(dest / MIRROR_WHEELS_DIR), "-r", str(pins_file)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+        if proc.returncode != 0:
+            errors.append("pip wheel failed: " + (proc.stderr.strip().splitlines() or ["no output"])[-1])
+    write_lock(lock, dest / LOCK_FILE.name)
+    return errors
+
+
+def _unpack_mirror(bundle: Path) -> Path:
+    """Extract a mirror bundle (tar) once; reused until the bundle changes."""
+    import tarfile
+
+    target = MIRROR_UNPACK_DIR / bundle.name.split(".")[0]
+    stamp = target / ".bundle"
+    st = bundle.stat()
+    key = f"{bundle.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+    if stamp.exists() and stamp.read_text() == key:
+        return target
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True)
+    with tarfile.open(bundle) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(target, filter="data")
+        else:
+            tar.extractall(target)
+    stamp.write_text(key)
+    return target
+
+
+def activate_mirror(source: Path) -> Path:
+    """Route every git clone and pip install of this process (and its children) to a mirror.
+
+    Git gets url.<mirror>.insteadOf rules for each locked repo URL through
+    GIT_CONFIG_* variables; pip gets PIP_NO_INDEX/PIP_FIND_LINKS and the
+    locked pins as constraints. Module cores that clone or install on their
+    own (init, req) are redirected the same way.
+    """
+    mirror = (_unpack_mirror(source) if source.is_file() else source).resolve()
+    lock = read_lock(mirror / LOCK_FILE.name)
+    if lock is None:
+        raise ValueError(f"{source} is not an ADHD mirror (no {LOCK_FILE.name})")
+
+    count = int(os.environ.get("GIT_CONFIG_COUNT", "0") or 0)
+    for entry in lock["modules"]:
+        url = entry["repo_url"]
+        target = (mirror / MIRROR_GIT_DIR / _mirror_repo_name(url)).as_uri()
+        for variant in {url, url[:-4] if url.endswith(".git") else url + ".git"}:
+            os.environ[f"GIT_CONFIG_KEY_{count}"] = f"url.{target}.insteadOf"
+            os.environ[f"GIT_CONFIG_VALUE_{count}"] = variant
+            count += 1
+    os.environ["GIT_CONFIG_COUNT"] = str(count)
+
+    os.environ["PIP_NO_INDEX"] = "1"
+    os.environ["PIP_FIND_LINKS"] = str(mirror / MIRROR_WHEELS_DIR)
+    os.environ["PIP_CONSTRAINT"] = str(mirror / MIRROR_PINS_FILE)
+    os.environ["ADHD_MIRROR"] = str(mirror)
+    return mirror
+
+
+# -----------------------------------------------------------------------------
+# Framework self-update (`update-framework`)
+# -----------------------------------------------------------------------------
+
+FRAMEWORK_REPO_URL = "https://github.com/AI-Driven-Highspeed-Development/ai_driven_highspeed_development_framework_bootstrapped.git"
+FRAMEWORK_REF = "main"
+UPDATE_CACHE_FILE = FRAMEWORK_DATA_DIR / "update_cache.json"
+
+
+class FetchedFile(NamedTuple):
+    """Result of fetching one framework file from the source repository."""
+    name: str
+    status: str  # 'unchanged', 'changed' or 'failed'
+    content: Optional[bytes] = None
+    etag: str = ""
+    error: str = ""
+
+
+class FrameworkFileUpdater:
+    """Fetch framework files from the source repo and replace the local copies.
+
+    GitHub repos are read through raw.githubusercontent.com with the ETag of
+    the last fetch, so an unchanged file costs one 304 response. A local
+    path or file:// URL (a checkout or bare repo, read at ``ref`` with
+    ``git show``; or a plain folder) works as a stand-in source. Files are
+    fetched concurrently and only written when their content differs.
+    """
+
+    def __init__(self, repo_url: str = FRAMEWORK_REPO_URL, ref: str = FRAMEWORK_REF,
+                 cache_file: Path = UPDATE_CACHE_FILE):
+        self.repo_url = repo_url
+        self.ref = ref
+        self.cache_file = cache_file
+        try:
+            self._cache: Dict[str, dict] = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._cache = {}
+
+    def _local_repo(self) -> Optional[Path]:
+        if self.repo_url.startswith("file://"):
+            from urllib.parse import urlparse
+            from urllib.request import url2pathname
+            return Path(url2pathname(urlparse(self.repo_url).path))
+        if "://" not in self.repo_url and os.path.isdir(self.repo_url):
+            return Path(self.repo_url)
+        return None
+
+    def _raw_url(self, name: str) -> str:
+        match = re.match(r"^(?:https?://|git@)github\.com[/:]([^/]+)/([^/]+?)(?:\.git)?/?$", self.repo_url)
+        if not match:
+            raise ValueError(f"unsupported repository URL {self.repo_url} (use a GitHub URL or a local path)")
+        owner, repo = match.groups()
+        return f"https://raw.githubusercontent.com/{owner}/{repo}/{self.ref}/{name}"
+
+    def _cache_key(self, name: str) -> str:
+        return f"{self.repo_url}@{self.ref}:{name}"
+
+    def fetch(self, name: str) -> FetchedFile:
+        """Fetch one file. Never raises; failures are returned."""
+        try:
+            local_bytes = Path(name).read_bytes()
+        except OSError:
+            local_bytes = None
+        local_sha = hashlib.sha256(local_bytes).hexdigest() if local_bytes is not None else ""
+        cached = self._cache.get(self._cache_key(name), {})
+
+        try:
+            repo = self._local_repo()
+            if repo is not None:
+                content, etag = self._fetch_local(repo, name), ""
+            else:
+                # Only trust a 304 if the local file is still what we fetched last time
+                etag = cached.get("etag", "") if cached.get("sha256") == local_sha else ""
+                content, etag = self._fetch_github(name, etag)
+                if content is None:
+                    return FetchedFile(name, "unchanged", local_bytes, etag)
+        except Exception as e:
+            return FetchedFile(name, "failed", error=str(e))
+
+        status = "unchanged" if content == local_bytes else "changed"
+        return FetchedFile(name, status, content, etag)
+
+    def _fetch_local(self, repo: Path, name: str) -> bytes:
+        is_git = subprocess.run(["git", "-C", str(repo), "rev-parse", "--git-dir"], capture_output=True).returncode == 0
+        if not is_git:
+            return (repo / name).read_bytes()
+        proc = subprocess.run(["git", "-C", str(repo), "show", f"{self.ref}:{name}"], capture_output=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.decode(errors="replace").strip() or f"git show exited with {proc.returncode}")
+        return proc.stdout
+
+    def _fetch_github(self, name: str, etag: str) -> Tuple[Optional[bytes], str]:
+        """Return (content, etag); content is None when the server answered 304 Not Modified."""
+        from urllib.error import HTTPError
+        from urllib.request import Request, urlopen
+
+        request = Request(self._raw_url(name), headers={"User-Agent": "adhd-framework"})
+        if etag:
+            request.add_header("If-None-Match", etag)
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            request.add_header("Authorization", f"token {token}")
+        try:
+            with urlopen(request, timeout=30) as response:
+                return response.read(), response.headers.get("ETag", "")
+        except HTTPError as e:
+            if e.code == 304:
+                return None, etag
+            raise RuntimeError(f"HTTP {e.code} for {request.full_url}")
+
+    def fetch_all(self, names: List[str]) -> List[FetchedFile]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max(1, len(names))) as pool:
+            return list(pool.map(self.fetch, names))
+
+    def apply(self, fetched: FetchedFile) -> None:
+        """Atomically replace the local file with the fetched content, keeping its mode."""
+        path = Path(fetched.name)
+        tmp_path = path.with_name(f".{path.name}.tmp{os.getpid()}")
+        tmp_path.write_bytes(fetched.content)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+
+    def remember(self, fetched: FetchedFile) -> None:
+        self._cache[self._cache_key(fetched.name)] = {
+            "etag": fetched.etag,
+            "sha256": hashlib.sha256(fetched.content).hexdigest(),
+        }
+
+    def save(self) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_text(json.dumps(self._cache, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.cache_file)
+        except OSError:
+            pass
+
+
+def unified_file_diff(name: str, old: Optional[bytes], new: bytes) -> str:
+    import difflib
+
+    old_lines = (old or b"").decode("utf-8", errors="replace").splitlines(keepends=True)
+    new_lines = new.decode("utf-8", errors="replace").splitlines(keepends=True)
+    return "".join(difflib.unified_diff(old_lines, new_lines, f"a/{name}", f"b/{name}"))
+
+
+def setup_parser() -> argparse.ArgumentParser:
+    """Configure and return the argument parser."""
+    parser = argparse.ArgumentParser(
+        description="ADHD Framework CLI - AI-Driven High-speed Development Framework",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        # Global options are peeked at before parsing (peek_command), which only knows full names
+        allow_abbrev=False,
+    )
+    parser.add_argument('--force-reinstall-reqs', action='store_true',
+                        help='Run pip for all requirements even if they have not changed since the last install')
+    parser.add_argument('--clone-strategy', choices=CLONE_STRATEGIES,
+                        help='How missing modules are cloned: full history, shallow (--depth 1), '
+                             'blobless (--filter=blob:none) or reference (shared mirror cache). '
+                             'Default: $ADHD_CLONE_STRATEGY or full')
+    parser.add_argument('--mirror', metavar='PATH',
+                        help='Provision modules and packages only from a mirror directory or bundle '
+                             '(see `mirror`). Default: $ADHD_MIRROR')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Print a startup phase and import-time breakdown to stderr')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Write timing spans of this run as a Chrome trace (chrome://tracing, ui.perfetto.dev)')
+    parser.add_argument('--trace-summary', action='store_true', help='Print the slowest timing spans of this run to stderr')
+    parser.add_argument('--trace-top', type=int, default=15, metavar='N', help='Spans shown by --trace-summary (default: 15)')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    subparsers.add_parser('create-project', aliases=['cp'], help='Create a new ADHD project')
+    subparsers.add_parser('create-module', aliases=['cm'], help='Create a new module')
+    init_parser = subparsers.add_parser('init', aliases=['i'], help='Initialize project modules')
+    init_parser.add_argument('--jobs', '-j', type=int, metavar='N',
+                             help='Resolve required modules breadth-first and clone each level with N parallel workers')
+    
+    refresh_parser = subparsers.add_parser('refresh', aliases=['r'], help='Refresh project modules')
+    refresh_arg = refresh_parser.add_argument('--module', '-m', help='Refresh specific module by name')
+    refresh_parser.add_argument('--jobs', '-j', type=int, metavar='N',
+                                help='Run refresh scripts in N parallel processes, dependencies first')
+    refresh_parser.add_argument('--force', '-f', action='store_true',
+                                help='Rerun every refresh script, even for modules that did not change')
+    if argcomplete:
+        refresh_arg.completer = module_completer
+
+    list_parser = subparsers.add_parser('list', aliases=['ls'], help='List all discovered modules')
+    list_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                             help='Output format: text table, a JSON array, or one JSON object per line')
+    
+    info_parser = subparsers.add_parser('info', aliases=['in'], help='Show detailed module information')
+    info_arg = info_parser.add_argument('--module', '-m', nargs='+', action='extend', default=[],
+                                        help='Module name(s) to show information for (repeatable)')
+    info_parser.add_argument('--all', '-a', action='store_true', help='Show information for every module')
+    info_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                             help='Output format: text tables, a JSON array, or one JSON object per line')
+    if argcomplete:
+        info_arg.completer = module_completer
+
+    req_parser = subparsers.add_parser('req', aliases=['rq'], help='Install requirements from all requirements.txt files')
+    req_parser.add_argument('--jobs', '-j', type=int, default=4, metavar='N',
+                            help='Parallel pip processes for downloading and building wheels (default: 4)')
+    
+    workspace_parser = subparsers.add_parser('workspace', aliases=['ws'], help='Update VS Code workspace file')
+    workspace_parser.add_argument('--all', action='store_true', help='Include all modules regardless of settings')
+    workspace_parser.add_argument('--ignore-overrides', action='store_true', help='Ignore module-level overrides')
+    workspace_arg = workspace_parser.add_argument('--module', '-m', nargs='+', action='extend', default=[],
+                                                  help='Toggle workspace visibility for these module(s) (repeatable)')
+    if argcomplete:
+        workspace_arg.completer = module_completer
+
+    watch_parser = subparsers.add_parser('watch', help='Watch module folders and rerun refresh/workspace for what changed')
+    watch_parser.add_argument('--debounce', type=float, default=0.3, metavar='SECONDS', help='Quiet time that ends a burst of changes (default: 0.3)')
+    watch_parser.add_argument('--poll', action='store_true', help='Poll file modification times instead of using inotify')
+    watch_parser.add_argument('--interval', type=float, default=1.0, metavar='SECONDS', help='Polling interval (default: 1.0)')
+
+    graph_parser = subparsers.add_parser('graph', help='Show module dependencies (order, cycles, dependents)')
+    graph_arg = graph_parser.add_argument('--module', '-m', nargs='+', action='extend', default=[],
+                                          help='Only show these modules, what they require and what requires them')
+    graph_parser.add_argument('--format', choices=('text', 'dot', 'json'), default='text', help='Output format (default: text)')
+    if argcomplete:
+        graph_arg.completer = module_completer
+
+    search_parser = subparsers.add_parser('search', help='Search modules by name, description and instructions')
+    search_parser.add_argument('query', nargs='+', help='Words to look for (typos are tolerated)')
+    search_parser.add_argument('--limit', '-n', type=int, default=10, metavar='N', help='Show at most N results (default: 10)')
+    search_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                               help='Output format: text, a JSON array, or one JSON object per line')
+
+    subparsers.add_parser('lock', help=f'Record module commits and pinned Python packages in {LOCK_FILE}')
+
+    mirror_parser = subparsers.add_parser('mirror', help='Pack locked module repos and wheels for offline provisioning')
+    mirror_parser.add_argument('directory', help='Directory to write the mirror to')
+    mirror_parser.add_argument('--archive', action='store_true', help='Also write the mirror as a single <directory>.tar bundle')
+
+    serve_parser = subparsers.add_parser('serve', help='Keep a warm daemon that serves list/info/refresh/workspace calls')
+    serve_parser.add_argument('--stop', action='store_true', help='Stop the daemon serving this project')
+
+    update_framework_parser = subparsers.add_parser('update-framework', aliases=['uf'], help='Update adhd_framework.py from source repository')
+    update_framework_parser.add_argument('--all', '-a', action='store_true', help='Also update requirements.txt')
+    update_framework_parser.add_argument('--dry-run', '-n', action='store_true', help='Show a diff of available updates without applying them')
+    update_framework_parser.add_argument('--repo-url', default=FRAMEWORK_REPO_URL, help='Framework repository (GitHub URL, local path or file:// URL)')
+    update_framework_parser.add_argument('--ref', default=FRAMEWORK_REF, help=f'Branch, tag or commit to update from (default: {FRAMEWORK_REF})')
 
     if argcomplete:
         argcomplete.autocomplete(parser)
@@ -461,14 +4080,60 @@ def setup_parser() -> argparse.ArgumentParser:
 
 
 if __name__ == "__main__":
-    # Ensure environment is ready before anything else
-    bootstrap()
+    # Tab completion answers straight from the parser, before any bootstrap work
+    if argcomplete and "_ARGCOMPLETE" in os.environ:
+        setup_parser()
+        sys.exit(0)
 
-    parser = setup_parser()
-    args = parser.parse_args()
+    spec = COMMANDS.get(peek_command(sys.argv[1:]))
 
-    if not args.command:
-        parser.print_help()
-    else:
-        framework = ADHDFramework()
-        framework.run(args)
+    # Hand the call to a warm daemon when one is serving this project
+    if spec is not None and spec.daemon:
+        exit_code = forward_to_daemon(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    # Offline provisioning: point git and pip at a mirror before anything clones or installs
+    mirror = peek_option(sys.argv[1:], '--mirror') or os.environ.get("ADHD_MIRROR")
+    if mirror:
+        try:
+            activate_mirror(Path(mirror))
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot use mirror {mirror}: {e}")
+            sys.exit(1)
+
+    trace_file = peek_option(sys.argv[1:], '--trace')
+    if trace_file or '--trace-summary' in sys.argv:
+        TRACER.enable()
+
+    profiler = StartupProfiler(enabled='--profile-startup' in sys.argv)
+    profiler.install()
+
+    try:
+        # Ensure environment is ready before anything else
+        with profiler.phase("bootstrap"):
+            bootstrap(
+                force_reinstall_reqs='--force-reinstall-reqs' in sys.argv,
+                clone_strategy=peek_option(sys.argv[1:], '--clone-strategy'),
+                read_only=spec is not None and spec.read_only,
+            )
+
+        with profiler.phase("setup_parser + parse_args"):
+            parser = setup_parser()
+            args = parser.parse_args()
+
+        if not args.command:
+            parser.print_help()
+        else:
+            # run() prepares the command's needs itself, once
+            with profiler.phase(f"run ({args.command})"):
+                ADHDFramework().run(args)
+    finally:
+        profiler.uninstall()
+        profiler.report()
+        if TRACER.enabled:
+            if trace_file:
+                TRACER.write_chrome_trace(Path(trace_file))
+                print(f"\n🔎 Trace with {len(TRACER.events)} spans written to {trace_file}", file=sys.stderr)
+            if '--trace-summary' in sys.argv:
+                TRACER.print_summary(int(peek_option(sys.argv[1:], '--trace-top') or 15))
@@ -0,0 +1,379 @@
+"""Benchmark suite for the CLI's hot paths on synthetic 10/100/1,000-module projects.
+
+Run from the repository root:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare baseline.json --threshold 0.25
+
+Everything runs offline in temporary project trees; clone and init
+benchmarks use local bare repos (skip them with --no-git). Benchmarks that need the
+ModulesController core (a cold discovery scan, workspace generation) are
+reported as skipped when it cannot be imported. Exits non-zero when a
+latency budget is exceeded or, with --compare, when a benchmark got slower
+than the baseline by more than the threshold.
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import adhd_framework  # noqa: E402
+from synthetic import graph_records, make_bare_repo, make_module_repos, make_project, synthetic_records  # noqa: E402
+
+SIZES = (10, 100, 1000)
+# Dependency graph queries are cheap enough to also time at a larger scale
+GRAPH_SIZES = (1000, 10000)
+# Worker counts for breadth-first module resolution (init --jobs N)
+INIT_JOBS = (1, 4)
+
+# Hard limits that fail the run regardless of any baseline (milliseconds)
+BUDGETS_MS = {
+    "completion_warm[1000]": 50.0,
+    "search_warm[1000]": 100.0,
+}
+
+# Slowdowns smaller than this are treated as noise when comparing (milliseconds)
+NOISE_FLOOR_MS = 1.0
+
+TABLE_SAMPLES = [
+    "plain ascii module listing line with a version number v1.2.3",
+    "✅ config_manager (MANAGER) - v0.4.1",
+    "⚠️  yaml_reading_core (CORE) - missing init.yaml field 'version'",
+    "中文模块名称 - 描述文字比较长的时候需要截断或者换行处理",
+    "mixed: café naïve 日本語 テキスト and emoji 🚀🔧📦 in one row",
+]
+
+
+def measure(fn, rounds: int, setup=None) -> dict:
+    samples = []
+    for _ in range(rounds):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples), "rounds": rounds}
+
+
+def controller_available() -> bool:
+    try:
+        from cores.modules_controller_core.modules_controller import ModulesController  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def bench_parser(rounds: int) -> dict:
+    def parse_and_dispatch():
+        parser = adhd_framework.setup_parser()
+        args = parser.parse_args(["list"])
+        spec = adhd_framework.COMMANDS[args.command]
+        getattr(adhd_framework.ADHDFramework(), spec.handler)
+
+    return {"parser_dispatch": measure(parse_and_dispatch, rounds)}
+
+
+def bench_project(size: int, rounds: int, with_controller: bool) -> dict:
+    results = {}
+    parser = adhd_framework.setup_parser()
+    with tempfile.TemporaryDirectory() as tmp:
+        make_project(Path(tmp), size, deps_per_module=min(3, size - 1))
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            index_file = adhd_framework.COMPLETION_INDEX_FILE
+            results[f"completion_cold[{size}]"] = measure(
+                lambda: adhd_framework.module_completer("", None), rounds,
+                setup=lambda: index_file.unlink() if index_file.exists() else None,
+            )
+            results[f"completion_warm[{size}]"] = measure(
+                lambda: adhd_framework.module_completer("plugins/bench_plugin_00", None), rounds * 4,
+            )
+
+            records = synthetic_records(Path(tmp))
+            adhd_framework.ModuleDiscovery()._write_cache(records, adhd_framework._module_dir_keys())
+            list_args = parser.parse_args(["list"])
+
+            def list_modules():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    adhd_framework.ADHDFramework().list_modules(list_args)
+
+            results[f"list_warm[{size}]"] = measure(list_modules, rounds)
+            results[f"module_graph[{size}]"] = measure(
+                lambda: adhd_framework.ModuleGraph(records).topological_order(), rounds,
+            )
+
+            search_file = adhd_framework.SEARCH_INDEX_FILE
+            results[f"search_cold[{size}]"] = measure(
+                lambda: adhd_framework.ModuleSearchIndex().update(records), rounds,
+                setup=lambda: search_file.unlink() if search_file.exists() else None,
+            )
+
+            def search():
+                index = adhd_framework.ModuleSearchIndex()
+                index.update(records)
+                index.search("workspace refresh cache")
+
+            results[f"search_warm[{size}]"] = measure(search, rounds * 4)
+
+            config_files = (adhd_framework.ROOT_CONFIG_FILE, adhd_framework.CONFIG_SNAPSHOT_FILE)
+            results[f"config_merge_cold[{size}]"] = measure(
+                lambda: adhd_framework.merge_config_templates(records), rounds,
+                setup=lambda: [f.unlink() for f in config_files if f.exists()],
+            )
+            results[f"config_merge_warm[{size}]"] = measure(lambda: adhd_framework.merge_config_templates(records), rounds)
+            results[f"config_load[{size}]"] = measure(adhd_framework.load_root_config, rounds * 4)
+            results[f"config_parse[{size}]"] = measure(
+                lambda: json.loads(adhd_framework.ROOT_CONFIG_FILE.read_text(encoding="utf-8")), rounds * 4,
+            )
+
+            if with_controller:
+                cache_file = adhd_framework.DISCOVERY_CACHE_FILE
+                results[f"list_cold[{size}]"] = measure(
+                    list_modules, rounds, setup=lambda: cache_file.unlink() if cache_file.exists() else None,
+                )
+                workspace_args = parser.parse_args(["workspace"])
+
+                def update_workspace():
+                    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                        adhd_framework.ADHDFramework().update_workspace(workspace_args)
+
+                results[f"update_workspace[{size}]"] = measure(update_workspace, rounds)
+            else:
+                results[f"list_cold[{size}]"] = {"skipped": "ModulesController not importable"}
+                results[f"update_workspace[{size}]"] = {"skipped": "ModulesController not importable"}
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def bench_table(size: int, rounds: int) -> dict:
+    from project.tui_graphic import TableColumn, TableFormatter, TableRow
+
+    rng = random.Random(size)
+    n_rows = size * 100
+    rows = [f"{i:06d} {rng.choice(TABLE_SAMPLES)} {'x' * rng.randint(0, 80)}" for i in range(n_rows)]
+    results = {}
+    for fit_mode in ("truncate", "wrap"):
+        def render():
+            table = TableFormatter(table_width=100, fit_mode=fit_mode)
+            table.set_title("Benchmark")
+            for row in rows:
+                table.add_row(TableRow(row))
+            table.render()
+
+        results[f"table_render_{fit_mode}[{n_rows}]"] = measure(render, rounds)
+
+    def render_columns():
+        table = TableFormatter(table_width=100)
+        table.set_columns([TableColumn("", min_width=2, max_width=2), TableColumn("Module", min_width=12),
+                           TableColumn("Type", max_width=8), TableColumn("Version", max_width=16)])
+        for i, row in enumerate(rows):
+            table.add_row(TableRow(cells=["✅", row[:40], "PLUGIN", f"v1.0.{i}"]))
+        table.render()
+
+    results[f"table_render_columns[{n_rows}]"] = measure(render_columns, rounds)
+    return results
+
+
+def bench_graph(size: int, rounds: int) -> dict:
+    """Graph build and queries on in-memory records with requirement cycles."""
+    records = graph_records(size)
+    graph = adhd_framework.ModuleGraph(records)
+    # The order must respect every requirement that is not part of a cycle
+    position = {i: p for p, i in enumerate(graph.topological_order_ids())}
+    component = graph.components()
+    for i, deps in enumerate(graph.deps):
+        for j in deps:
+            assert component[i] == component[j] or position[j] < position[i], (graph.names[i], graph.names[j])
+
+    # Queries memoize on the graph, so every round gets a fresh one
+    fresh = [graph]
+
+    def rebuild():
+        fresh[0] = adhd_framework.ModuleGraph(records)
+
+    return {
+        f"graph_build[{size}]": measure(lambda: adhd_framework.ModuleGraph(records), rounds),
+        f"graph_topo[{size}]": measure(lambda: fresh[0].topological_order_ids(), rounds, setup=rebuild),
+        f"graph_cycles[{size}]": measure(lambda: fresh[0].cycles(), rounds, setup=rebuild),
+        f"graph_affected[{size}]": measure(lambda: fresh[0].affected([records[0].name]), rounds, setup=rebuild),
+    }
+
+
+def bench_clone(rounds: int, commits: int = 20, blob_kib: int = 128) -> dict:
+    """Clone one module with every strategy from a local bare repo whose history outweighs its tree.
+
+    Each round clones into a fresh project with an empty clone cache;
+    clone_reference_warm repeats 'reference' with the cache already filled.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        bare = make_bare_repo(tmp, commits, blob_kib * 1024)
+        cache_dir = adhd_framework.CLONE_CACHE_DIR
+        adhd_framework.CLONE_CACHE_DIR = tmp / "cache"
+        projects = itertools.count()
+        try:
+            for strategy in adhd_framework.CLONE_STRATEGIES:
+                stored = []
+
+                def clone():
+                    target = tmp / f"project_{next(projects)}" / "cores" / "bench_module"
+                    result = adhd_framework._clone_module(target, str(bare), strategy)
+                    if not result.ok:
+                        raise RuntimeError(f"{strategy} clone failed: {result.error}")
+                    stored.append(result.bytes)
+
+                results[f"clone_{strategy}"] = measure(
+                    clone, rounds, setup=lambda: shutil.rmtree(adhd_framework.CLONE_CACHE_DIR, ignore_errors=True),
+                )
+                results[f"clone_{strategy}"]["bytes"] = stored[-1]
+                if strategy == "reference":
+                    results["clone_reference_warm"] = measure(clone, rounds)
+                    results["clone_reference_warm"]["bytes"] = stored[-1]
+        finally:
+            adhd_framework.CLONE_CACHE_DIR = cache_dir
+    return results
+
+
+def bench_init(rounds: int, modules: int = 40, deps: int = 3, roots: int = 4, jobs=INIT_JOBS) -> dict:
+    """Resolve and clone a tree of local bare module repos breadth-first, once per worker count.
+
+    Every round starts from an empty project and must clone each repo
+    exactly once. Local clones are CPU-bound, so extra jobs only pay off
+    with spare cores; against a real remote they overlap network round trips.
+    """
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        urls = make_module_repos(tmp, modules, deps)
+        projects = itertools.count()
+        try:
+            def new_project():
+                project = tmp / f"project_{next(projects)}"
+                project.mkdir()
+                os.chdir(project)
+
+            for n in jobs:
+                def resolve():
+                    resolved = adhd_framework.resolve_init_modules(urls[:roots], n)
+                    failed = [r for r in resolved if not r.ok]
+                    if failed:
+                        raise RuntimeError(f"init clone failed: {failed[0].repo_url}: {failed[0].error}")
+                    cloned = [r.repo_url for r in resolved if r.cloned]
+                    assert len(cloned) == len(set(cloned)), "a repo was cloned twice"
+
+                results[f"init_resolve_j{n}[{modules}]"] = measure(resolve, rounds, setup=new_project)
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "-C", str(REPO_ROOT), "rev-parse", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Print current vs baseline medians; return the names of regressed benchmarks."""
+    regressions = []
+    print(f"\n{'benchmark':<34} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, current in results.items():
+        before = baseline.get(name)
+        if not before or "median_ms" not in before or "median_ms" not in current:
+            continue
+        old, new = before["median_ms"], current["median_ms"]
+        change = (new - old) / old if old else 0.0
+        regressed = change > threshold and new - old > NOISE_FLOOR_MS
+        flag = "  ❌" if regressed else ""
+        print(f"{name:<34} {old:>9.2f}ms {new:>9.2f}ms {change:>+7.0%}{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Synthetic project sizes")
+    parser.add_argument("--graph-sizes", type=int, nargs="+", default=list(GRAPH_SIZES),
+                        help="Module counts for the dependency graph benchmarks")
+    parser.add_argument("--no-git", action="store_true", help="Skip the benchmarks that clone git repos")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark (median is reported)")
+    parser.add_argument("--output", "-o", help="Write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a previous --output file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown vs the baseline as a fraction (default: 0.25)")
+    args = parser.parse_args()
+
+    with_controller = controller_available()
+    results = bench_parser(args.rounds)
+    for size in args.sizes:
+        results.update(bench_project(size, args.rounds, with_controller))
+        results.update(bench_table(size, max(1, args.rounds // 2)))
+    for size in args.graph_sizes:
+        results.update(bench_graph(size, args.rounds))
+    if not args.no_git:
+        if shutil.which("git") is None:
+            results["clone"] = {"skipped": "git not found"}
+        else:
+            results.update(bench_clone(args.rounds))
+            results.update(bench_init(max(1, args.rounds // 2)))
+
+    print(f"{'benchmark':<34} {'median':>10} {'min':>10}")
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<34} {'skipped':>10}  ({result['skipped']})")
+        else:
+            stored = f"  ({adhd_framework.format_bytes(result['bytes'])} stored)" if "bytes" in result else ""
+            print(f"{name:<34} {result['median_ms']:>9.2f}ms {result['min_ms']:>9.2f}ms{stored}")
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    failed = False
+    for name, budget in BUDGETS_MS.items():
+        median = results.get(name, {}).get("median_ms")
+        if median is not None and median > budget:
+            print(f"❌ {name}: {median:.2f}ms exceeds the {budget:.0f}ms budget")
+            failed = True
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
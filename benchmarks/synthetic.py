@@ -0,0 +1,159 @@
+"""Synthetic ADHD project trees for benchmarks."""
+
+import json
+import os
+import random
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from adhd_framework import ModuleRecord
+
+TYPE_DIRS = {
+    "core": "cores",
+    "manager": "managers",
+    "util": "utils",
+    "plugin": "plugins",
+    "mcp": "mcps",
+}
+
+
+# Vocabulary for filler instruction files
+WORDS = (
+    "config", "logger", "module", "refresh", "workspace", "agent", "instructions", "template", "yaml",
+    "parser", "cache", "request", "response", "token", "session", "queue", "worker", "retry", "schema",
+    "export", "import", "plugin", "manager", "handler", "event", "stream", "buffer", "index", "search",
+)
+
+
+def _repo_url(name: str) -> str:
+    return f"https://example.invalid/{name}.git"
+
+
+def make_project(root: Path, n_modules: int, deps_per_module: int = 0, seed: int = 0) -> Path:
+    """Create n_modules fake modules (init.yaml, an instructions file and a .config_template) across all module types.
+
+    With deps_per_module, each module requires that many earlier modules.
+    """
+    rng = random.Random(seed)
+    types = list(TYPE_DIRS.items())
+    names = []
+    for i in range(n_modules):
+        type_name, type_dir = types[i % len(types)]
+        name = f"bench_{type_name}_{i:05d}"
+        deps = rng.sample(names, min(len(names), deps_per_module))
+        requirements = "".join(f"  - {_repo_url(dep)}\n" for dep in deps)
+        module_dir = root / type_dir / name
+        module_dir.mkdir(parents=True)
+        (module_dir / "init.yaml").write_text(
+            f"name: {name}\n"
+            f"type: {type_name}\n"
+            f"version: 1.0.{i}\n"
+            f"description: Synthetic {type_name} module number {i}\n"
+            f"repo_url: {_repo_url(name)}\n"
+            + (f"requirements:\n{requirements}" if requirements else "requirements: []\n"),
+            encoding="utf-8",
+        )
+        (module_dir / f"{name}.instructions.md").write_text(
+            f"# {name}\n\n" + " ".join(rng.choice(WORDS) for _ in range(200)) + "\n", encoding="utf-8",
+        )
+        (module_dir / ".config_template").write_text(
+            json.dumps({"enabled": True, "level": "INFO", "options": {w: i for w in rng.sample(WORDS, 8)}}),
+            encoding="utf-8",
+        )
+        names.append(name)
+    return root
+
+
+def synthetic_records(root: Path) -> List["ModuleRecord"]:
+    """ModuleRecords for a tree made by make_project, without a ModulesController."""
+    from adhd_framework import ModuleRecord
+
+    records = []
+    for type_name, type_dir in TYPE_DIRS.items():
+        for init_yaml in sorted((root / type_dir).glob("*/init.yaml")):
+            fields, requirements = {}, []
+            for line in init_yaml.read_text(encoding="utf-8").splitlines():
+                if line.startswith("  - "):
+                    requirements.append(line[4:])
+                elif ": " in line:
+                    key, value = line.split(": ", 1)
+                    fields[key] = value
+            records.append(ModuleRecord(
+                name=fields["name"], path=f"{type_dir}/{fields['name']}", type_name=type_name.upper(),
+                type_plural=type_dir, version=fields["version"], repo_url=fields["repo_url"],
+                description=fields["description"], requirements=tuple(requirements), shows_in_workspace=None,
+                type_shows_in_workspace=type_dir != "mcps", has_refresh_script=False, has_initializer=False, issues=(),
+            ))
+    return records
+
+
+def graph_records(n: int, deps_per_module: int = 3, cycles: int = 5, seed: int = 0) -> List["ModuleRecord"]:
+    """n in-memory ModuleRecords requiring earlier modules, with a few requirement cycles mixed in."""
+    from adhd_framework import ModuleRecord
+
+    rng = random.Random(seed)
+    urls = [_repo_url(f"bench_{i:05d}") for i in range(n)]
+    deps = [rng.sample(range(i), min(i, deps_per_module)) for i in range(n)]
+    for _ in range(cycles):
+        # Walk a few requirement edges down from j, then let the module reached
+        # require j again: that edge closes a cycle through the whole path
+        j = i = rng.randrange(n // 2, n)
+        for _ in range(rng.randint(1, 4)):
+            if not deps[i]:
+                break
+            i = rng.choice(deps[i])
+        if i != j:
+            deps[i].append(j)
+    return [
+        ModuleRecord(
+            name=f"bench_{i:05d}", path=f"plugins/bench_{i:05d}", type_name="PLUGIN", type_plural="plugins",
+            version="1.0.0", repo_url=urls[i], description="", requirements=tuple(urls[j] for j in ds),
+            shows_in_workspace=None, type_shows_in_workspace=True, has_refresh_script=True,
+            has_initializer=False, issues=(),
+        )
+        for i, ds in enumerate(deps)
+    ]
+
+
+def git(*args, cwd=None) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def make_bare_repo(root: Path, commits: int, blob_size: int) -> Path:
+    """A bare repo where every commit rewrites one incompressible file."""
+    work = root / "work"
+    bare = root / "module.git"
+    work.mkdir()
+    git("init", "-q", cwd=work)
+    for i in range(commits):
+        (work / "data.bin").write_bytes(os.urandom(blob_size))
+        (work / "init.yaml").write_text(f"name: bench_module\nversion: 1.0.{i}\n", encoding="utf-8")
+        git("add", "-A", cwd=work)
+        git("-c", "user.name=bench", "-c", "user.email=bench@example.invalid", "commit", "-q", "-m", f"rev {i}", cwd=work)
+    git("clone", "-q", "--bare", str(work), str(bare))
+    # Partial clone needs server-side support, as on GitHub
+    git("config", "uploadpack.allowFilter", "true", cwd=bare)
+    return bare
+
+
+def make_module_repos(root: Path, n: int, deps_per_module: int, seed: int = 0) -> List[str]:
+    """n bare module repos under root/repos, each requiring deps_per_module random others (cycles included)."""
+    rng = random.Random(seed)
+    types = list(TYPE_DIRS)
+    urls = [str(root / "repos" / f"bench_{i:04d}.git") for i in range(n)]
+    for i, url in enumerate(urls):
+        work = root / "src" / f"bench_{i:04d}"
+        work.mkdir(parents=True)
+        requirements = "".join(f"  - {urls[j]}\n" for j in rng.sample(range(n), min(n - 1, deps_per_module)) if j != i)
+        (work / "init.yaml").write_text(
+            f"name: bench_{i:04d}\ntype: {types[i % len(types)]}\nversion: 1.0.0\nrepo_url: {url}\n"
+            + (f"requirements:\n{requirements}" if requirements else "requirements: []\n"),
+            encoding="utf-8",
+        )
+        git("init", "-q", cwd=work)
+        git("add", "-A", cwd=work)
+        git("-c", "user.name=bench", "-c", "user.email=bench@example.invalid", "commit", "-q", "-m", "init", cwd=work)
+        git("clone", "-q", "--bare", str(work), url)
+    return urls
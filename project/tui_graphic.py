@@ -1,7 +1,11 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from bisect import bisect_right
+import io
+import sys
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
 
-from wcwidth import wcswidth
+from wcwidth import wcswidth, wcwidth
 
 
 # Line styles consistent with framework.cli_format, but this TUI omits the right-side closing "│"
@@ -15,21 +19,160 @@ line_styles = {
 }
 
 
+class _WidthTable(dict):
+    """Memo of per-codepoint wcwidth values (-1 for control characters).
+
+    Lookups go through dict.__getitem__, so mapping it over a string runs at
+    C speed once the codepoints have been seen. Its size is bounded by the
+    number of distinct codepoints rendered.
+    """
+
+    def __missing__(self, ch: str) -> int:
+        width = self[ch] = wcwidth(ch)
+        return width
+
+
+class _VS16Table(dict):
+    """Memo of the extra cell an emoji variation selector adds after a given character."""
+
+    def __missing__(self, ch: str) -> int:
+        extra = self[ch] = wcswidth(ch + "\ufe0f") - wcwidth(ch)
+        return extra
+
+
+_CHAR_WIDTHS = _WidthTable()
+_VS16_EXTRA = _VS16Table()
+
+
+def _has_sequences(text: str) -> bool:
+    """Whether text contains a zero-width joiner or emoji variation selector (measured as sequences by wcswidth)."""
+    return "\u200d" in text or "\ufe0f" in text
+
+
+def _sequence_width(text: str) -> int:
+    """wcswidth() for text containing joiner/variation sequences, using the memo tables.
+
+    Runs between sequence characters are measured in bulk; only the sequence
+    characters themselves are handled one at a time.
+    """
+    width = 0
+    last = None  # last measured character with a non-zero width, for VS16
+    i = 0
+    n = len(text)
+    while i < n:
+        zwj = text.find("\u200d", i)
+        vs16 = text.find("\ufe0f", i)
+        j = min(zwj if zwj >= 0 else n, vs16 if vs16 >= 0 else n)
+        if j > i:
+            chunk = text[i:j]
+            widths = list(map(_CHAR_WIDTHS.__getitem__, chunk))
+            if min(widths) < 0:
+                return -1
+            width += sum(widths)
+            for k in range(len(widths) - 1, -1, -1):
+                if widths[k] > 0:
+                    last = chunk[k]
+                    break
+        if j >= n:
+            break
+        if j == zwj:
+            # Zero width joiner: neither it nor the joined character is measured
+            i = j + 2
+        elif last:
+            width += _VS16_EXTRA[last]
+            last = None
+            i = j + 1
+        else:
+            width += _CHAR_WIDTHS["\ufe0f"]
+            i = j + 1
+    return width
+
+
 def _display_width(text: str) -> int:
     """Return display width accounting for wide/emoji characters (fallback to len on -1)."""
-    width = wcswidth(text)
-    return width if width >= 0 else len(text)
+    if text.isascii():
+        # Printable ASCII is one cell per character; control characters fall back to len anyway
+        return len(text)
+    if _has_sequences(text):
+        width = _sequence_width(text)
+        return width if width >= 0 else len(text)
+    widths = list(map(_CHAR_WIDTHS.__getitem__, text))
+    return sum(widths) if min(widths) >= 0 else len(text)
+
+
+def _prefix_widths(text: str) -> Tuple[List[int], bool]:
+    """Cumulative cell widths of text (index i = width of text[:i]), control characters counting as 1.
+
+    The flag tells whether differences of the prefix sums equal
+    _display_width() of the corresponding slice, i.e. the text contains no
+    control characters or multi-codepoint sequences.
+    """
+    widths = list(map(_CHAR_WIDTHS.__getitem__, text))
+    exact = not widths or min(widths) >= 0
+    if not exact:
+        widths = [w if w >= 0 else 1 for w in widths]
+    return list(accumulate(widths, initial=0)), exact and not _has_sequences(text)
+
+
+def _cluster_prefix_widths(text: str) -> Tuple[List[int], List[int]]:
+    """Cut points and cumulative widths of text containing joiner/variation sequences.
+
+    A cluster is a character together with any VS16 after it and anything
+    joined to it by a ZWJ, so it is never split. starts[k] is where cluster k
+    begins (with len(text) appended) and prefix[k] the width of
+    text[:starts[k]], each cluster measured like _display_width().
+    """
+    starts = [0]
+    prefix = [0]
+    n = len(text)
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and (text[j] in "\u200d\ufe0f" or text[j - 1] == "\u200d"):
+            j += 1
+        starts.append(j)
+        prefix.append(prefix[-1] + _display_width(text[i:j]))
+        i = j
+    return starts, prefix
+
+
+@dataclass
+class TableColumn:
+    """Column definition for multi-column tables (see TableFormatter.set_columns)."""
+
+    header: str = ""
+    min_width: int = 1
+    max_width: Optional[int] = None
+    align: str = "left"  # "left" | "right" | "center"
 
 
 @dataclass
 class TableRow:
-    """Represents a content row for the TUI table."""
+    """Represents a content row for the TUI table.
+
+    In a table with columns, cells holds one string per column; rows without
+    cells span the full table width.
+    """
 
     row: str = ""
     padding_adjust: int = 0
+    cells: Optional[Sequence[str]] = None
+    _width_cache: Optional[Tuple[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    _cell_width_cache: Optional[Tuple[Sequence[str], List[int]]] = field(default=None, init=False, repr=False, compare=False)
 
     def get_display_width(self) -> int:
-        return _display_width(self.row)
+        """Display width of row, measured once per distinct row value."""
+        cached = self._width_cache
+        if cached is None or cached[0] is not self.row:
+            cached = self._width_cache = (self.row, _display_width(self.row))
+        return cached[1]
+
+    def get_cell_widths(self) -> List[int]:
+        """Display width of each cell, measured once per distinct cells value."""
+        cached = self._cell_width_cache
+        if cached is None or cached[0] is not self.cells:
+            cached = self._cell_width_cache = (self.cells, [_display_width(c) for c in self.cells or ()])
+        return cached[1]
 
     def get_padding_len(self, inner_width: int) -> int:
         width = self.get_display_width()
@@ -57,6 +200,9 @@ class TableFormatter:
     - Omits the right-hand closing vertical bar (│) on content lines.
     - Skips any logic related to that right-side closing bar.
     - Supports content fitting via truncation (default) or wrapping.
+    - Optional columns (set_columns): widths are solved once over all rows
+      and every cell is truncated or wrapped to its column with fit_mode.
+    - render() output is cached until rows, title or columns change.
     """
 
     def __init__(
@@ -81,15 +227,36 @@ class TableFormatter:
 
         self._rows: List[TableRow] = []
         self._title: Optional[TableRow] = None
+        self._columns: List[TableColumn] = []
+        self._column_separator = "  "
+
+        self._column_widths: Optional[List[int]] = None
+        self._render_cache: Optional[str] = None
 
     def add_row(self, row: TableRow, pos: Optional[int] = None) -> None:
         if pos is not None:
             self._rows.insert(pos, row)
         else:
             self._rows.append(row)
+        self.invalidate()
 
     def set_title(self, title: str) -> None:
         self._title = TableRow(title)
+        self.invalidate()
+
+    def set_columns(self, columns: Sequence[TableColumn], separator: str = "  ") -> None:
+        """Lay rows out in columns; rows then provide their content through TableRow.cells."""
+        for column in columns:
+            if column.align not in {"left", "right", "center"}:
+                raise ValueError("align must be one of 'left', 'right' or 'center'")
+        self._columns = list(columns)
+        self._column_separator = separator
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop cached widths and output (needed only after mutating a row in place)."""
+        self._column_widths = None
+        self._render_cache = None
 
     def _inner_width(self) -> int:
         """Compute inner width based on configured table width.
@@ -98,70 +265,86 @@ class TableFormatter:
         """
         return max(self._table_width - 2, 18)
 
-    def _truncate_to_width(self, text: str, max_width: int) -> str:
-        """Truncate text to fit display width, appending ellipsis if truncated."""
-        if _display_width(text) <= max_width:
-            return text
+    def _truncate_to_width(self, text: str, max_width: int, width: Optional[int] = None) -> Tuple[str, int]:
+        """Truncate text to fit display width, appending ellipsis if truncated.
 
+        Returns the fitted text and its display width.
+        """
+        if width is None:
+            width = _display_width(text)
+        if width <= max_width:
+            return text, width
+
+        if text.isascii():
+            ell_w = _display_width(self._ellipsis)
+            if ell_w >= max_width:
+                return text[:max_width], max_width
+            return f"{text[:max_width - ell_w]}{self._ellipsis}", max_width
+
+        prefix, exact = _prefix_widths(text)
+        starts = None
+        if not exact and _has_sequences(text):
+            # Cut between whole sequences, measured as they display
+            starts, prefix = _cluster_prefix_widths(text)
         ell_w = _display_width(self._ellipsis)
         if ell_w >= max_width:
             # Not enough space for ellipsis; hard cut to width
-            return self._cut_to_width(text, max_width)
+            end = bisect_right(prefix, max_width) - 1
+            cut = text[:starts[end] if starts else end]
+            return cut, prefix[end] if exact else _display_width(cut)
+
+        end = bisect_right(prefix, max_width - ell_w) - 1
+        fitted = f"{text[:starts[end] if starts else end]}{self._ellipsis}"
+        return fitted, (prefix[end] + ell_w) if exact else _display_width(fitted)
 
-        cut_width = max_width - ell_w
-        cut = self._cut_to_width(text, cut_width)
-        return f"{cut}{self._ellipsis}"
+    def _wrap_to_width(self, text: str, max_width: int) -> List[Tuple[str, int]]:
+        """Wrap text by display width; simple greedy char-based wrap respecting wide chars.
 
-    def _wrap_to_width(self, text: str, max_width: int) -> List[str]:
-        """Wrap text by display width; simple greedy char-based wrap respecting wide chars."""
+        Returns (segment, display width) pairs.
+        """
         if max_width <= 0:
-            return [text]
-
-        lines: List[str] = []
-        current: List[str] = []
-        cur_w = 0
-        for ch in text:
-            ch_w = wcswidth(ch)
-            if ch_w < 0:
-                ch_w = 1
-            if cur_w + ch_w > max_width and current:
-                lines.append("".join(current))
-                current = [ch]
-                cur_w = ch_w
-            else:
-                current.append(ch)
-                cur_w += ch_w
-        if current:
-            lines.append("".join(current))
-        if not lines:
-            lines = [""]
+            return [(text, _display_width(text))]
+        if not text:
+            return [("", 0)]
+        if text.isascii():
+            return [(text[i:i + max_width], len(text[i:i + max_width])) for i in range(0, len(text), max_width)]
+
+        prefix, exact = _prefix_widths(text)
+        starts = None
+        if not exact and _has_sequences(text):
+            # Wrap between whole sequences: start and end count clusters, not characters
+            starts, prefix = _cluster_prefix_widths(text)
+        lines: List[Tuple[str, int]] = []
+        start = 0
+        n = len(prefix) - 1
+        while start < n:
+            end = bisect_right(prefix, prefix[start] + max_width, lo=start) - 1
+            if end <= start:
+                # A single character wider than the line still gets a line of its own
+                end = start + 1
+            seg = text[starts[start]:starts[end]] if starts else text[start:end]
+            lines.append((seg, prefix[end] - prefix[start] if exact else _display_width(seg)))
+            start = end
         return lines
 
     def _cut_to_width(self, text: str, max_width: int) -> str:
-        out: List[str] = []
-        cur_w = 0
-        for ch in text:
-            ch_w = wcswidth(ch)
-            if ch_w < 0:
-                ch_w = 1
-            if cur_w + ch_w > max_width:
-                break
-            out.append(ch)
-            cur_w += ch_w
-        return "".join(out)
-
-    def _fit_lines(self, text: str, inner_width: int) -> List[str]:
+        if text.isascii():
+            return text[:max(max_width, 0)]
+        prefix, _ = _prefix_widths(text)
+        return text[:bisect_right(prefix, max_width) - 1] if max_width >= 0 else ""
+
+    def _fit_lines(self, text: str, inner_width: int, width: Optional[int] = None) -> List[Tuple[str, int]]:
         if self._fit_mode == "truncate":
-            return [self._truncate_to_width(text, inner_width)]
+            return [self._truncate_to_width(text, inner_width, width)]
         return self._wrap_to_width(text, inner_width)
 
-    def _pad_left(self, text: str, inner_width: int) -> str:
-        w = _display_width(text)
+    def _pad_left(self, text: str, inner_width: int, width: Optional[int] = None) -> str:
+        w = _display_width(text) if width is None else width
         pad = inner_width - w
         return f"{text}{' ' * (pad if pad > 0 else 0)}"
 
-    def _pad_center(self, text: str, inner_width: int) -> str:
-        w = _display_width(text)
+    def _pad_center(self, text: str, inner_width: int, width: Optional[int] = None) -> str:
+        w = _display_width(text) if width is None else width
         total = inner_width - w
         if total <= 0:
             return text
@@ -169,30 +352,204 @@ class TableFormatter:
         right = total - left
         return f"{' ' * left}{text}{' ' * right}"
 
-    def render(self) -> str:
+    def _pad_right(self, text: str, inner_width: int, width: Optional[int] = None) -> str:
+        w = _display_width(text) if width is None else width
+        pad = inner_width - w
+        return f"{' ' * (pad if pad > 0 else 0)}{text}"
+
+    def _solve_widths(self, rows: Iterable[TableRow], fill: bool = False, unseen: bool = False) -> List[int]:
+        """Compute column widths in one pass over rows (O(rows × columns)).
+
+        Columns take their widest cell (or header), clamped to min/max width;
+        with unseen (no rows known yet, as for a fresh stream) they start at
+        their max_width instead. If that overflows the table, a common ceiling
+        is lowered until the columns fit, going below a column's min_width
+        only when the minimums alone are wider than the table. With fill,
+        space left over goes to the last column without a max_width, or is
+        shared by all of them when unseen.
+        """
+        columns = self._columns
+        if not columns:
+            return []
+        widths = [max(_display_width(c.header), c.min_width) for c in columns]
+        if unseen:
+            widths = [max(w, c.max_width or 0) for w, c in zip(widths, columns)]
+        for r in rows:
+            if r.cells is None:
+                continue
+            for i, w in enumerate(r.get_cell_widths()[:len(columns)]):
+                if w > widths[i]:
+                    widths[i] = w
+        widths = [min(w, c.max_width) if c.max_width else w for w, c in zip(widths, columns)]
+
+        available = self._inner_width() - _display_width(self._column_separator) * (len(columns) - 1)
+        total = sum(widths)
+        if total > available:
+            mins = [min(c.min_width, w) for c, w in zip(columns, widths)]
+            lo, hi = 0, max(widths)
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if sum(max(m, min(w, mid)) for m, w in zip(mins, widths)) <= available:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            fitted = [max(m, min(w, lo)) for m, w in zip(mins, widths)]
+            # Hand out what the integer ceiling left over, left to right
+            spare = available - sum(fitted)
+            for i in range(len(fitted)):
+                if spare <= 0:
+                    break
+                if fitted[i] < widths[i]:
+                    fitted[i] += 1
+                    spare -= 1
+            # Minimums wider than the table: take the excess from the widest columns
+            excess = sum(fitted) - max(available, 0)
+            while excess > 0:
+                i = max(range(len(fitted)), key=fitted.__getitem__)
+                if fitted[i] == 0:
+                    break
+                fitted[i] -= 1
+                excess -= 1
+            widths = fitted
+        elif fill and total < available:
+            flexible = [i for i, c in enumerate(columns) if not c.max_width] or [len(columns) - 1]
+            if not unseen:
+                flexible = flexible[-1:]
+            share, extra = divmod(available - total, len(flexible))
+            for k, i in enumerate(flexible):
+                widths[i] += share + (1 if k < extra else 0)
+        return widths
+
+    def _get_column_widths(self) -> List[int]:
+        if self._column_widths is None:
+            self._column_widths = self._solve_widths(self._rows)
+        return self._column_widths
+
+    def _cell_lines(self, row: TableRow, widths: List[int]) -> Iterator[str]:
+        """Content line(s) for a row laid out in columns."""
+        bar = line_styles[self._style_name]["│"]
+        inner_width = self._inner_width()
+        n = len(self._columns)
+        cells = list(row.cells or ())[:n]
+        cell_widths = row.get_cell_widths()[:n]
+        cells += [""] * (n - len(cells))
+        cell_widths = list(cell_widths) + [0] * (n - len(cell_widths))
+
+        fitted = [
+            self._fit_lines(text, width, cw) if width > 0 else [("", 0)]
+            for text, width, cw in zip(cells, widths, cell_widths)
+        ]
+        sep = self._column_separator
+        used = sum(widths) + _display_width(sep) * (n - 1)
+        pad = " " * max(inner_width - used, 0)
+        aligners = {"left": self._pad_left, "right": self._pad_right, "center": self._pad_center}
+        for k in range(max(len(f) for f in fitted)):
+            parts = []
+            for column, width, lines in zip(self._columns, widths, fitted):
+                seg, seg_w = lines[k] if k < len(lines) else ("", 0)
+                parts.append(aligners[column.align](seg, width, seg_w))
+            line = sep.join(parts)
+            if used > inner_width:
+                # More separators than the table is wide: the columns got no width at all
+                line = self._cut_to_width(line, inner_width)
+            yield f"{bar}{line}{pad}"
+
+    def _border(self, left: str, right: str) -> str:
         style = line_styles[self._style_name]
+        return f"{style[left]}{style['─'] * self._inner_width()}{style[right]}"
 
+    def _header_lines(self, widths: Optional[List[int]] = None) -> Iterator[str]:
+        """Top border plus title and column header line(s), each followed by a separator."""
+        style = line_styles[self._style_name]
         inner_width = self._inner_width()
-        top = f"{style['┌']}{style['─'] * inner_width}{style['┐']}"
-        mid = f"{style['├']}{style['─'] * inner_width}{style['┤']}"
-        bot = f"{style['└']}{style['─'] * inner_width}{style['┘']}"
+        yield self._border("┌", "┐")
+        if self._title and self._title.row != "":
+            for seg, w in self._fit_lines(self._title.row, inner_width, self._title.get_display_width()):
+                yield f"{style['│']}{self._pad_center(seg, inner_width, w)}"
+            yield self._border("├", "┤")
+        if self._columns and any(c.header for c in self._columns):
+            yield from self._cell_lines(TableRow(cells=[c.header for c in self._columns]), widths)
+            yield self._border("├", "┤")
+
+    def _row_lines(self, row: TableRow, widths: Optional[List[int]] = None) -> Iterator[str]:
+        """Content line(s) for one row (left border only, no right-side │)."""
+        if self._columns and row.cells is not None:
+            yield from self._cell_lines(row, widths)
+            return
+        bar = line_styles[self._style_name]["│"]
+        inner_width = self._inner_width()
+        for seg, w in self._fit_lines(row.row, inner_width, row.get_display_width()):
+            yield f"{bar}{self._pad_left(seg, inner_width, w)}"
 
-        lines: List[str] = [top]
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the rendered table line by line."""
+        return iter(self.render().split("\n"))
 
-        # Title line(s) (left border only, no right-side │)
-        if self._title and self._title.row != "":
-            for seg in self._fit_lines(self._title.row, inner_width):
-                lines.append(f"{style['│']}{self._pad_center(seg, inner_width)}")
-            lines.append(mid)
+    def render(self) -> str:
+        """The whole table as one string, written by the same TableStream that stream() returns.
+
+        Unlike a fresh stream, columns are sized to the rows without filling
+        the spare width.
+        """
+        if self._render_cache is None:
+            buffer = io.StringIO()
+            TableStream(self, buffer, self._get_column_widths() if self._columns else None).close()
+            self._render_cache = buffer.getvalue()[:-1]
+        return self._render_cache
+
+    def stream(self, out: Optional[TextIO] = None) -> "TableStream":
+        """Open a streaming table on out (default sys.stdout).
+
+        The header is written immediately, every row passed to
+        TableStream.add_row() is written as soon as it is added (rows are not
+        kept), and the bottom border is written on close. Rows already added
+        to this formatter are written right after the header. Column widths
+        are fixed when the stream opens: they are solved over the rows
+        already added and any spare width goes to the last column without a
+        max_width. With no rows added yet, columns start at their max_width
+        and the spare width is shared by the columns without one.
+
+            with formatter.stream() as table:
+                table.add_row(TableRow("..."))
+        """
+        return TableStream(self, out)
+
+
+class TableStream:
+    """Incremental writer for a TableFormatter, see TableFormatter.stream()."""
+
+    def __init__(self, formatter: TableFormatter, out: Optional[TextIO] = None,
+                 widths: Optional[List[int]] = None) -> None:
+        self._formatter = formatter
+        self._out = out if out is not None else sys.stdout
+        self._closed = False
+        if widths is None and formatter._columns:
+            widths = formatter._solve_widths(formatter._rows, fill=True, unseen=not formatter._rows)
+        self._widths = widths
+        self._write(formatter._header_lines(self._widths))
+        for r in formatter._rows:
+            self._write(formatter._row_lines(r, self._widths))
+
+    def _write(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self._out.write(line + "\n")
+        self._out.flush()
+
+    def add_row(self, row: TableRow) -> None:
+        if self._closed:
+            raise ValueError("Cannot add rows to a closed table stream")
+        self._write(self._formatter._row_lines(row, self._widths))
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._write([self._formatter._border("└", "┘")])
 
-        # Content rows (left border only, no right-side │)
-        for r in self._rows:
-            segs = self._fit_lines(r.row, inner_width)
-            for seg in segs:
-                lines.append(f"{style['│']}{self._pad_left(seg, inner_width)}")
+    def __enter__(self) -> "TableStream":
+        return self
 
-        lines.append(bot)
-        return "\n".join(lines)
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
 
-__all__ = ["TableRow", "TableFormatter", "line_styles"]
+__all__ = ["TableColumn", "TableRow", "TableFormatter", "TableStream", "line_styles"]
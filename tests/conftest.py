@@ -0,0 +1,83 @@
+"""Shared fixtures: a throwaway project folder and local bare git repos served over file://."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import adhd_framework  # noqa: E402
+
+
+def git(*args, cwd=None) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def commit_all(work: Path, message: str) -> str:
+    git("add", "-A", cwd=work)
+    git("-c", "user.name=test", "-c", "user.email=test@example.invalid", "commit", "-q", "-m", message, cwd=work)
+    return git("rev-parse", "HEAD", cwd=work)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """An empty project folder as the working directory, with its own clone cache and environment."""
+    root = tmp_path / "project"
+    root.mkdir()
+    monkeypatch.chdir(root)
+    monkeypatch.setattr(adhd_framework, "CLONE_CACHE_DIR", tmp_path / "cache")
+    saved = dict(os.environ)
+    for name in ("ADHD_CLONE_STRATEGY", "ADHD_MIRROR"):
+        os.environ.pop(name, None)
+    yield root
+    # activate_mirror() writes GIT_CONFIG_* and PIP_* straight into os.environ
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture
+def make_repo(tmp_path):
+    """make_repo(name, {path: text}, commits=1) -> file:// URL of a new bare repo.
+
+    Every commit also rewrites 'rev.txt', so the history has one commit per
+    revision even when the files do not change.
+    """
+    def make(name: str, files: dict, commits: int = 1) -> str:
+        work = tmp_path / "src" / name
+        work.mkdir(parents=True)
+        git("-c", "init.defaultBranch=main", "init", "-q", cwd=work)
+        for rev in range(commits):
+            for rel, text in files.items():
+                (work / rel).parent.mkdir(parents=True, exist_ok=True)
+                (work / rel).write_text(text, encoding="utf-8")
+            (work / "rev.txt").write_text(f"{rev}\n", encoding="utf-8")
+            commit_all(work, f"rev {rev}")
+        bare = tmp_path / "repos" / f"{name}.git"
+        git("clone", "-q", "--bare", str(work), str(bare))
+        # Partial clone needs server-side support, as on GitHub
+        git("config", "uploadpack.allowFilter", "true", cwd=bare)
+        return bare.as_uri()
+
+    return make
+
+
+def module_yaml(name: str, type_name: str = "core", requirements=(), repo_url: str = "") -> str:
+    """init.yaml text for a module requiring the given repo URLs."""
+    text = f"name: {name}\ntype: {type_name}\nversion: 1.0.0\n" + (f"repo_url: {repo_url}\n" if repo_url else "")
+    if requirements:
+        return text + "requirements:\n" + "".join(f"  - {url}\n" for url in requirements)
+    return text + "requirements: []\n"
+
+
+def module_record(name: str, requires=(), refresh: bool = True, type_plural: str = "plugins") -> "adhd_framework.ModuleRecord":
+    """An in-memory ModuleRecord whose requirements name other records by module name."""
+    return adhd_framework.ModuleRecord(
+        name=name, path=f"{type_plural}/{name}", type_name=type_plural[:-1].upper(), type_plural=type_plural,
+        version="1.0.0", repo_url=f"https://example.invalid/{name}.git", description="",
+        requirements=tuple(f"https://example.invalid/{dep}.git" for dep in requires),
+        shows_in_workspace=None, type_shows_in_workspace=type_plural not in ("cores", "mcps"),
+        has_refresh_script=refresh, has_initializer=False, issues=(),
+    )
@@ -0,0 +1,43 @@
+"""Startup: which commands skip the bootstrap side effects (bootstrap, COMMANDS)."""
+
+import sys
+
+import pytest
+
+import adhd_framework
+
+
+@pytest.fixture
+def installs(project, monkeypatch):
+    """Run bootstrap() inside a pretend venv with every essential module present; returns the force flags requirements were installed with."""
+    calls = []
+    monkeypatch.setattr(sys, "base_prefix", sys.prefix + "-base")
+    monkeypatch.setattr(adhd_framework, "BOOTSTRAP_MODULES", {})
+    monkeypatch.setattr(adhd_framework, "_ensure_requirements", lambda force=False: calls.append(force))
+    monkeypatch.setattr(adhd_framework, "configure_venv_tab_completion", lambda: None)
+    return calls
+
+
+def test_read_only_commands_skip_requirements(installs):
+    adhd_framework.bootstrap(read_only=True)
+
+    assert installs == []
+
+
+def test_forced_reinstall_is_honoured_for_read_only_commands(installs):
+    adhd_framework.bootstrap(force_reinstall_reqs=True, read_only=True)
+
+    assert installs == [True]
+
+
+def test_other_commands_check_requirements(installs):
+    adhd_framework.bootstrap()
+
+    assert installs == [False]
+
+
+def test_commands_that_write_files_are_not_read_only():
+    for name in ("lock", "mirror", "refresh", "workspace", "init", "req"):
+        assert not adhd_framework.COMMANDS[name].read_only, name
+    for name in ("list", "info", "graph", "search"):
+        assert adhd_framework.COMMANDS[name].read_only, name
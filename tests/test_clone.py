@@ -0,0 +1,46 @@
+"""Parallel bootstrap clones (clone_missing_modules)."""
+
+from pathlib import Path
+
+import adhd_framework
+
+
+def test_clones_every_module_into_place(project, make_repo):
+    modules = {
+        "cores/alpha": make_repo("alpha", {"init.yaml": "name: alpha\n"}),
+        "utils/beta": make_repo("beta", {"init.yaml": "name: beta\n"}),
+    }
+
+    results = adhd_framework.clone_missing_modules(modules, jobs=2)
+
+    assert [r.path for r in results] == [Path(p) for p in modules]
+    assert all(r.ok and r.bytes > 0 for r in results)
+    assert (project / "cores/alpha/init.yaml").read_text() == "name: alpha\n"
+    assert (project / "utils/beta/.git").is_dir()
+    assert not list(project.rglob("*.partial"))
+
+
+def test_partial_failure_installs_nothing(project, make_repo):
+    modules = {
+        "cores/alpha": make_repo("alpha", {"init.yaml": "name: alpha\n"}),
+        "cores/missing": (project.parent / "repos" / "missing.git").as_uri(),
+        "utils/beta": make_repo("beta", {"init.yaml": "name: beta\n"}),
+    }
+
+    results = adhd_framework.clone_missing_modules(modules, jobs=3)
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error
+    # Successful clones stay in staging and are removed with it
+    assert not (project / "cores/alpha").exists()
+    assert not (project / "utils/beta").exists()
+    assert not list(project.rglob("*.partial"))
+
+
+def test_results_follow_input_order(project, make_repo):
+    names = [f"mod{i}" for i in range(5)]
+    modules = {f"plugins/{name}": make_repo(name, {"init.yaml": f"name: {name}\n"}) for name in reversed(names)}
+
+    results = adhd_framework.clone_missing_modules(modules, jobs=4)
+
+    assert [r.path.name for r in results] == list(reversed(names))
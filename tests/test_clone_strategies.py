@@ -0,0 +1,76 @@
+"""Shallow, blobless and reference-cached clones."""
+
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+import adhd_framework
+from conftest import git
+
+
+def clone(project: Path, url: str, strategy: str, rel: str = "cores/mod") -> Path:
+    [result] = adhd_framework.clone_missing_modules({rel: url}, jobs=1, strategy=strategy)
+    assert result.ok, result.error
+    assert result.strategy == strategy
+    return project / rel
+
+
+def commit_count(path: Path) -> int:
+    return int(git("rev-list", "--count", "HEAD", cwd=path))
+
+
+@pytest.fixture
+def history_repo(make_repo):
+    return make_repo("mod", {"init.yaml": "name: mod\n"}, commits=5)
+
+
+def test_full_clone_has_complete_history(project, history_repo):
+    path = clone(project, history_repo, "full")
+
+    assert commit_count(path) == 5
+
+
+def test_shallow_clone_has_only_the_latest_commit(project, history_repo):
+    path = clone(project, history_repo, "shallow")
+
+    assert commit_count(path) == 1
+    assert (path / "rev.txt").read_text() == "4\n"
+
+
+def test_plain_local_path_is_cloned_like_a_remote(project, history_repo):
+    # A plain path would take git's local shortcut, which ignores --depth
+    path = clone(project, urlparse(history_repo).path, "shallow")
+
+    assert commit_count(path) == 1
+
+
+def test_blobless_clone_is_a_partial_clone(project, history_repo):
+    path = clone(project, history_repo, "blobless")
+
+    assert commit_count(path) == 5
+    assert git("config", "remote.origin.partialclonefilter", cwd=path) == "blob:none"
+
+
+def test_reference_clone_borrows_from_the_shared_cache(project, tmp_path, history_repo):
+    path = clone(project, history_repo, "reference")
+
+    alternates = (path / ".git/objects/info/alternates").read_text().strip()
+    assert Path(alternates).is_relative_to(tmp_path / "cache")
+    assert commit_count(path) == 5
+
+    # A second project fetches only what the cache is missing
+    [second] = adhd_framework.clone_missing_modules({"cores/again": history_repo}, strategy="reference")
+    assert second.ok and second.bytes < adhd_framework._dir_size(Path(alternates).parent)
+
+
+def test_strategy_comes_from_the_environment(monkeypatch):
+    monkeypatch.setenv("ADHD_CLONE_STRATEGY", "blobless")
+
+    assert adhd_framework.resolve_clone_strategy() == "blobless"
+    assert adhd_framework.resolve_clone_strategy("shallow") == "shallow"
+
+
+def test_unknown_strategy_is_rejected(project):
+    with pytest.raises(ValueError, match="Unknown clone strategy"):
+        adhd_framework.clone_missing_modules({"cores/mod": "unused"}, strategy="sparse")
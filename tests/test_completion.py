@@ -0,0 +1,70 @@
+"""Tab completion index of 'type/name' module entries (load_completion_index)."""
+
+import os
+
+import adhd_framework
+
+
+def add_module(project, module_dir, init=True):
+    folder = project / module_dir
+    folder.mkdir(parents=True)
+    if init:
+        (folder / "init.yaml").write_text("name: x\n", encoding="utf-8")
+    return folder
+
+
+def freeze_type_dirs(project):
+    """Reset every type folder's mtime, so only per-module changes are left to notice."""
+    for type_dir in adhd_framework.MODULE_TYPE_DIRS:
+        if (project / type_dir).is_dir():
+            os.utime(project / type_dir, ns=(1_000_000_000, 1_000_000_000))
+
+
+def test_only_folders_with_an_init_yaml_are_offered(project):
+    add_module(project, "cores/b_core")
+    add_module(project, "cores/a_core")
+    add_module(project, "plugins/p")
+    add_module(project, "plugins/not_a_module", init=False)
+    add_module(project, "plugins/.hidden")
+    add_module(project, "plugins/__pycache__")
+
+    assert adhd_framework.load_completion_index() == ["cores/a_core", "cores/b_core", "plugins/p"]
+
+
+def test_warm_index_is_read_from_disk(project):
+    add_module(project, "cores/a_core")
+    adhd_framework.load_completion_index()
+    index = adhd_framework.COMPLETION_INDEX_FILE
+    index.write_text(index.read_text(encoding="utf-8") + "cores/from_the_file\n", encoding="utf-8")
+
+    assert adhd_framework.load_completion_index() == ["cores/a_core", "cores/from_the_file"]
+
+
+def test_folder_that_gains_an_init_yaml_is_picked_up(project):
+    folder = add_module(project, "plugins/late", init=False)
+    freeze_type_dirs(project)
+    assert adhd_framework.load_completion_index() == []
+
+    (folder / "init.yaml").write_text("name: late\n", encoding="utf-8")
+    freeze_type_dirs(project)
+
+    assert adhd_framework.load_completion_index() == ["plugins/late"]
+
+
+def test_removed_init_yaml_and_folders_drop_out(project):
+    kept = add_module(project, "plugins/kept")
+    gone = add_module(project, "plugins/gone")
+    assert adhd_framework.load_completion_index() == ["plugins/gone", "plugins/kept"]
+
+    (kept / "init.yaml").unlink()
+    (gone / "init.yaml").unlink()
+    gone.rmdir()
+
+    assert adhd_framework.load_completion_index() == []
+
+
+def test_completer_filters_by_prefix(project):
+    add_module(project, "cores/a_core")
+    add_module(project, "managers/config_manager")
+
+    assert adhd_framework.module_completer("man", None) == ["managers/config_manager"]
@@ -0,0 +1,64 @@
+"""On-disk module discovery cache and what invalidates it (ModuleDiscovery)."""
+
+import json
+
+import pytest
+
+import adhd_framework
+from conftest import module_record
+
+
+@pytest.fixture
+def cached(project):
+    """Two modules on disk with a discovery cache written for them; returns a loader for a fresh process."""
+    for module_dir in ("cores/a_core", "plugins/b"):
+        (project / module_dir).mkdir(parents=True)
+        (project / module_dir / "init.yaml").write_text("name: x\nversion: 1.0.0\n", encoding="utf-8")
+    records = [module_record("a_core", type_plural="cores"), module_record("b")]
+    adhd_framework.ModuleDiscovery()._write_cache(records, adhd_framework._module_dir_keys())
+    return lambda: adhd_framework.ModuleDiscovery()._load_cached()
+
+
+def test_warm_cache_returns_the_records(cached):
+    assert [r.name for r in cached()] == ["a_core", "b"]
+
+
+@pytest.mark.parametrize("change", [
+    lambda p: (p / "cores/a_core/init.yaml").write_text("name: x\nversion: 1.0.1\n", encoding="utf-8"),
+    lambda p: (p / "plugins/b/refresh.py").write_text("", encoding="utf-8"),
+    lambda p: (p / "plugins/b/__init__.py").write_text("", encoding="utf-8"),
+    lambda p: (p / "plugins/b/init.yaml").unlink(),
+    lambda p: (p / "utils/new_util").mkdir(parents=True),
+])
+def test_module_folder_changes_invalidate_it(project, cached, change):
+    change(project)
+
+    assert cached() is None
+
+
+@pytest.mark.parametrize("change", [
+    lambda p: (p / "plugins/__pycache__").mkdir(),
+    lambda p: (p / "plugins/.scratch").mkdir(),
+    lambda p: (p / "plugins/b/notes.txt").write_text("", encoding="utf-8"),
+    lambda p: (p / "docs").mkdir(),
+])
+def test_other_changes_keep_it(project, cached, change):
+    change(project)
+
+    assert cached() is not None
+
+
+def test_cache_and_completion_index_use_the_same_key(project, cached):
+    cache = json.loads(adhd_framework.DISCOVERY_CACHE_FILE.read_text(encoding="utf-8"))
+    adhd_framework.load_completion_index()
+    header = adhd_framework.COMPLETION_INDEX_FILE.read_text(encoding="utf-8").splitlines()[0]
+
+    assert json.loads(header[2:]) == cache["dirs"]
+
+
+def test_other_cache_version_is_ignored(project, cached):
+    path = adhd_framework.DISCOVERY_CACHE_FILE
+    cache = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps(dict(cache, version=-1)), encoding="utf-8")
+
+    assert cached() is None
@@ -0,0 +1,94 @@
+"""Framework self-update (FrameworkFileUpdater) against a file:// source repo."""
+
+import os
+import stat
+from pathlib import Path
+
+import adhd_framework
+
+
+def updater(project: Path, url: str) -> adhd_framework.FrameworkFileUpdater:
+    return adhd_framework.FrameworkFileUpdater(url, "main", project / "update_cache.json")
+
+
+def test_fetch_reports_changed_unchanged_and_failed(project, make_repo):
+    url = make_repo("framework", {"adhd_framework.py": "print('new')\n", "README.md": "same\n"})
+    (project / "adhd_framework.py").write_text("print('old')\n", encoding="utf-8")
+    (project / "README.md").write_text("same\n", encoding="utf-8")
+
+    fetched = {f.name: f for f in updater(project, url).fetch_all(["adhd_framework.py", "README.md", "absent.txt"])}
+
+    assert fetched["adhd_framework.py"].status == "changed"
+    assert fetched["adhd_framework.py"].content == b"print('new')\n"
+    assert fetched["README.md"].status == "unchanged"
+    assert fetched["absent.txt"].status == "failed" and fetched["absent.txt"].error
+
+
+def test_missing_local_file_counts_as_changed(project, make_repo):
+    url = make_repo("framework", {"requirements.txt": "six\n"})
+
+    fetched = updater(project, url).fetch("requirements.txt")
+
+    assert fetched.status == "changed" and fetched.content == b"six\n"
+
+
+def test_plain_folder_works_as_a_source(project, tmp_path):
+    source = tmp_path / "checkout"
+    source.mkdir()
+    (source / "README.md").write_text("from a folder\n", encoding="utf-8")
+
+    fetched = adhd_framework.FrameworkFileUpdater(str(source), "main", project / "cache.json").fetch("README.md")
+
+    assert fetched.status == "changed" and fetched.content == b"from a folder\n"
+
+
+def test_apply_replaces_the_file_and_keeps_its_mode(project, make_repo):
+    url = make_repo("framework", {"adhd_framework.py": "print('new')\n"})
+    script = project / "adhd_framework.py"
+    script.write_text("print('old')\n", encoding="utf-8")
+    os.chmod(script, 0o755)
+    files = updater(project, url)
+
+    fetched = files.fetch("adhd_framework.py")
+    files.apply(fetched)
+
+    assert script.read_text() == "print('new')\n"
+    assert stat.S_IMODE(script.stat().st_mode) == 0o755
+    assert [p.name for p in project.iterdir() if ".tmp" in p.name] == []
+
+
+def test_cached_etag_is_sent_only_while_the_local_file_is_untouched(project, monkeypatch):
+    github = "https://github.com/example/framework.git"
+    sent = []
+
+    def fake_fetch(self, name, etag):
+        sent.append(etag)
+        return (None, etag) if etag else (b"v1\n", '"abc"')
+
+    monkeypatch.setattr(adhd_framework.FrameworkFileUpdater, "_fetch_github", fake_fetch)
+    files = updater(project, github)
+    first = files.fetch("README.md")
+    files.apply(first)
+    files.remember(first)
+    files.save()
+
+    again = updater(project, github).fetch("README.md")
+    assert again.status == "unchanged" and again.content == b"v1\n"
+
+    (project / "README.md").write_text("edited by hand\n", encoding="utf-8")
+    edited = updater(project, github).fetch("README.md")
+    assert edited.status == "changed" and edited.content == b"v1\n"
+    assert sent == ["", '"abc"', ""]
+
+
+def test_raw_url_for_github_sources():
+    files = adhd_framework.FrameworkFileUpdater("git@github.com:owner/repo.git", "dev", Path("unused.json"))
+
+    assert files._raw_url("a/b.py") == "https://raw.githubusercontent.com/owner/repo/dev/a/b.py"
+
+
+def test_unified_diff_names_both_sides():
+    diff = adhd_framework.unified_file_diff("README.md", b"one\n", b"two\n")
+
+    assert diff.splitlines()[:2] == ["--- a/README.md", "+++ b/README.md"]
+    assert "-one" in diff and "+two" in diff
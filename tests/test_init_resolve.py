@@ -0,0 +1,78 @@
+"""Breadth-first init: transitive module resolution with deduplicated fetches (resolve_init_modules)."""
+
+import pytest
+
+import adhd_framework
+from conftest import module_yaml
+
+pytest.importorskip("yaml")
+
+
+@pytest.fixture
+def url(tmp_path):
+    """file:// URL a repo made with make_repo(name, ...) will have, usable before it exists."""
+    return lambda name: (tmp_path / "repos" / f"{name}.git").as_uri()
+
+
+@pytest.fixture
+def module_tree(make_repo, url):
+    """a -> b, c;  b -> c, d;  c -> a (a cycle);  e -> d;  d requires nothing."""
+    tree = {"a": ("core", ["b", "c"]), "b": ("manager", ["c", "d"]), "c": ("util", ["a"]),
+            "d": ("plugin", []), "e": ("core", ["d"])}
+    for name, (type_name, requires) in tree.items():
+        make_repo(name, {"init.yaml": module_yaml(name, type_name, [url(dep) for dep in requires], url(name))})
+    return tree
+
+
+def test_every_repo_is_cloned_once_level_by_level(project, module_tree, url):
+    seen = []
+
+    results = adhd_framework.resolve_init_modules([url("a"), url("e")], jobs=4, on_result=seen.append)
+
+    assert all(r.ok for r in results)
+    assert {r.name: r.level for r in results} == {"a": 0, "e": 0, "b": 1, "c": 1, "d": 1}
+    assert [r.level for r in results] == sorted(r.level for r in results)
+    assert all(r.cloned for r in results)
+    assert sorted(seen) == sorted(results)
+    assert {r.path for r in results} == {"cores/a", "cores/e", "managers/b", "utils/c", "plugins/d"}
+    assert (project / "managers/b/init.yaml").exists()
+    assert not adhd_framework.INIT_STAGING_DIR.exists()
+
+
+def test_equivalent_urls_are_fetched_once(project, module_tree, url):
+    results = adhd_framework.resolve_init_modules([url("d"), url("d") + "/", url("d")[:-4]], jobs=2)
+
+    assert [(r.name, r.cloned) for r in results] == [("d", True)]
+
+
+def test_present_modules_are_not_cloned_but_their_requirements_are(project, module_tree, url):
+    [first] = adhd_framework.resolve_init_modules([url("d")], jobs=1)
+    assert first.cloned
+
+    results = adhd_framework.resolve_init_modules([url("e")], jobs=2)
+
+    assert [(r.name, r.cloned) for r in results] == [("e", True), ("d", False)]
+    assert results[1].path == "plugins/d"
+
+
+def test_failures_are_reported_and_do_not_stop_the_rest(project, make_repo, url):
+    make_repo("good", {"init.yaml": module_yaml("good", "util", [url("missing")])})
+    make_repo("badtype", {"init.yaml": module_yaml("badtype", "widget")})
+
+    results = adhd_framework.resolve_init_modules([url("good"), url("badtype")], jobs=2)
+
+    by_url = {r.repo_url: r for r in results}
+    assert by_url[url("good")].ok and (project / "utils/good").is_dir()
+    assert not by_url[url("badtype")].ok and "unknown module type" in by_url[url("badtype")].error
+    assert not by_url[url("missing")].ok and by_url[url("missing")].level == 1
+    assert not adhd_framework.INIT_STAGING_DIR.exists()
+
+
+def test_existing_destination_is_not_overwritten(project, make_repo, url):
+    make_repo("taken", {"init.yaml": module_yaml("taken", "core")})
+    (project / "cores" / "taken").mkdir(parents=True)
+
+    [result] = adhd_framework.resolve_init_modules([url("taken")], jobs=1)
+
+    assert not result.ok and "already exists" in result.error
+    assert list((project / "cores" / "taken").iterdir()) == []
@@ -0,0 +1,93 @@
+"""Lockfile and offline mirror (build_lock, pin_modules_to_lock, build_mirror, activate_mirror)."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+import adhd_framework
+from conftest import commit_all, git, module_record
+
+
+@pytest.fixture
+def cloned(project, make_repo, tmp_path):
+    """One module cloned into cores/alpha; returns (record, commit the checkout is at)."""
+    url = make_repo("alpha", {"init.yaml": "name: alpha\n", "requirements.txt": "pytest\n"})
+    [result] = adhd_framework.clone_missing_modules({"cores/alpha": url}, jobs=1)
+    assert result.ok, result.error
+    record = module_record("alpha", type_plural="cores")._replace(repo_url=url)
+    return record, git("rev-parse", "HEAD", cwd=project / "cores/alpha")
+
+
+def push_new_commit(tmp_path: Path, name: str) -> str:
+    work = tmp_path / "src" / name
+    (work / "rev.txt").write_text("upstream moved on\n", encoding="utf-8")
+    commit = commit_all(work, "newer")
+    git("push", "-q", str(tmp_path / "repos" / f"{name}.git"), "HEAD:main", cwd=work)
+    return commit
+
+
+def test_lock_records_module_commits_and_installed_pins(cloned):
+    record, commit = cloned
+
+    lock, warnings = adhd_framework.build_lock([record])
+
+    assert lock["version"] == adhd_framework.LOCK_VERSION
+    assert lock["modules"] == [{"path": "cores/alpha", "repo_url": record.repo_url, "commit": commit}]
+    assert any(pin.lower().startswith("pytest==") for pin in lock["requirements"])
+    # Bootstrap modules are not checked out in this project
+    assert not [w for w in warnings if "alpha" in w]
+
+
+def test_lock_round_trips_and_rejects_unknown_versions(project):
+    lock = {"version": adhd_framework.LOCK_VERSION, "python": "3.11", "modules": [], "requirements": []}
+    adhd_framework.write_lock(lock)
+
+    assert adhd_framework.read_lock() == lock
+    assert adhd_framework.read_lock(Path("absent.lock")) is None
+
+    adhd_framework.LOCK_FILE.write_text(json.dumps(dict(lock, version=99)), encoding="utf-8")
+    with pytest.raises(ValueError, match="unsupported version"):
+        adhd_framework.read_lock()
+
+
+def test_fresh_clone_is_moved_to_the_locked_commit(cloned, project, tmp_path):
+    record, locked = cloned
+    lock, _ = adhd_framework.build_lock([record])
+    newer = push_new_commit(tmp_path, "alpha")
+    shutil.rmtree(project / "cores/alpha")
+    adhd_framework.clone_missing_modules({"cores/alpha": record.repo_url}, jobs=1, strategy="shallow")
+    assert git("rev-parse", "HEAD", cwd=project / "cores/alpha") == newer
+
+    # The shallow clone lacks the locked commit, so it has to be fetched first
+    assert adhd_framework.pin_modules_to_lock([Path("cores/alpha")], lock) == []
+    assert git("rev-parse", "HEAD", cwd=project / "cores/alpha") == locked
+
+
+def test_mirror_serves_clones_of_the_original_url(cloned, project, tmp_path):
+    record, commit = cloned
+    lock = {"version": adhd_framework.LOCK_VERSION, "python": "3.11", "requirements": [],
+            "modules": [{"path": "cores/alpha", "repo_url": record.repo_url, "commit": commit}]}
+    mirror = tmp_path / "mirror"
+
+    assert adhd_framework.build_mirror(lock, mirror) == []
+    assert adhd_framework.read_lock(mirror / "adhd.lock") == lock
+
+    # Take the original repo away: only the mirror can answer now
+    origin = Path(urlparse(record.repo_url).path)
+    origin.rename(origin.with_name("gone.git"))
+    assert adhd_framework.activate_mirror(mirror) == mirror.resolve()
+    assert os.environ["PIP_NO_INDEX"] == "1"
+    assert adhd_framework.active_lock() == lock
+
+    results = adhd_framework.clone_missing_modules({"cores/beta": record.repo_url}, jobs=1)
+    assert results[0].ok, results[0].error
+    assert git("rev-parse", "HEAD", cwd=project / "cores/beta") == commit
+
+
+def test_activate_mirror_needs_a_lock(tmp_path):
+    with pytest.raises(ValueError, match="not an ADHD mirror"):
+        adhd_framework.activate_mirror(tmp_path)
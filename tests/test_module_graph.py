@@ -0,0 +1,81 @@
+"""Module dependency graph: strongly connected components, order and impact queries."""
+
+import adhd_framework
+from conftest import module_record
+
+
+def graph_of(*specs) -> adhd_framework.ModuleGraph:
+    """specs are (name, [required names]) in discovery order."""
+    return adhd_framework.ModuleGraph([module_record(name, requires=deps) for name, deps in specs])
+
+
+def test_components_group_each_cycle():
+    graph = graph_of(
+        ("a", ["b"]), ("b", ["c"]), ("c", ["a"]),  # a -> b -> c -> a
+        ("d", ["a", "e"]), ("e", ["d"]),           # d <-> e, hanging off the first cycle
+        ("f", []),
+    )
+
+    component = graph.components()
+
+    assert component[0] == component[1] == component[2]
+    assert component[3] == component[4] != component[0]
+    assert len(set(component)) == 3
+    assert graph.cycles() == [["a", "b", "c"], ["d", "e"]]
+
+
+def test_acyclic_graph_has_singleton_components():
+    graph = graph_of(("app", ["lib"]), ("lib", []), ("tool", ["lib"]))
+
+    assert len(set(graph.components())) == 3
+    assert graph.cycles() == []
+
+
+def test_self_and_duplicate_requirements_are_ignored():
+    graph = adhd_framework.ModuleGraph([
+        module_record("solo", requires=["solo"]),
+        module_record("twice", requires=["solo", "solo"]),
+    ])
+
+    assert graph.deps == [[], [0]]
+    assert graph.cycles() == []
+
+
+def test_deep_chain_does_not_recurse():
+    n = 20000
+    graph = graph_of(*((f"m{i}", [f"m{i + 1}"] if i + 1 < n else []) for i in range(n)))
+
+    assert len(set(graph.components())) == n
+    assert graph.topological_order()[:2] == [f"m{n - 1}", f"m{n - 2}"]
+
+
+def test_order_puts_requirements_first_and_breaks_cycles_by_discovery_order():
+    graph = graph_of(("app", ["x"]), ("x", ["z"]), ("y", ["x"]), ("z", ["y"]), ("free", []))
+
+    order = graph.topological_order()
+
+    # x, y, z form a cycle: inside it discovery order decides, and app waits for all of it
+    assert order == ["x", "y", "z", "app", "free"]
+
+
+def test_requirements_match_urls_loosely_and_keep_unknown_ones():
+    records = [
+        module_record("lib")._replace(repo_url="git@github.com:Org/Lib.git"),
+        module_record("app")._replace(requirements=("https://github.com/org/lib/", "https://example.invalid/gone.git")),
+    ]
+
+    graph = adhd_framework.ModuleGraph(records)
+
+    assert graph.dependencies("app") == ["lib"]
+    assert graph.unresolved == {"app": ["https://example.invalid/gone.git"]}
+
+
+def test_impact_queries():
+    graph = graph_of(("core", []), ("api", ["core"]), ("ui", ["api"]), ("cli", ["core"]), ("docs", []))
+
+    assert graph.dependencies("ui", transitive=True) == ["core", "api"]
+    assert graph.dependents("core") == ["api", "cli"]
+    assert graph.dependents("core", transitive=True) == ["api", "ui", "cli"]
+    assert graph.affected(["api"]) == ["api", "ui"]
+    assert graph.id("plugins/ui") == graph.id("ui") == 2
+    assert graph.subgraph(["api"]).names == ["core", "api", "ui"]
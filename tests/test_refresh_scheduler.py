@@ -0,0 +1,178 @@
+"""Dependency-aware refresh scheduling (RefreshScheduler)."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import adhd_framework
+from conftest import module_record
+
+
+class Recorder:
+    """A refresh runner that logs start/finish order and fails the modules it is told to."""
+
+    def __init__(self, fail=(), delay: float = 0.0):
+        self.fail = set(fail)
+        self.delay = delay
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self.events.append(("start", record.name))
+        time.sleep(self.delay)
+        with self._lock:
+            self.events.append(("end", record.name))
+        ok = record.name not in self.fail
+        return adhd_framework.RefreshResult(record.name, ok, note="" if ok else "exit code 1")
+
+    def started(self):
+        return [name for event, name in self.events if event == "start"]
+
+    def before(self, first: str, then: str) -> bool:
+        return self.events.index(("end", first)) < self.events.index(("start", then))
+
+
+def test_requirements_finish_before_dependents_start():
+    records = [
+        module_record("app", requires=["api", "db"]),
+        module_record("api", requires=["db"]),
+        module_record("db"),
+        module_record("docs"),
+    ]
+    runner = Recorder(delay=0.01)
+
+    results = adhd_framework.RefreshScheduler(records, jobs=4, runner=runner).run()
+
+    assert sorted(r.name for r in results) == ["api", "app", "db", "docs"]
+    assert all(r.ok for r in results)
+    assert runner.before("db", "api")
+    assert runner.before("api", "app")
+    assert runner.before("db", "app")
+
+
+def test_independent_modules_run_concurrently():
+    records = [module_record(f"m{i}") for i in range(4)]
+    runner = Recorder(delay=0.05)
+
+    adhd_framework.RefreshScheduler(records, jobs=4, runner=runner).run()
+
+    # All four started before the first one finished
+    assert [event for event, _ in runner.events[:4]] == ["start"] * 4
+
+
+def test_single_worker_keeps_discovery_order_where_free():
+    records = [module_record("c"), module_record("a", requires=["b"]), module_record("b")]
+    runner = Recorder()
+
+    adhd_framework.RefreshScheduler(records, jobs=1, runner=runner).run()
+
+    assert runner.started() == ["c", "b", "a"]
+
+
+def test_failure_skips_dependents_and_blames_the_failed_module():
+    records = [
+        module_record("lib"),
+        module_record("mid", requires=["lib"], refresh=False),
+        module_record("top", requires=["mid"]),
+        module_record("other"),
+    ]
+    reported = []
+
+    results = adhd_framework.RefreshScheduler(records, jobs=2, runner=Recorder(fail=["lib"])).run(reported.append)
+
+    by_name = {r.name: r for r in results}
+    assert results == reported
+    # Scriptless 'mid' is an ordering point only and never reported
+    assert set(by_name) == {"lib", "top", "other"}
+    assert not by_name["lib"].ok and not by_name["lib"].skipped
+    assert by_name["top"].skipped and "lib" in by_name["top"].note
+    assert by_name["other"].ok
+
+
+def test_skip_listed_modules_are_ordering_points_only():
+    records = [module_record("base"), module_record("leaf", requires=["base"])]
+    runner = Recorder()
+
+    results = adhd_framework.RefreshScheduler(records, jobs=2, runner=runner, skip=["base"]).run()
+
+    assert [r.name for r in results] == ["leaf"]
+    assert runner.started() == ["leaf"]
+
+
+def test_requirement_cycle_runs_in_discovery_order():
+    records = [
+        module_record("x", requires=["z"]),
+        module_record("y", requires=["x"]),
+        module_record("z", requires=["y"]),
+        module_record("after", requires=["z"]),
+    ]
+    runner = Recorder()
+
+    results = adhd_framework.RefreshScheduler(records, jobs=3, runner=runner).run()
+
+    assert len(results) == 4
+    assert runner.started() == ["x", "y", "z", "after"]
+
+
+def test_runner_exception_is_reported_as_failure():
+    def explode(record):
+        raise RuntimeError("boom")
+
+    [result] = adhd_framework.RefreshScheduler([module_record("m")], jobs=1, runner=explode).run()
+
+    assert not result.ok and result.note == "boom"
+
+
+class FakeDiscovery:
+    """The parts of ModuleDiscovery controller_refresh_runner uses, with a scripted controller."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.scans = 0
+        self.ran = []
+        self.controller = SimpleNamespace(run_module_refresh_script=self._run)
+
+    def report(self):
+        self.scans += 1
+        return SimpleNamespace(modules=[SimpleNamespace(name=name) for name in self.outcomes])
+
+    def _run(self, module):
+        self.ran.append(module.name)
+        outcome = self.outcomes[module.name]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_controller_runner_scans_once_and_maps_failures():
+    discovery = FakeDiscovery({"ok": None, "false": False, "raises": RuntimeError("boom")})
+    records = [module_record("ok"), module_record("false", requires=["ok"]), module_record("raises")]
+
+    runner = adhd_framework.controller_refresh_runner(discovery)
+    assert discovery.scans == 0
+    results = {r.name: r for r in adhd_framework.RefreshScheduler(records, jobs=1, runner=runner).run()}
+
+    assert sorted(discovery.ran) == ["false", "ok", "raises"]
+    assert discovery.scans == 1
+    assert results["ok"].ok
+    assert not results["false"].ok and results["false"].note == "refresh script failed"
+    assert not results["raises"].ok and results["raises"].note == "boom"
+
+
+def test_failure_inside_a_cycle_skips_whatever_requires_another_member():
+    # x -> y -> z -> x; app requires only x, but waits for the whole cycle
+    records = [
+        module_record("x", requires=["y"]),
+        module_record("y", requires=["z"]),
+        module_record("z", requires=["x"]),
+        module_record("app", requires=["x"]),
+    ]
+    runner = Recorder(fail=["y"])
+
+    results = {r.name: r for r in adhd_framework.RefreshScheduler(records, jobs=2, runner=runner).run()}
+
+    assert runner.started() == ["x", "y"]
+    assert results["x"].ok and not results["y"].ok
+    assert results["z"].skipped and results["z"].note == "skipped, requires failed y"
+    assert results["app"].skipped and results["app"].note == "skipped, requires failed y"
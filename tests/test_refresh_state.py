@@ -0,0 +1,78 @@
+"""Incremental refresh fingerprints (RefreshState)."""
+
+import pytest
+
+import adhd_framework
+from conftest import module_record
+
+
+@pytest.fixture
+def modules(project):
+    """Two plain modules plus the two cross-module consumers, each with a refresh script."""
+    records = [
+        module_record("a"),
+        module_record("b"),
+        module_record("instruction_core", type_plural="cores"),
+        module_record("config_manager", type_plural="managers"),
+    ]
+    for record in records:
+        folder = project / record.path
+        folder.mkdir(parents=True)
+        (folder / "refresh.py").write_text("print('refreshed')\n", encoding="utf-8")
+        (folder / f"{record.name}.instructions.md").write_text("# notes\n", encoding="utf-8")
+        (folder / ".config_template").write_text("{}", encoding="utf-8")
+    return records
+
+
+def fresh_state(records):
+    state = adhd_framework.RefreshState()
+    state.set_project(records)
+    for record in records:
+        state.mark(record, {})
+    state.save()
+    return state
+
+
+def stale(state, records, project_records=None):
+    state.set_project(project_records or records)
+    return [r.name for r in records if not state.is_current(r, {})]
+
+
+def test_untouched_modules_stay_current(modules):
+    assert stale(fresh_state(modules), modules) == []
+
+
+def test_instructions_edit_reruns_the_module_and_its_collector_only(project, modules):
+    state = fresh_state(modules)
+    (project / "plugins/a/a.instructions.md").write_text("# notes, edited\n", encoding="utf-8")
+
+    assert stale(state, modules) == ["a", "instruction_core"]
+
+
+def test_template_edit_reruns_the_module_and_config_manager_only(project, modules):
+    state = fresh_state(modules)
+    (project / "plugins/b/.config_template").write_text('{"new": 1}', encoding="utf-8")
+
+    assert stale(state, modules) == ["b", "config_manager"]
+
+
+def test_module_set_change_reruns_both_collectors(project, modules):
+    state = fresh_state(modules)
+    (project / "plugins/c").mkdir()
+
+    assert stale(state, modules, modules + [module_record("c", refresh=False)]) == ["instruction_core", "config_manager"]
+
+
+def test_set_project_names_the_consumers_whose_inputs_changed(project, modules):
+    state = adhd_framework.RefreshState()
+    assert state.set_project(modules) == ["instruction_core", "config_manager"]
+    assert state.set_project(modules) == []
+
+    (project / "plugins/a/.config_template").write_text('{"k": 2}', encoding="utf-8")
+    assert state.set_project(modules) == ["config_manager"]
+
+
+def test_state_survives_a_reload(project, modules):
+    fresh_state(modules)
+
+    assert stale(adhd_framework.RefreshState(), modules) == []
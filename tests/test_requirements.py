@@ -0,0 +1,87 @@
+"""Merging requirements files into one batched pip resolve (MergedRequirements)."""
+
+import adhd_framework
+
+
+def merged_from(tmp_path, files: dict) -> adhd_framework.MergedRequirements:
+    merged = adhd_framework.MergedRequirements()
+    for rel, text in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    for rel in files:
+        if rel.endswith("requirements.txt"):
+            merged.add_file(tmp_path / rel, rel)
+    return merged
+
+
+def test_same_distribution_is_merged_across_files(tmp_path):
+    merged = merged_from(tmp_path, {
+        "requirements.txt": "PyYAML>=6\nrequests\n",
+        "cores/a/requirements.txt": "pyyaml<7  # comment\nrich[jupyter]\n",
+        "cores/b/requirements.txt": "Rich[markdown]>=13\n\n# only a comment\n",
+    })
+
+    assert sorted(merged.lines()) == ["PyYAML>=6,<7", "requests", "rich[jupyter,markdown]>=13"]
+    assert merged.conflicts() == []
+
+
+def test_conflicting_pins_name_their_sources(tmp_path):
+    merged = merged_from(tmp_path, {
+        "cores/a/requirements.txt": "six==1.16.0\n",
+        "cores/b/requirements.txt": "six==1.15.0\n",
+    })
+
+    [conflict] = merged.conflicts()
+    assert conflict.startswith("six: ")
+    assert "cores/a/requirements.txt wants ==1.16.0" in conflict
+    assert "cores/b/requirements.txt wants ==1.15.0" in conflict
+
+
+def test_markers_keep_separate_entries(tmp_path):
+    merged = merged_from(tmp_path, {
+        "requirements.txt": "colorama; sys_platform == 'win32'\ncolorama>=0.4\n",
+    })
+
+    assert sorted(merged.lines()) == ["colorama; sys_platform == 'win32'", "colorama>=0.4"]
+
+
+def test_nested_and_relative_paths_resolve_against_their_file(tmp_path):
+    module = tmp_path / "cores" / "a"
+    merged = merged_from(tmp_path, {
+        "cores/a/extra.txt": "attrs\n",
+        "cores/a/constraints.txt": "",
+        "cores/a/requirements.txt": (
+            "-r extra.txt\n"
+            "-c constraints.txt\n"
+            "-e ./vendored\n"
+            "--find-links=wheels\n"
+            "./local_pkg\n"
+            "pkg @ file:dist/pkg.whl\n"
+            "-e git+https://example.invalid/repo.git#egg=repo\n"
+        ),
+    })
+
+    lines = merged.lines()
+    assert "attrs" in lines
+    assert f"-c {(module / 'constraints.txt').resolve()}" in lines
+    assert f"-e {(module / 'vendored').resolve()}" in lines
+    assert f"--find-links={(module / 'wheels').resolve()}" in lines
+    assert str((module / "local_pkg").resolve()) in lines
+    assert f"pkg @ {(module / 'dist/pkg.whl').resolve().as_uri()}" in lines
+    assert "-e git+https://example.invalid/repo.git#egg=repo" in lines
+
+
+def test_index_lines_leave_out_direct_references(tmp_path):
+    merged = merged_from(tmp_path, {
+        "requirements.txt": "--extra-index-url https://example.invalid/simple\nsix\n-e /abs/pkg\npkg @ https://example.invalid/pkg.whl\n",
+    })
+
+    assert merged.index_lines() == ["--extra-index-url https://example.invalid/simple", "six"]
+    assert set(merged.direct_references()) == {"-e /abs/pkg", "pkg @ https://example.invalid/pkg.whl"}
+    assert len(merged) == 4
+
+
+def test_absolutize_leaves_absolute_and_remote_values_alone(tmp_path):
+    for line in ("-e /abs/pkg", "-f https://example.invalid/wheels", "six>=1", "-c /abs/constraints.txt"):
+        assert adhd_framework.absolutize_requirement_line(line, tmp_path) == line
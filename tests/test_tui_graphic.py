@@ -0,0 +1,258 @@
+"""Terminal tables: display widths, fitting text to a width, rendering (project.tui_graphic)."""
+
+import io
+
+import pytest
+
+wcwidth = pytest.importorskip("wcwidth")
+
+from project.tui_graphic import (  # noqa: E402
+    TableColumn, TableFormatter, TableRow, _display_width, _prefix_widths, _sequence_width,
+)
+
+SEQUENCES = [
+    "👨‍👩‍👧",  # family: emoji joined by ZWJ
+    "🏳️‍🌈",          # flag: VS16 and ZWJ
+    "❤️",                   # VS16 widens a narrow symbol
+    "a#️b",                  # keycap base with VS16
+    "☺️ ok",
+    "日本❤️語",
+    "x‍y",             # ZWJ between letters
+    "️",               # VS16 with nothing before it
+]
+
+
+def test_ascii_is_one_cell_per_character():
+    assert _display_width("hello, world") == 12
+    assert _display_width("") == 0
+    assert _prefix_widths("abc") == ([0, 1, 2, 3], True)
+
+
+def test_cjk_is_two_cells_per_character():
+    assert _display_width("日本語") == 6
+    assert _display_width("a日b") == 4
+    assert _prefix_widths("a日b") == ([0, 1, 3, 4], True)
+
+
+@pytest.mark.parametrize("text", SEQUENCES)
+def test_joiner_and_variation_sequences_match_wcswidth(text):
+    assert _sequence_width(text) == wcwidth.wcswidth(text)
+    assert _display_width(text) == wcwidth.wcswidth(text)
+    # Prefix sums cannot see sequences, and say so
+    assert _prefix_widths(text)[1] is False
+
+
+def test_control_characters_fall_back_to_length():
+    assert _display_width("a\x07b") == 3
+    assert _display_width("日\x07") == 2
+    assert _prefix_widths("日\x07") == ([0, 2, 3], False)
+
+
+@pytest.mark.parametrize("text, width, expected", [
+    ("abcdefgh", 5, "abcd…"),
+    ("abc", 5, "abc"),
+    ("日本語テキスト", 6, "日本…"),   # 5 cells: a third wide character would not fit
+    ("日本語テキスト", 7, "日本語…"),
+    ("a日本", 3, "a…"),
+])
+def test_truncation_appends_the_ellipsis_within_the_width(text, width, expected):
+    fitted, fitted_width = TableFormatter()._truncate_to_width(text, width)
+
+    assert fitted == expected
+    assert fitted_width == _display_width(fitted) <= width
+
+
+def test_truncation_without_room_for_the_ellipsis_cuts_hard():
+    table = TableFormatter(ellipsis="...")
+
+    assert table._truncate_to_width("abcdef", 2) == ("ab", 2)
+    assert table._truncate_to_width("日本語", 3) == ("日", 2)
+
+
+@pytest.mark.parametrize("text", ["👨‍👩‍👧 family portrait", "日本❤️語のテキスト"])
+def test_truncated_sequences_report_their_real_width(text):
+    fitted, fitted_width = TableFormatter()._truncate_to_width(text, 6)
+
+    assert fitted.endswith("…")
+    assert fitted_width == wcwidth.wcswidth(fitted) <= 6
+
+
+def test_wrapping_never_splits_a_wide_character():
+    lines = TableFormatter()._wrap_to_width("日本語テキスト", 5)
+
+    assert lines == [("日本", 4), ("語テ", 4), ("キス", 4), ("ト", 2)]
+
+
+def test_wrapping_mixed_text_fills_each_line():
+    lines = TableFormatter()._wrap_to_width("ab日本cd語", 4)
+
+    assert lines == [("ab日", 4), ("本cd", 4), ("語", 2)]
+    assert "".join(seg for seg, _ in lines) == "ab日本cd語"
+
+
+def test_wide_character_wider_than_the_line_gets_a_line_of_its_own():
+    assert TableFormatter()._wrap_to_width("日本", 1) == [("日", 2), ("本", 2)]
+
+
+def test_ascii_wrapping():
+    assert TableFormatter()._wrap_to_width("abcdefg", 3) == [("abc", 3), ("def", 3), ("g", 1)]
+    assert TableFormatter()._wrap_to_width("", 3) == [("", 0)]
+
+
+@pytest.mark.parametrize("text, width", [("❤️❤️❤️ab", 3), ("👨‍👩‍👧 family", 3), ("日本❤️語のテキスト", 5)])
+def test_wrapping_keeps_sequences_whole_and_within_the_width(text, width):
+    lines = TableFormatter()._wrap_to_width(text, width)
+
+    assert "".join(seg for seg, _ in lines) == text
+    for seg, seg_width in lines:
+        assert seg_width == wcwidth.wcswidth(seg) <= width
+        assert not seg.startswith(("‍", "️")) and not seg.endswith("‍")
+
+
+def test_a_joined_family_wraps_as_one_character():
+    assert TableFormatter()._wrap_to_width("👨‍👩‍👧 family", 3)[0] == ("👨‍👩‍👧 ", 3)
+
+
+def table_with_rows(fit_mode="truncate", columns=None):
+    table = TableFormatter(table_width=40, fit_mode=fit_mode)
+    table.set_title("Modules 📦")
+    if columns:
+        table.set_columns(columns)
+        for name, kind in [("config_manager", "MANAGER"), ("日本語のモジュール名前", "PLUGIN"), ("👨‍👩‍👧", "CORE")]:
+            table.add_row(TableRow(cells=[name, kind]))
+    else:
+        for text in ["plain row", "日本語のテキスト" * 3, "❤️ " * 20]:
+            table.add_row(TableRow(text))
+    return table
+
+
+def streamed(table) -> str:
+    out = io.StringIO()
+    table.stream(out).close()
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("fit_mode", ["truncate", "wrap"])
+def test_render_matches_the_stream_byte_for_byte(fit_mode):
+    table = table_with_rows(fit_mode)
+
+    assert (table.render() + "\n").encode() == streamed(table).encode()
+    assert list(table.iter_lines()) == table.render().split("\n")
+
+
+def test_column_render_matches_the_stream_when_the_last_column_takes_the_spare_width():
+    # A left-aligned last column: the stream's spare width lands where render() pads anyway
+    table = table_with_rows(columns=[TableColumn("Module", min_width=6, max_width=12), TableColumn("Type")])
+
+    assert (table.render() + "\n").encode() == streamed(table).encode()
+
+
+def test_render_is_cached_until_the_table_changes():
+    table = table_with_rows()
+    first = table.render()
+    assert table.render() is first
+
+    table.add_row(TableRow("added"))
+    assert "added" in table.render() and table.render() is not first
+
+    second = table.render()
+    table.set_title("Renamed")
+    assert "Renamed" in table.render() and "Modules" not in table.render()
+
+    third = table.render()
+    table.set_columns([TableColumn("Only")])
+    assert table.render() is not third and "Only" in table.render()
+
+
+def test_column_widths_are_resolved_after_rows_change():
+    table = TableFormatter(table_width=60)
+    table.set_columns([TableColumn("Name"), TableColumn("Type")])
+    table.add_row(TableRow(cells=["short", "CORE"]))
+    before = table.render()
+
+    table.add_row(TableRow(cells=["a_much_longer_module_name", "PLUGIN"]))
+    after = table.render()
+
+    assert before != after
+    assert "│a_much_longer_module_name  PLUGIN" in after
+    assert "│short                      CORE" in after
+
+
+def test_in_place_row_edits_need_invalidate():
+    table = table_with_rows()
+    row = TableRow("before")
+    table.add_row(row)
+    table.render()
+
+    row.row = "after"
+    assert "after" not in table.render()
+    table.invalidate()
+    assert "after" in table.render()
+
+
+def solve(columns, rows=(), table_width=100, **kwargs):
+    table = TableFormatter(table_width=table_width)
+    table.set_columns(columns)
+    return table._solve_widths([TableRow(cells=cells) for cells in rows], **kwargs)
+
+
+def test_columns_take_their_widest_cell_clamped_to_min_and_max():
+    columns = [TableColumn("A", min_width=6), TableColumn("B", max_width=5), TableColumn("Header")]
+
+    assert solve(columns, [["ab", "abcdefghij", "x"], ["abc", "ab", "日本"]]) == [6, 5, 6]
+
+
+def test_overflow_lowers_a_common_ceiling_above_the_minimums():
+    # 28 inner cells less one separator of 2: 26 for the two columns
+    columns = [TableColumn(min_width=4), TableColumn(min_width=4)]
+
+    assert solve(columns, [["x" * 20, "y" * 20]], table_width=30) == [13, 13]
+    assert solve(columns, [["x" * 5, "y" * 40]], table_width=30) == [5, 21]
+
+
+def test_overflow_never_shrinks_a_column_below_its_minimum_when_they_fit():
+    columns = [TableColumn(min_width=16), TableColumn(min_width=2)]
+
+    assert solve(columns, [["x" * 30, "y" * 30]], table_width=30) == [16, 10]
+
+
+def test_table_narrower_than_the_minimums_shares_the_loss():
+    # 18 inner cells less two separators: 14 for three columns that want 8 each
+    widths = solve([TableColumn(min_width=8) for _ in range(3)], [["x" * 10] * 3], table_width=20)
+
+    assert sum(widths) == 14
+    assert max(widths) - min(widths) <= 1
+
+
+def test_separators_wider_than_the_table_leave_no_width_and_lines_stay_inside():
+    table = TableFormatter(table_width=20)
+    table.set_columns([TableColumn(min_width=8) for _ in range(12)])
+    table.add_row(TableRow(cells=["abc"] * 12))
+
+    assert table._solve_widths(table._rows) == [0] * 12
+    assert all(_display_width(line) <= 20 for line in table.iter_lines())
+
+
+def test_empty_columns_keep_their_minimum_width():
+    columns = [TableColumn(min_width=3), TableColumn("", min_width=1), TableColumn("C")]
+
+    # Short rows and full-width rows (no cells) add nothing
+    assert solve(columns, [["", ""], ["a"], None]) == [3, 1, 1]
+
+
+def test_no_columns_solve_to_nothing():
+    assert solve([], [["ignored"]]) == []
+    assert solve([], fill=True, unseen=True) == []
+
+
+def test_fill_gives_the_spare_width_to_the_last_flexible_column():
+    columns = [TableColumn("A"), TableColumn("B"), TableColumn("C", max_width=4)]
+
+    # 38 inner cells less two separators: 34
+    assert solve(columns, [["aa", "bb", "cc"]], table_width=40, fill=True) == [2, 30, 2]
+
+
+def test_fresh_stream_columns_start_at_max_width_and_share_the_spare():
+    columns = [TableColumn("A", max_width=6), TableColumn("B"), TableColumn("C")]
+
+    assert solve(columns, table_width=40, fill=True, unseen=True) == [6, 14, 14]
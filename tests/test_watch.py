@@ -0,0 +1,118 @@
+"""Watch mode: which refresh scripts one debounced batch of edits reruns (ModuleWatcher.handle)."""
+
+import logging
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import adhd_framework
+from conftest import module_record
+
+
+class ScriptController:
+    """Stands in for ModulesController: runs a module's refresh.py from the project root."""
+
+    def run_module_refresh_script(self, module):
+        subprocess.run([sys.executable, os.path.join(module.path, "refresh.py")], check=True)
+
+
+class StaticDiscovery:
+    """Discovery over fixed in-memory records, in place of the ModulesController scan."""
+
+    def __init__(self, records):
+        self._records = records
+        self.controller = ScriptController()
+
+    def report(self):
+        return SimpleNamespace(modules=[SimpleNamespace(name=r.name, path=r.path) for r in self._records])
+
+    def records(self):
+        return self._records
+
+    def invalidate(self):
+        pass
+
+    def graph(self):
+        return adhd_framework.ModuleGraph(self._records)
+
+
+@pytest.fixture
+def watcher(project):
+    records = [
+        module_record("a"),
+        module_record("b"),
+        module_record("instruction_core", type_plural="cores"),
+        module_record("config_manager", type_plural="managers"),
+    ]
+    for record in records:
+        folder = project / record.path
+        folder.mkdir(parents=True)
+        # Each script logs its own name to a file outside every module folder
+        (folder / "refresh.py").write_text(
+            f"with open('ran.txt', 'a') as f:\n    f.write('{record.name}\\n')\n", encoding="utf-8")
+        (folder / f"{record.name}.instructions.md").write_text("# notes\n", encoding="utf-8")
+        (folder / ".config_template").write_text("{}", encoding="utf-8")
+    merged = []
+    framework = SimpleNamespace(logger=logging.getLogger("test_watch"), discovery=StaticDiscovery(records),
+                                _merge_config_templates=merged.append)
+    watcher = adhd_framework.ModuleWatcher(framework, poll=True)
+    watcher.handle({f"{record.path}/refresh.py" for record in records})
+    watcher.merged = merged
+    return watcher
+
+
+def ran(project):
+    path = project / "ran.txt"
+    names = path.read_text(encoding="utf-8").split() if path.exists() else []
+    path.unlink(missing_ok=True)
+    return sorted(names)
+
+
+def test_first_batch_runs_every_script_once(project, watcher):
+    assert ran(project) == ["a", "b", "config_manager", "instruction_core"]
+
+    watcher.handle({"plugins/a/refresh.py"})
+
+    assert ran(project) == []
+
+
+def test_plain_edit_reruns_only_that_module(project, watcher):
+    ran(project)
+    (project / "plugins/b/data.txt").write_text("new\n", encoding="utf-8")
+
+    watcher.handle({"plugins/b/data.txt"})
+
+    assert ran(project) == ["b"]
+
+
+def test_instructions_edit_also_reruns_instruction_core(project, watcher):
+    ran(project)
+    (project / "plugins/a/a.instructions.md").write_text("# notes, edited\n", encoding="utf-8")
+
+    watcher.handle({"plugins/a/a.instructions.md"})
+
+    assert ran(project) == ["a", "instruction_core"]
+
+
+def test_template_edit_is_merged_and_reruns_config_manager(project, watcher):
+    ran(project)
+    (project / "plugins/b/.config_template").write_text('{"k": 1}', encoding="utf-8")
+
+    watcher.handle({"plugins/b/.config_template"})
+
+    assert ran(project) == ["b", "config_manager"]
+    assert len(watcher.merged) == 1
+
+
+def test_only_candidates_are_fingerprinted(project, watcher, monkeypatch):
+    checked = []
+    is_current = watcher.state.is_current
+    monkeypatch.setattr(watcher.state, "is_current", lambda record, config: checked.append(record.name) or is_current(record, config))
+    (project / "plugins/a/a.instructions.md").write_text("# notes, edited\n", encoding="utf-8")
+
+    watcher.handle({"plugins/a/a.instructions.md"})
+
+    assert sorted(checked) == ["a", "instruction_core"]
@@ -0,0 +1,139 @@
+"""Workspace regeneration through the controller, only when the module folders change (sync_workspace_file)."""
+
+import json
+import os
+
+import pytest
+
+import adhd_framework
+from conftest import module_record
+
+
+def generator(project, folders, settings=None, name="project.code-workspace"):
+    """Stand-in for the controller's generate_workspace_file: writes in place, returns the path."""
+    calls = []
+
+    def generate():
+        calls.append(name)
+        data = {"folders": [{"path": folder} for folder in folders], "settings": settings or {}}
+        (project / name).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return name
+
+    generate.calls = calls
+    return generate
+
+
+def write_workspace(project, folders, name="project.code-workspace"):
+    path = project / name
+    path.write_text(json.dumps({"folders": [{"path": f} for f in folders], "settings": {}}, indent=4), encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return path
+
+
+def test_first_generation_adds_every_folder(project):
+    update = adhd_framework.sync_workspace_file(generator(project, [".", "managers/config_manager"]))
+
+    assert update.written
+    assert update.added == [".", "managers/config_manager"]
+    assert update.removed == []
+    assert (project / "project.code-workspace").exists()
+
+
+def test_unchanged_workspace_is_never_written(project):
+    existing = write_workspace(project, [".", "managers/config_manager"])
+    before = existing.read_bytes(), existing.stat().st_ino
+    # The controller would write absolute paths for the same folders
+    generate = generator(project, [".", str(project / "managers" / "config_manager")])
+    planned = {"managers/config_manager": True, "cores/hidden_core": False}
+
+    update = adhd_framework.sync_workspace_file(generate, existing, planned)
+
+    assert not update.written
+    assert generate.calls == []
+    assert (existing.read_bytes(), existing.stat().st_ino) == before
+    assert existing.stat().st_mtime_ns == 1_000_000_000
+    assert sorted(p.name for p in project.iterdir()) == ["project.code-workspace"]
+
+
+def test_absolute_entries_match_planned_relative_paths(project):
+    existing = write_workspace(project, [".", str(project / "managers/config_manager")])
+    generate = generator(project, [])
+
+    update = adhd_framework.sync_workspace_file(generate, existing, {"managers/config_manager": True})
+
+    assert not update.written and generate.calls == []
+
+
+def test_folders_that_are_not_modules_do_not_count(project):
+    existing = write_workspace(project, [".", "docs", "managers/config_manager"])
+    generate = generator(project, [])
+
+    update = adhd_framework.sync_workspace_file(generate, existing, {"managers/config_manager": True})
+
+    assert not update.written and generate.calls == []
+
+
+def test_changed_workspace_is_generated_once_and_diffed(project):
+    existing = write_workspace(project, [".", "managers/config_manager", "utils/logger_util"])
+    generate = generator(project, [".", str(project / "managers/config_manager"), "plugins/new_plugin"])
+    planned = {"managers/config_manager": True, "utils/logger_util": False, "plugins/new_plugin": True}
+
+    update = adhd_framework.sync_workspace_file(generate, existing, planned)
+
+    assert update.written
+    assert len(generate.calls) == 1
+    assert update.added == ["plugins/new_plugin"]
+    assert update.removed == ["utils/logger_util"]
+    folders = [f["path"] for f in json.loads(existing.read_text())["folders"]]
+    assert folders == [".", str(project / "managers/config_manager"), "plugins/new_plugin"]
+    assert sorted(p.name for p in project.iterdir()) == ["project.code-workspace"]
+
+
+def test_unparsable_workspace_is_regenerated(project):
+    existing = project / "project.code-workspace"
+    existing.write_text("{ // hand-edited, not plain JSON\n", encoding="utf-8")
+
+    update = adhd_framework.sync_workspace_file(generator(project, [".", "cores/x"]), existing, {"cores/x": True})
+
+    assert update.written and update.added == [".", "cores/x"]
+    assert json.loads(existing.read_text())["folders"] == [{"path": "."}, {"path": "cores/x"}]
+
+
+def test_failed_generation_leaves_no_stray_files(project):
+    existing = write_workspace(project, [".", "cores/x"])
+
+    def broken():
+        raise RuntimeError("controller failed")
+
+    with pytest.raises(RuntimeError):
+        adhd_framework.sync_workspace_file(broken, existing, {"cores/x": False})
+    assert sorted(p.name for p in project.iterdir()) == ["project.code-workspace"]
+
+
+def test_planned_folders_follow_mode_and_overrides():
+    records = [
+        module_record("shown"),
+        module_record("hidden")._replace(shows_in_workspace=False),
+        module_record("core", type_plural="cores"),
+    ]
+
+    assert adhd_framework.planned_workspace_folders(records) == {
+        "plugins/shown": True, "plugins/hidden": False, "cores/core": False}
+    assert adhd_framework.planned_workspace_folders(records, "ignore_overrides")["plugins/hidden"] is True
+    assert adhd_framework.planned_workspace_folders(records, "all", {"core": False})["cores/core"] is False
+
+
+def test_folder_paths_compare_relative_to_the_workspace(tmp_path):
+    root = tmp_path.resolve()
+
+    assert adhd_framework._workspace_folder_path(str(root / "cores" / "x"), root) == "cores/x"
+    assert adhd_framework._workspace_folder_path(str(root), root) == "."
+    assert adhd_framework._workspace_folder_path("./cores//x/", root) == "cores/x"
+    assert adhd_framework._workspace_folder_path("/elsewhere/y", root) == "/elsewhere/y"
+
+
+def test_folder_paths_resolve_symlinks(tmp_path):
+    (tmp_path / "real" / "cores" / "x").mkdir(parents=True)
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+
+    assert adhd_framework._workspace_folder_path(str(tmp_path / "link" / "cores" / "x"), (tmp_path / "real").resolve()) == "cores/x"